@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark EDI._read_spectra against the per-frequency loop it replaced.
+
+The reference builds the cross power matrix, inverts and multiplies the
+cross spectra matrices one frequency at a time.  ``_read_spectra`` builds an
+(n_frequency, n_channel, n_channel) cross power cube and uses batched
+``inv``/``matmul`` over the stack.  Both must give identical arrays.
+
+Run with ``python examples/benchmarks/benchmark_edi_spectra.py``.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import time
+
+import numpy as np
+
+from mt_metadata.transfer_functions.io.edi import EDI
+from mt_metadata.transfer_functions.io.tools import (
+    _validate_str_with_equals,
+    index_locator,
+)
+
+# =============================================================================
+
+
+COMPONENTS = ["hx", "hy", "hz", "ex", "ey", "rhx", "rhy"]
+
+
+def reference_read_spectra(
+    edi,
+    data_lines: list[str],
+    comp_list: list[str] = COMPONENTS,
+) -> None:
+    """Original per-frequency implementation of EDI._read_spectra."""
+
+    data_dict = {}
+    avgt_dict = {}
+    data_find = False
+    for line in data_lines:
+        if line.lower().find(">spectra") == 0 and line.find("!") == -1:
+            line_list = _validate_str_with_equals(line)
+            data_find = True
+
+            # frequency will be the key
+            try:
+                key = float(
+                    [
+                        ss.split("=")[1]
+                        for ss in line_list
+                        if ss.lower().find("freq") == 0
+                    ][0]
+                )
+                data_dict[key] = []
+                avgt = float(
+                    [
+                        ss.split("=")[1]
+                        for ss in line_list
+                        if ss.lower().find("avgt") == 0
+                    ][0]
+                )
+                avgt_dict[key] = avgt
+            except ValueError:
+                edi.logger.debug("did not find frequency key")
+        elif data_find and line.find(">") == -1 and line.find("!") == -1:
+            data_dict[key] += [float(ll) for ll in line.strip().split()]
+        elif line.find(">spectra") == -1:
+            data_find = False
+    # get an object that contains the indices for each component
+    cc = index_locator(comp_list)
+
+    edi.frequency = np.array(sorted(list(data_dict.keys()), reverse=True))
+
+    edi.z = np.zeros((edi.frequency.size, 2, 2), dtype=complex)
+    edi.t = np.zeros((edi.frequency.size, 1, 2), dtype=complex)
+
+    edi.z_err = np.zeros_like(edi.z, dtype=float)
+    edi.t_err = np.zeros_like(edi.t, dtype=float)
+
+    edi.residual_covariance = np.zeros(
+        (edi.frequency.size, cc.n_outputs, cc.n_outputs), dtype=complex
+    )
+    edi.signal_inverse_power = np.zeros(
+        (edi.frequency.size, cc.n_inputs, cc.n_inputs), dtype=complex
+    )
+
+    edi.tf = np.zeros(
+        (edi.frequency.size, cc.n_outputs, cc.n_inputs), dtype=complex
+    )
+    edi.tf_err = np.zeros_like(edi.tf, dtype=float)
+
+    for kk, key in enumerate(edi.frequency):
+        # read in spectra  as an (n_channel x n_channel) array
+        spectra_arr = np.reshape(
+            np.array(data_dict[key]), (len(comp_list), len(comp_list))
+        )
+
+        # compute cross powers
+        s_arr = np.zeros_like(spectra_arr, dtype=complex)
+        for ii in range(s_arr.shape[0]):
+            for jj in range(ii, s_arr.shape[0]):
+                if ii == jj:
+                    s_arr[ii, jj] = spectra_arr[ii, jj]
+                else:
+                    # minus sign for complex conjugation
+                    # original spectra data are of form <A,B*>, but we need
+                    # the order <B,A*>...
+                    # this is achieved by complex conjugation of the
+                    # original entries
+                    s_arr[ii, jj] = complex(
+                        spectra_arr[jj, ii], -spectra_arr[ii, jj]
+                    )
+                    # keep complex conjugated entries in the lower
+                    # triangular matrix:
+                    s_arr[jj, ii] = complex(
+                        spectra_arr[jj, ii], spectra_arr[ii, jj]
+                    )
+        # check for empty values
+        s_arr[s_arr == 0] = np.nan
+        s_arr[s_arr == edi.Header.empty] = np.nan
+
+        # from A. Kelbert's EMTF
+        # cross spectra matrices
+
+        # Note we changed the indices to [ex, ey, hz] from [hz, ex, ey]
+        # input channels
+        rh = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
+        rr = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
+        hh = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
+
+        # output channels
+        re = np.zeros((cc.n_inputs, cc.n_outputs), dtype=complex)
+        he = np.zeros((cc.n_inputs, cc.n_outputs), dtype=complex)
+        ee = np.zeros((cc.n_outputs, cc.n_outputs), dtype=complex)
+
+        # fill in cross powers for input channels
+        rh[0, 0] = s_arr[cc.rhx, cc.hx]
+        rh[0, 1] = s_arr[cc.rhx, cc.hy]
+        rh[1, 0] = s_arr[cc.rhy, cc.hx]
+        rh[1, 1] = s_arr[cc.rhy, cc.hy]
+
+        rr[0, 0] = s_arr[cc.rhx, cc.rhx]
+        rr[0, 1] = s_arr[cc.rhx, cc.rhy]
+        rr[1, 0] = s_arr[cc.rhy, cc.rhx]
+        rr[1, 1] = s_arr[cc.rhy, cc.rhy]
+
+        hh[0, 0] = s_arr[cc.hx, cc.hx]
+        hh[0, 1] = s_arr[cc.hx, cc.hy]
+        hh[1, 0] = s_arr[cc.hy, cc.hx]
+        hh[1, 1] = s_arr[cc.hy, cc.hy]
+
+        # fill in cross powers for output channels
+        if cc.has_tipper and cc.has_electric:
+            re[0, 2] = s_arr[cc.rhx, cc.hz]
+            re[0, 0] = s_arr[cc.rhx, cc.ex]
+            re[0, 1] = s_arr[cc.rhx, cc.ey]
+            re[1, 2] = s_arr[cc.rhy, cc.hz]
+            re[1, 0] = s_arr[cc.rhy, cc.ex]
+            re[1, 1] = s_arr[cc.rhy, cc.ey]
+
+            he[0, 2] = s_arr[cc.hx, cc.hz]
+            he[0, 0] = s_arr[cc.hx, cc.ex]
+            he[0, 1] = s_arr[cc.hx, cc.ey]
+            he[1, 2] = s_arr[cc.hy, cc.hz]
+            he[1, 0] = s_arr[cc.hy, cc.ex]
+            he[1, 1] = s_arr[cc.hy, cc.ey]
+
+            ee[2, 2] = s_arr[cc.hz, cc.hz]
+            ee[2, 0] = s_arr[cc.hz, cc.ex]
+            ee[2, 1] = s_arr[cc.hz, cc.ey]
+            ee[0, 2] = s_arr[cc.ex, cc.hz]
+            ee[0, 0] = s_arr[cc.ex, cc.ex]
+            ee[0, 1] = s_arr[cc.ex, cc.ey]
+            ee[1, 2] = s_arr[cc.ey, cc.hz]
+            ee[1, 0] = s_arr[cc.ey, cc.ex]
+            ee[1, 1] = s_arr[cc.ey, cc.ey]
+        elif not cc.has_tipper and cc.has_electric:
+            re[0, 0] = s_arr[cc.rhx, cc.ex]
+            re[0, 1] = s_arr[cc.rhx, cc.ey]
+            re[1, 0] = s_arr[cc.rhy, cc.ex]
+            re[1, 0] = s_arr[cc.rhy, cc.ey]
+
+            he[0, 0] = s_arr[cc.hx, cc.ex]
+            he[0, 1] = s_arr[cc.hx, cc.ey]
+            he[0, 1] = s_arr[cc.hy, cc.ex]
+            he[1, 1] = s_arr[cc.hy, cc.ey]
+
+            ee[0, 0] = s_arr[cc.ex, cc.ex]
+            ee[0, 1] = s_arr[cc.ex, cc.ey]
+            ee[1, 0] = s_arr[cc.ey, cc.ex]
+            ee[1, 1] = s_arr[cc.ey, cc.ey]
+        elif cc.has_tipper and not cc.has_electric:
+            re[0, 0] = s_arr[cc.rhx, cc.hz]
+            re[1, 0] = s_arr[cc.rhy, cc.hz]
+
+            he[0, 0] = s_arr[cc.hx, cc.hz]
+            he[1, 0] = s_arr[cc.hy, cc.hz]
+
+            ee[0, 0] = s_arr[cc.hz, cc.hz]
+        # check to make sure the values are legit for accurate results
+        if abs(np.linalg.det(rh)) < np.finfo(float).eps:
+            edi.logger.warning(
+                "spectral matrix determinant is too small "
+                f"{abs(np.linalg.det(rh))} for period {key}. "
+                "Results may be inaccurate"
+            )
+        tfh = np.matmul(np.linalg.inv(rh), re)
+        tf = tfh.conj().T
+
+        sig = np.matmul(
+            np.linalg.inv(rh), np.matmul(rr, np.linalg.inv(rh.conj().T))
+        )
+        res = (
+            ee
+            - np.matmul(tf, he)
+            - np.matmul(he.conj().T, tfh)
+            + np.matmul(tf, np.matmul(hh, tfh))
+        ) / avgt_dict[key]
+
+        # variance = abs(np.dot(res[0 : cc.n_inputs, :].T, sig))
+        variance = np.zeros((cc.n_outputs, cc.n_inputs), dtype=complex)
+        for nn in range(cc.n_outputs):
+            for mm in range(cc.n_inputs):
+                variance[nn, mm] = res[nn, nn] * sig[mm, mm]
+
+        tf_err = np.sqrt(np.abs(variance))
+        edi.tf[kk, :, :] = tf
+        edi.tf_err[kk, :, :] = np.sqrt(np.abs(variance))
+        edi.signal_inverse_power[kk, :, :] = sig
+        edi.residual_covariance[kk, :, :] = res
+
+        if cc.has_tipper and cc.has_electric:
+            edi.z[kk, :, :] = tf[0:2, :]
+            edi.z_err[kk, :, :] = tf_err[0:2, :]
+            edi.t[kk, :, :] = tf[2, :]
+            edi.t_err[kk, :, :] = tf_err[2, :]
+            edi.z_err[np.where(np.nan_to_num(edi.z_err) == 0.0)] = 1.0
+            edi.t_err[np.nan_to_num(edi.t_err) == 0.0] = 1.0
+        elif not cc.has_tipper and cc.has_electric:
+            edi.z[kk, :, :] = tf[:, :]
+            edi.z_err[kk, :, :] = tf_err[:, :]
+            edi.z_err[np.where(np.nan_to_num(edi.z_err) == 0.0)] = 1.0
+        elif cc.has_tipper and not cc.has_electric:
+            edi.t[kk, :, :] = tf[:, :]
+            edi.t_err[kk, :, :] = tf_err[:, :]
+            edi.t_err[np.nan_to_num(edi.t_err) == 0.0] = 1.0
+
+
+def make_spectra_lines(n_frequencies=500, comp_list=COMPONENTS, seed=0):
+    """Data section lines of a spectra EDI with n_frequencies frequencies."""
+    rng = np.random.default_rng(seed)
+    n_channels = len(comp_list)
+    lines = []
+    for frequency in np.logspace(-4, 4, n_frequencies):
+        lines.append(
+            f">SPECTRA  FREQ={frequency:.6e} ROTSPEC=0 AVGT={rng.integers(10, 1000)} "
+            f"// {n_channels ** 2}\n"
+        )
+        spectra = rng.normal(size=(n_channels, n_channels))
+        spectra[np.diag_indices(n_channels)] = np.abs(spectra.diagonal()) + 1
+        values = spectra.ravel()
+        for ii in range(0, values.size, 6):
+            lines.append(" ".join(f"{v:.6e}" for v in values[ii : ii + 6]) + "\n")
+    return lines
+
+
+def best_of(function, lines, repeat=3):
+    times = []
+    for _ in range(repeat):
+        edi = EDI()
+        start = time.perf_counter()
+        function(edi, lines, comp_list=COMPONENTS)
+        times.append(time.perf_counter() - start)
+    return min(times), edi
+
+
+if __name__ == "__main__":
+    attributes = [
+        "frequency",
+        "z",
+        "z_err",
+        "t",
+        "t_err",
+        "tf",
+        "tf_err",
+        "signal_inverse_power",
+        "residual_covariance",
+    ]
+    for n_frequencies in [50, 500, 2000]:
+        lines = make_spectra_lines(n_frequencies)
+        t_reference, edi_reference = best_of(reference_read_spectra, lines)
+        t_batched, edi_batched = best_of(EDI._read_spectra, lines)
+        for attr in attributes:
+            assert np.array_equal(
+                getattr(edi_reference, attr),
+                getattr(edi_batched, attr),
+                equal_nan=True,
+            ), attr
+        print(
+            f"_read_spectra with {n_frequencies} frequencies, "
+            f"{len(COMPONENTS)} channels: reference {t_reference:.3f} s, "
+            f"batched {t_batched:.3f} s, speed up {t_reference / t_batched:.1f}x"
+        )
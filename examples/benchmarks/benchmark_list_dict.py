@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark positional and key access of a ListDict holding a 5,000 station
+survey against scanning the keys, which is how ListDict used to find
+positions.
+
+The scan walks the keys with ``enumerate`` until it finds the position or
+key.  ListDict keeps a key list and a key -> position dictionary, so
+integer indexing, ``index`` and slicing do not depend on the position of
+the station.  Both must give the same stations.
+
+Run with ``python examples/benchmarks/benchmark_list_dict.py [n_stations]``.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import sys
+import time
+
+from mt_metadata.timeseries import Station, Survey
+
+# =============================================================================
+
+
+def scan_key_from_index(list_dict, index):
+    """Find the key at a position by walking the keys."""
+    return next(key for ii, key in enumerate(list_dict._home) if ii == index)
+
+
+def scan_index_from_key(list_dict, key):
+    """Find the position of a key by walking the keys."""
+    return next(index for index, k in enumerate(list_dict._home) if k == key)
+
+
+def make_survey(n_stations):
+    survey = Survey(id="bench")
+    for ii in range(n_stations):
+        survey.add_station(Station(id=f"mt{ii:05d}"), update=False)
+    return survey
+
+
+def time_it(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(n_stations=5000):
+    survey = make_survey(n_stations)
+    stations = survey.stations
+    keys = stations.keys()
+    positions = range(0, n_stations, 7)
+
+    rows = [
+        (
+            "integer index",
+            lambda: [
+                stations._home[scan_key_from_index(stations, ii)] for ii in positions
+            ],
+            lambda: [stations[ii] for ii in positions],
+        ),
+        (
+            "index(key)",
+            lambda: [scan_index_from_key(stations, keys[ii]) for ii in positions],
+            lambda: [stations.index(keys[ii]) for ii in positions],
+        ),
+        (
+            "station_index",
+            lambda: [survey.station_names.index(keys[ii]) for ii in positions],
+            lambda: [survey.station_index(keys[ii]) for ii in positions],
+        ),
+        (
+            "slice",
+            lambda: [list(stations.items())[ii : ii + 10] for ii in positions],
+            lambda: [list(stations[ii : ii + 10].items()) for ii in positions],
+        ),
+    ]
+
+    print(f"{n_stations} stations, {len(positions)} lookups per row")
+    print(f"{'access':<16}{'scan [s]':>12}{'ListDict [s]':>14}{'speed up':>10}")
+    for name, scan, indexed in rows:
+        scan_time, scan_result = time_it(scan)
+        indexed_time, indexed_result = time_it(indexed)
+        assert scan_result == indexed_result, f"{name} results differ"
+        print(
+            f"{name:<16}{scan_time:>12.4f}{indexed_time:>14.4f}"
+            f"{scan_time / indexed_time:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
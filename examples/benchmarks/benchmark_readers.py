@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark building metadata in the readers with every assignment validated
+against deferring validation with MetadataBase.trusted_construction.
+
+Inside the block every object assigned to is validated once when the block
+exits.  That validates all of its fields, which costs about as much as ten
+assignments and much more for a Location, whose datum validator builds a
+pyproj CRS.  Most objects the readers fill get fewer assignments than
+that, so the readers validate on assignment and do not use the block.
+
+Run with ``python examples/benchmarks/benchmark_readers.py``.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import time
+from contextlib import nullcontext
+
+from mt_metadata import STATIONXML_01, TF_EDI_PHOENIX, TF_XML, TF_ZMM
+from mt_metadata.base import MetadataBase
+from mt_metadata.transfer_functions.io.edi import EDI
+from mt_metadata.transfer_functions.io.emtfxml import EMTFXML
+from mt_metadata.transfer_functions.io.zfiles.zmm import ZMM
+
+
+# =============================================================================
+
+
+def get_readers():
+    """Name and function of each reader step that builds metadata."""
+    emtf = EMTFXML(fn=TF_XML)
+    edi = EDI(fn=TF_EDI_PHOENIX)
+    readers = [
+        ("EMTFXML.station_metadata", lambda: emtf.station_metadata),
+        ("EDI.station_metadata", lambda: edi.station_metadata),
+        ("ZMM.read", lambda: ZMM(fn=TF_ZMM)),
+    ]
+    try:
+        from obspy import read_inventory
+
+        from mt_metadata.timeseries.stationxml.xml_channel_mt_channel import (
+            XMLChannelMTChannel,
+        )
+    except ImportError:
+        return readers
+
+    channels = [
+        channel
+        for network in read_inventory(str(STATIONXML_01))
+        for station in network
+        for channel in station
+    ]
+    translator = XMLChannelMTChannel()
+    readers.append(
+        (
+            "XMLChannelMTChannel.xml_to_mt",
+            lambda: [translator.xml_to_mt(channel) for channel in channels],
+        )
+    )
+    return readers
+
+
+def best_of(function, context, repeat=7):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with context():
+            function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    for name, function in get_readers():
+        t_validated = best_of(function, nullcontext)
+        t_deferred = best_of(function, MetadataBase.trusted_construction)
+        print(
+            f"{name}: validated on assignment {t_validated:.4f} s, "
+            f"trusted_construction {t_deferred:.4f} s"
+        )
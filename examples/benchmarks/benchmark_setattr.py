@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark attribute assignment outside of MetadataBase.trusted_construction
+against the assignment MetadataBase inherits.
+
+MetadataBase.__setattr__ checks whether validation is deferred before
+handing the assignment to DotNotationBaseModel.__setattr__, which is what
+assignment called before.  Outside of the block the check must not cost
+anything measurable.
+
+Run with ``python examples/benchmarks/benchmark_setattr.py``.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import time
+
+from mt_metadata.base.metadata import DotNotationBaseModel
+from mt_metadata.common import Location
+from mt_metadata.timeseries import Electric, Run, Station
+
+
+# =============================================================================
+
+
+def make_objects(n_stations=2000):
+    """Metadata objects set by a reader of a survey with n_stations stations."""
+    return [(Station(), Location(), Run(), Electric()) for _ in range(n_stations)]
+
+
+def set_values(objects, setattr_function):
+    for ii, (station, location, run, electric) in enumerate(objects):
+        setattr_function(station, "id", f"mt{ii:04}")
+        setattr_function(station, "geographic_name", "Earth")
+        setattr_function(location, "latitude", 40 + ii * 1e-3)
+        setattr_function(location, "longitude", -120 + ii * 1e-3)
+        setattr_function(location, "elevation", 10.0)
+        setattr_function(run, "id", f"mt{ii:04}a")
+        setattr_function(run, "sample_rate", 256.0)
+        setattr_function(electric, "component", "ex")
+        setattr_function(electric, "dipole_length", 50.0)
+        setattr_function(electric, "measurement_azimuth", 0.0)
+
+
+def best_of(function, setattr_function, repeat=7):
+    times = []
+    for _ in range(repeat):
+        objects = make_objects()
+        start = time.perf_counter()
+        function(objects, setattr_function)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    n_values = 10 * len(make_objects())
+    t_inherited = best_of(set_values, DotNotationBaseModel.__setattr__)
+    t_metadata = best_of(set_values, setattr)
+    print(
+        f"{n_values} assignments: inherited {t_inherited:.3f} s, "
+        f"MetadataBase {t_metadata:.3f} s "
+        f"({100 * (t_metadata / t_inherited - 1):+.1f}%)"
+    )
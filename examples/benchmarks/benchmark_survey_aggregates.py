@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark building a survey one station at a time, updating the time period
+and bounding box after every station.
+
+Updating from all of the stations after each one is added, which is what
+``Survey.add_station`` used to do, makes building a survey quadratic in the
+number of stations.  ``add_station`` now only extends the time period and
+bounding box with the new station while they are current, so building is
+linear.  Both must give the same time period and bounding box.
+
+Run with
+``python examples/benchmarks/benchmark_survey_aggregates.py [n_stations]``.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import sys
+import time
+
+from mt_metadata.timeseries import Station, Survey
+
+# =============================================================================
+
+
+def make_stations(n_stations):
+    stations = []
+    for ii in range(n_stations):
+        station = Station(id=f"mt{ii:05d}")
+        station.location.latitude = 30 + (ii * 7 % 100) / 10
+        station.location.longitude = -120 + (ii * 13 % 100) / 10
+        station.time_period.start = f"2020-{ii % 12 + 1:02d}-01T00:00:00"
+        station.time_period.end = f"2021-{ii % 12 + 1:02d}-15T00:00:00"
+        stations.append(station)
+    return stations
+
+
+def build_full(stations):
+    survey = Survey(id="bench")
+    for station in stations:
+        survey.add_station(station, update=False)
+        survey.update_all()
+    return survey
+
+
+def build_extend(stations):
+    survey = Survey(id="bench")
+    for station in stations:
+        survey.add_station(station)
+    return survey
+
+
+def summary(survey):
+    return (
+        survey.time_period.start_date,
+        survey.time_period.end_date,
+        survey.survey_extent,
+    )
+
+
+def main(n_stations=1000):
+    stations = make_stations(n_stations)
+
+    start = time.perf_counter()
+    full = build_full(stations)
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extend = build_extend(stations)
+    extend_time = time.perf_counter() - start
+
+    assert summary(full) == summary(extend), "aggregates differ"
+    print(f"{n_stations} stations")
+    print(f"{'full update':<16}{full_time:>10.3f} s")
+    print(f"{'add_station':<16}{extend_time:>10.3f} s")
+    print(f"{'speed up':<16}{full_time / extend_time:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
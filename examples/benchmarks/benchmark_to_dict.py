@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark MetadataBase.to_dict against the original attribute-walking
+implementation it replaced.
+
+The reference walks ``get_attribute_list()`` and re-derives the required,
+comment and backwards compatibility rules for every attribute on every call.
+``to_dict`` runs a serialization plan compiled once per class.  Both must
+return identical dictionaries.
+
+Run with ``python examples/benchmarks/benchmark_to_dict.py``.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import time
+from collections import OrderedDict
+from enum import Enum
+from operator import itemgetter
+
+import numpy as np
+
+from mt_metadata.base import helpers
+from mt_metadata.base.metadata import _is_simple_comment
+from mt_metadata.timeseries import Electric, Magnetic, Run, Station, Survey
+from mt_metadata.utils.validators import validate_name
+
+# =============================================================================
+
+
+def reference_to_dict(obj, nested=False, single=False, required=True):
+    """Original implementation of MetadataBase.to_dict."""
+    meta_dict = {}
+    processed_comments = set()
+    for name in obj.get_attribute_list():
+        if ".value" in name and name.replace(".value", "") not in processed_comments:
+            base_attr_name = name.replace(".value", "")
+            try:
+                comment_obj = obj.get_attr_from_name(base_attr_name)
+                if comment_obj.__class__.__name__ == "Comment":
+                    if _is_simple_comment(comment_obj) and not nested:
+                        if not required or comment_obj.value not in [
+                            None,
+                            "1980-01-01T00:00:00+00:00",
+                            "1980",
+                            [],
+                            "",
+                        ]:
+                            meta_dict[base_attr_name] = str(comment_obj.value)
+                        processed_comments.add(base_attr_name)
+                        continue
+            except (AttributeError, KeyError):
+                pass
+        if any(name.startswith(f"{pc}.") for pc in processed_comments):
+            continue
+        try:
+            value = obj.get_attr_from_name(name)
+            if value.__class__.__name__ == "Comment":
+                if _is_simple_comment(value) and not nested:
+                    value = str(value.value)
+                else:
+                    value = value.to_dict(nested=nested, required=required)
+            elif hasattr(value, "to_dict"):
+                value = value.to_dict(nested=nested, required=required)
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    if hasattr(item, "to_dict"):
+                        value[key] = item.to_dict(nested=nested, required=required)
+                    elif isinstance(item, Enum):
+                        value[key] = item.value
+            elif isinstance(value, list):
+                value = [
+                    (
+                        item.to_dict(nested=nested, required=required)
+                        if hasattr(item, "to_dict")
+                        else item.value if isinstance(item, Enum) else item
+                    )
+                    for item in value
+                ]
+            elif isinstance(value, Enum):
+                value = value.value
+            elif hasattr(value, "unicode_string"):
+                value = value.unicode_string()
+        except AttributeError:
+            value = None
+        if required:
+            if isinstance(value, np.ndarray):
+                if name in ("zeros", "poles") or value.all() != 0:
+                    meta_dict[name] = value
+            elif hasattr(value, "size"):
+                if value.size > 0:
+                    meta_dict[name] = value
+            elif (
+                value not in [None, "1980-01-01T00:00:00+00:00", "1980", [], ""]
+                or name in obj._required_fields
+                or helpers._should_include_coordinate_field(name)
+                or helpers._should_convert_none_to_empty_string(name)
+            ):
+                if helpers._should_include_coordinate_field(name) and value is None:
+                    value = 0.0
+                elif (
+                    helpers._should_convert_none_to_empty_string(name)
+                    and value is None
+                ):
+                    value = ""
+                meta_dict[name] = value
+        else:
+            meta_dict[name] = value
+    if nested:
+        meta_dict = helpers.structure_dict(meta_dict)
+    meta_dict = {
+        validate_name(obj.__class__.__name__): OrderedDict(
+            sorted(meta_dict.items(), key=itemgetter(0))
+        )
+    }
+    if single:
+        meta_dict = meta_dict[list(meta_dict.keys())[0]]
+    return meta_dict
+
+
+def make_objects(n_stations=500):
+    """Metadata objects found in a survey with n_stations stations."""
+    objects = [Survey(id="bench")]
+    for ii in range(n_stations):
+        station = Station(id=f"mt{ii:04}")
+        station.location.latitude = 40 + ii * 1e-3
+        station.location.longitude = -120 + ii * 1e-3
+        station.comments = f"station {ii}"
+        run = Run(id=f"mt{ii:04}a", sample_rate=256)
+        objects += [station, run, Electric(component="ex"), Magnetic(component="hx")]
+    return objects
+
+
+def best_of(function, objects, kwargs, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for obj in objects:
+            function(obj, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    objects = make_objects()
+    for kwargs in [
+        {},
+        {"nested": True, "single": True},
+        {"required": False},
+    ]:
+        for obj in objects:
+            assert obj.to_dict(**kwargs) == reference_to_dict(obj, **kwargs)
+        t_reference = best_of(reference_to_dict, objects, kwargs)
+        t_plan = best_of(lambda obj, **kw: obj.to_dict(**kw), objects, kwargs)
+        print(
+            f"to_dict({kwargs}) on {len(objects)} objects: "
+            f"reference {t_reference:.3f} s, plan {t_plan:.3f} s, "
+            f"speed up {t_reference / t_plan:.1f}x"
+        )
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark reading EMTF ZMM/ZRR/ZSS files with the bulk period block reader
+against reading the period blocks one at a time.
+
+The per-block reader splits every period block into lines and builds a
+complex number for each pair of values.  The bulk reader converts the
+numbers of all blocks into one float array and reshapes it into the
+transfer function, signal power and residual covariance arrays.  Both must
+give bit-identical arrays.
+
+Run with ``python examples/benchmarks/benchmark_zmm_read.py [directory]``.
+Without a directory a set of synthetic EMTF outputs is written to a
+temporary directory.
+
+"""
+
+# =============================================================================
+# Imports
+# =============================================================================
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from mt_metadata.transfer_functions.io.zfiles.zmm import ZMM
+
+# =============================================================================
+CHANNELS = {
+    ".zss": ["Hx", "Hy", "Hz"],
+    ".zrr": ["Hx", "Hy", "Ex", "Ey"],
+    ".zmm": ["Hx", "Hy", "Hz", "Ex", "Ey"],
+}
+
+
+def _format_values(values):
+    return "".join(f"{v.real:>12.4E}{v.imag:>12.4E}" for v in values)
+
+
+def write_emtf_file(fn, n_periods=200, seed=0):
+    """Write a synthetic EMTF output with n_periods periods."""
+    rng = np.random.default_rng(seed)
+    channels = CHANNELS[Path(fn).suffix]
+    n_out = len(channels) - 2
+    lines = [
+        " TRANSFER FUNCTIONS IN MEASUREMENT COORDINATES",
+        " ********** WITH FULL ERROR COVARIANCE*********",
+        "Robust Remote Reference",
+        "station    :bench",
+        "coordinate    34.727  -115.735 declination    13.10",
+        f"number of channels   {len(channels)}   number of frequencies  {n_periods}",
+        " orientations and tilts of each channel ",
+    ]
+    for ii, channel in enumerate(channels, 1):
+        azimuth = 90.0 if channel.endswith("y") else 0.0
+        lines.append(f"{ii:>5d}{azimuth:>9.2f}     0.00 bench  {channel}    ")
+    lines.append("")
+
+    for period in np.logspace(-3, 4, n_periods):
+        values = rng.normal(size=(n_out * 2 + 3 + n_out * (n_out + 1) // 2, 2))
+        values = values[:, 0] + 1j * values[:, 1]
+        lines += [
+            f"period : {period:^18.5f} decimation level {1:^8d}"
+            f"freq. band from {10:>5d} to {20:>5d}",
+            "number of data point 1000 sampling freq. 8 Hz",
+            " Transfer Functions",
+        ]
+        lines += [_format_values(values[2 * ii : 2 * ii + 2]) for ii in range(n_out)]
+        values = values[2 * n_out :]
+        lines += [
+            " Inverse Coherent Signal Power Matrix",
+            _format_values(values[0:1]),
+            _format_values(values[1:3]),
+            " Residual Covariance",
+        ]
+        values = values[3:]
+        for ii in range(n_out):
+            lines.append(_format_values(values[: ii + 1]))
+            values = values[ii + 1 :]
+    Path(fn).write_text("\n".join(lines))
+    return Path(fn)
+
+
+def make_zmm_objects(fn_list):
+    """ZMM objects with the header read and empty arrays."""
+    zmm_list = []
+    for fn in fn_list:
+        zmm = ZMM()
+        zmm.fn = fn
+        zmm.read_header()
+        zmm.initialize_arrays()
+        zmm_list.append(zmm)
+    return zmm_list
+
+
+def best_of(fn_list, bulk, repeat=3):
+    times = []
+    for _ in range(repeat):
+        zmm_list = make_zmm_objects(fn_list)
+        start = time.perf_counter()
+        for zmm in zmm_list:
+            if bulk:
+                zmm._read_data_blocks()
+            else:
+                zmm._read_period_blocks()
+        times.append(time.perf_counter() - start)
+    return min(times), zmm_list
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        directory = Path(sys.argv[1])
+    else:
+        directory = Path(tempfile.mkdtemp())
+        for ii in range(20):
+            for extension in CHANNELS:
+                write_emtf_file(directory.joinpath(f"bench_{ii:02}{extension}"), seed=ii)
+
+    fn_list = sorted(
+        fn for fn in directory.iterdir() if fn.suffix.lower() in CHANNELS
+    )
+    t_blocks, reference = best_of(fn_list, bulk=False)
+    t_bulk, bulk = best_of(fn_list, bulk=True)
+    for zmm_01, zmm_02 in zip(reference, bulk):
+        for attr in ["periods", "transfer_functions", "sigma_s", "sigma_e"]:
+            assert np.array_equal(getattr(zmm_01, attr), getattr(zmm_02, attr))
+        assert zmm_01.decimation_dict == zmm_02.decimation_dict
+
+    n_periods = sum(zmm.periods.size for zmm in bulk)
+    print(
+        f"read {len(fn_list)} files with {n_periods} periods from {directory}: "
+        f"per block {t_blocks:.3f} s, bulk {t_bulk:.3f} s, "
+        f"speed up {t_blocks / t_bulk:.1f}x, "
+        f"{n_periods / t_bulk:,.0f} periods/s"
+    )
@@ -9,6 +9,7 @@ Created on Wed Dec 23 20:37:52 2020
 
 """
 
+import io
 import json
 import logging
 
@@ -18,6 +19,7 @@ import logging
 import textwrap
 from collections import defaultdict, OrderedDict
 from collections.abc import MutableMapping
+from enum import Enum
 from operator import itemgetter
 from pathlib import Path
 from xml.dom import minidom
@@ -28,6 +30,7 @@ from loguru import logger
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 
+
 filter_descriptions = {
     "zpk": "poles and zeros filter",
     "coefficient": "coefficient filter",
@@ -724,7 +727,11 @@ def structure_dict(meta_dict, sep="."):
     """
     structured_dict = {}
     for key, value in meta_dict.items():
-        recursive_split_dict(key, value, structured_dict, sep=sep)
+        *parents, name = key.split(sep)
+        level = structured_dict
+        for parent in parents:
+            level = level.setdefault(parent, {})
+        level[name] = value
     return structured_dict
 
 
@@ -873,15 +880,125 @@ def element_to_dict(element):
     return OrderedDict(sorted(meta_dict.items(), key=itemgetter(0)))
 
 
-def element_to_string(element):
-    return (
-        minidom.parseString(et.tostring(element).decode())
-        .toprettyxml(
-            indent="    ",
-            encoding="UTF-8",
+def _xml_text(value):
+    """
+    Text of an element or attribute value as ElementTree writes it, the
+    value of an enumeration and not its name.
+    """
+    if isinstance(value, Enum):
+        value = value.value
+    return str.__str__(value) if isinstance(value, str) else value
+
+
+def _escape_xml(text):
+    """
+    Escape text and attribute values the way minidom writes them.
+    """
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _normalize_newlines(text):
+    """
+    Parsers read carriage returns in text as new lines.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write_indented_element(element, fid, indent, add_indent):
+    """
+    Write a single element and its children, see `write_element`.
+    """
+    if element.tag is et.Comment:
+        fid.write(f"{indent}<!--{element.text or ''}-->\n")
+        return
+    if element.tag is et.ProcessingInstruction:
+        target, *data = (element.text or "").split(None, 1)
+        fid.write(f"{indent}<?{target} {''.join(data)}?>\n")
+        return
+
+    fid.write(f"{indent}<{element.tag}")
+    for key, value in element.attrib.items():
+        fid.write(f' {key}="{_escape_xml(_xml_text(value))}"')
+
+    # text, children and the text following each child, like a DOM
+    nodes = []
+    if element.text:
+        nodes.append(_normalize_newlines(_xml_text(element.text)))
+    for child in element:
+        nodes.append(child)
+        if child.tail:
+            nodes.append(_normalize_newlines(_xml_text(child.tail)))
+
+    if not nodes:
+        fid.write("/>\n")
+    elif len(nodes) == 1 and isinstance(nodes[0], str):
+        fid.write(f">{_escape_xml(nodes[0])}</{element.tag}>\n")
+    else:
+        fid.write(">\n")
+        child_indent = indent + add_indent
+        for node in nodes:
+            if isinstance(node, str):
+                fid.write(_escape_xml(f"{child_indent}{node}\n"))
+            else:
+                _write_indented_element(node, fid, child_indent, add_indent)
+        fid.write(f"{indent}</{element.tag}>\n")
+
+
+def write_element(element, fid, indent="    "):
+    """
+    Write an element as indented xml to an open text file in a single pass.
+
+    The output is the same as parsing the element with minidom and writing
+    it with `toprettyxml`, without building a second document in memory.
+    Elements with namespaces still go through minidom so the prefixes
+    match.
+
+    :param element: root element to write
+    :type element: et.Element
+    :param fid: open text file or buffer
+    :type fid: TextIO
+    :param indent: indentation of each level, defaults to 4 spaces
+    :type indent: str
+
+    """
+    if any(
+        isinstance(item.tag, str) and item.tag.startswith("{")
+        for item in element.iter()
+    ):
+        fid.write(
+            minidom.parseString(et.tostring(element).decode())
+            .toprettyxml(indent=indent, encoding="UTF-8")
+            .decode()
         )
-        .decode()
-    )
+        return
+
+    fid.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    _write_indented_element(element, fid, "", indent)
+
+
+def element_to_string(element):
+    """
+    Indented xml string of an element, see `write_element`.
+
+    :param element: root element
+    :type element: et.Element
+    :return: xml string
+    :rtype: str
+
+    """
+    buffer = io.StringIO()
+    write_element(element, buffer)
+    return buffer.getvalue()
 
 
 # =============================================================================
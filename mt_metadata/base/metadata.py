@@ -13,6 +13,8 @@ from __future__ import annotations
 
 import json
 from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 
 # =============================================================================
@@ -20,7 +22,7 @@ from enum import Enum
 # =============================================================================
 from operator import itemgetter
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterator, Mapping
 from xml.etree import cElementTree as et
 
 import numpy as np
@@ -33,6 +35,7 @@ from pydantic import (
     create_model,
     field_validator,
     model_validator,
+    ValidationError,
 )
 from pydantic.fields import FieldInfo, PrivateAttr
 from typing_extensions import deprecated
@@ -43,11 +46,122 @@ from mt_metadata.utils.validators import validate_attribute, validate_name
 
 from . import helpers, pydantic_helpers
 
+
 # =============================================================================
 #  Base class that everything else will inherit
 # =============================================================================
 
 
+# values that are dropped from to_dict(required=True) unless the field is
+# required or has a backwards compatibility rule
+_EMPTY_VALUES = (None, "1980-01-01T00:00:00+00:00", "1980", [], "")
+_PRIMITIVE_TYPES = (type(None), str, int, float, bool)
+
+
+# objects with primitive field values set inside
+# MetadataBase.trusted_construction and the values they replaced, keyed by id,
+# None outside of it
+_deferred_objects: ContextVar[
+    dict[int, tuple["MetadataBase", dict[str, Any]]] | None
+] = ContextVar("deferred_objects", default=None)
+
+
+class ChangeFlag:
+    """
+    Flag raised when watched fields of a metadata object are assigned.
+
+    Objects that keep values derived from the objects they hold, like the
+    time period of a run derived from its channels, attach a flag to each
+    of those objects with `MetadataBase._attach_change_flag`.  Assigning one
+    of the watched fields adds the flag to `pending`, a set kept by the
+    holding object, so it only has to look at the objects that changed.
+
+    Parameters
+    ----------
+    obj : MetadataBase
+        Object held, returned with the flag when it changes.
+    pending : set
+        Set of the holding object the flag is added to.
+    """
+
+    __slots__ = ("obj", "pending")
+
+    def __init__(self, obj: "MetadataBase", pending: set) -> None:
+        self.obj = obj
+        self.pending = pending
+
+
+# coordinate fields where None and 0.0 are equivalent when comparing
+_COORDINATE_SUFFIXES = (".x", ".y", ".z", ".x2", ".y2", ".z2")
+
+
+def _values_equal(key: str, value: Any, other_value: Any) -> bool:
+    """
+    Compare two serialized attribute values with the rules of
+    `MetadataBase.__eq__`.
+    """
+    if isinstance(value, np.ndarray):
+        if value.size != other_value.size:
+            return False
+        return bool((value == other_value).all())
+    elif isinstance(value, (float, int, complex)):
+        # Handle None values in numeric comparisons
+        if other_value is None:
+            # Special case for coordinate fields: treat None and 0.0 as equal
+            return value == 0.0 and key.endswith(_COORDINATE_SUFFIXES)
+        # exact matches are the common case and much cheaper than isclose
+        if value == other_value:
+            return True
+        return bool(np.isclose(value, other_value))
+    elif value in NULL_VALUES and other_value in NULL_VALUES:
+        return True
+    return not value != other_value
+
+
+class _LazyItems:
+    """
+    Look up items of a ``(key, value)`` iterator by key, only consuming the
+    iterator as far as needed.
+    """
+
+    def __init__(self, items: Iterator[tuple[str, Any]]) -> None:
+        self._items = items
+        self._seen = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._seen[key]
+        except KeyError:
+            pass
+        for item_key, value in self._items:
+            self._seen[item_key] = value
+            if item_key == key:
+                return value
+        raise KeyError(key)
+
+
+def _is_simple_comment(comment: Any) -> bool:
+    """
+    Check if a Comment only has a value set (no author or custom timestamp),
+    in which case it is written as a plain string for backwards compatibility.
+    """
+    return (
+        hasattr(comment, "value")
+        and comment.value is not None
+        and isinstance(comment.value, str)
+        and (
+            not hasattr(comment, "author")
+            or comment.author is None
+            or comment.author == ""
+        )
+        and (
+            not hasattr(comment, "time_stamp")
+            or comment.time_stamp is None
+            or str(comment.time_stamp) == "1980-01-01T00:00:00+00:00"
+        )
+    )
+
+
 @deprecated("Base is deprecated, use MetadataBase instead")
 class Base:
     pass
@@ -165,6 +279,15 @@ class DotNotationBaseModel(BaseModel):
         >>> model.update_attribute("time_period.start", "2020-01-01")
         >>> model.update_attribute("latitude", 45.0)
         """
+        accessor = pydantic_helpers.get_accessor_table(type(self)).get(attr_name)
+        if accessor is not None:
+            parent_getter, leaf = accessor
+            parent = self if parent_getter is None else parent_getter(self)
+            setattr(parent, leaf, attr_value)
+            return
+
+        # Fall back on parsing the name for attributes that are not fields
+        # of the model, like extra attributes.
         if "." not in attr_name:
             # Directly set the attribute
             setattr(self, attr_name, attr_value)
@@ -222,6 +345,8 @@ class MetadataBase(DotNotationBaseModel):
 
     _skip_equals: list[str] = PrivateAttr(["processed_date", "creation_time"])
     _fields: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # ChangeFlag and the field names it watches for each object holding this
+    _change_flags: tuple = PrivateAttr(())
 
     @model_validator(mode="before")
     @classmethod
@@ -310,6 +435,155 @@ class MetadataBase(DotNotationBaseModel):
     def _class_name(self) -> str:
         return validate_attribute(self.__class__.__name__)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        for flag, fields in self.__pydantic_private__.get("_change_flags", ()):
+            if name in fields:
+                flag.pending.add(flag)
+
+        deferred = _deferred_objects.get()
+        if (
+            deferred is not None
+            and name in type(self).model_fields
+            and type(value) is type(self.__dict__.get(name))
+            and isinstance(value, _PRIMITIVE_TYPES)
+        ):
+            previous = deferred.get(id(self))
+            if previous is None:
+                previous = deferred[id(self)] = (self, {})
+            previous[1].setdefault(name, self.__dict__[name])
+            self.__dict__[name] = value
+            self.__pydantic_fields_set__.add(name)
+            return
+        super().__setattr__(name, value)
+
+    def _get_change_flag(self, pending: set) -> ChangeFlag:
+        """
+        Get the flag of this object that is added to `pending`.
+
+        Parameters
+        ----------
+        pending : set
+            Set of changed objects kept by an object holding this one.
+
+        Returns
+        -------
+        ChangeFlag
+            Flag already attached for `pending` or a new one.
+        """
+        for flag, _ in self.__pydantic_private__.get("_change_flags", ()):
+            if flag.pending is pending:
+                return flag
+        return ChangeFlag(self, pending)
+
+    def _attach_change_flag(self, flag: ChangeFlag, fields: tuple[str, ...]) -> None:
+        """
+        Add `flag` to its pending set when one of `fields` is assigned.
+
+        Parameters
+        ----------
+        flag : ChangeFlag
+            Flag of an object holding this one, attached only once.
+        fields : tuple of str
+            Names of the fields to watch.
+        """
+        change_flags = self.__pydantic_private__.get("_change_flags", ())
+        if not any(attached is flag for attached, _ in change_flags):
+            self._change_flags = change_flags + ((flag, fields),)
+
+    @classmethod
+    @contextmanager
+    def trusted_construction(cls) -> Iterator[None]:
+        """
+        Defer validation of attribute assignments until the block exits.
+
+        Inside the block a primitive value (str, int, float, bool, None)
+        assigned to a field that holds a value of the same type is stored as
+        given, every object that was assigned to is validated once by
+        `validate_fields` when the block exits.  Other values, like strings
+        for times, lists and metadata objects, are validated on assignment
+        as usual.  Nested blocks are validated when the outermost block
+        exits.
+
+        If an object does not validate, the values set inside the block are
+        put back to the values they replaced and the ValidationError is
+        raised once every object is validated.  If the block raises, the
+        values set inside the block are put back and nothing is validated.
+
+        Notes
+        -----
+        - Values read back inside the block are not normalized yet, for
+          example a component set as "HX" is still "HX".
+        - Validating an object on exit validates every field, which costs
+          about as much as ten assignments, more if a field validator is
+          slow like `Location.datum`.  Only use the block for objects that
+          get many more assignments than that, the readers do not.
+
+        Examples
+        --------
+        >>> from mt_metadata.timeseries import Station
+        >>> station = Station()
+        >>> with MetadataBase.trusted_construction():
+        ...     station.id = "mt01"
+        ...     station.location.datum = "wgs84"
+        >>> station.location.datum
+        'WGS 84'
+        """
+        if _deferred_objects.get() is not None:
+            yield
+            return
+
+        deferred = {}
+        token = _deferred_objects.set(deferred)
+        try:
+            yield
+        except BaseException:
+            for obj, previous in deferred.values():
+                obj.__dict__.update(previous)
+            raise
+        finally:
+            _deferred_objects.reset(token)
+
+        # objects are usually assigned to after the object holding them,
+        # validate them first so model validators of the holding object see
+        # validated values
+        errors = []
+        for obj, previous in reversed(deferred.values()):
+            try:
+                obj.validate_fields()
+            except ValidationError as error:
+                obj.__dict__.update(previous)
+                errors.append(error)
+        for error in errors[1:]:
+            logger.error(error)
+        if errors:
+            raise errors[0]
+
+    def validate_fields(self) -> None:
+        """
+        Validate all fields of the object in one pass.
+
+        The object is validated in place like it is when created, so
+        values are replaced by their validated values and the model
+        validators run once.  Nested metadata objects stay the same
+        objects, private attributes are kept.
+
+        Raises
+        ------
+        ValidationError
+            If any field value is not valid
+        """
+        fields = type(self).model_fields
+        values = {
+            name: value for name, value in self.__dict__.items() if name in fields
+        }
+        private = self.__pydantic_private__
+        fields_set = set(self.__pydantic_fields_set__)
+        try:
+            self.__pydantic_validator__.validate_python(values, self_instance=self)
+        finally:
+            object.__setattr__(self, "__pydantic_private__", private)
+            object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+
     def __str__(self) -> str:
         """
 
@@ -329,8 +603,8 @@ class MetadataBase(DotNotationBaseModel):
         Compare this metadata object with another for equality.
 
         This method supports comparison with various types by converting them
-        to MetadataBase objects first. Uses Pydantic's equality comparison after
-        loading the other object.
+        to MetadataBase objects first.  The comparison is field-wise and stops
+        at the first difference, use `diff` to get all of the differences.
 
         Parameters
         ----------
@@ -349,64 +623,79 @@ class MetadataBase(DotNotationBaseModel):
 
         Notes
         -----
-        The following Pydantic equality logic is used:
+        - Attributes containing any of the names in `_skip_equals` are skipped
+        - Numbers are compared with `np.isclose`
+        - Coordinate fields (x, y, z, x2, y2, z2) treat None and 0.0 as equal
+        - Values that are both in NULL_VALUES are equal
+        - Attributes missing from the other object are not a difference
+        """
+        differences = self._compare(other, stop_at_first=True)
+        if differences is None:
+            return False
+        for key, (value, other_value) in differences.items():
+            logger.info(f"{key}: {value} != {other_value}")
+        return not differences
 
-           if isinstance(other, BaseModel):
-            # When comparing instances of generic types for equality, as long as all field values are equal,
-            # only require their generic origin types to be equal, rather than exact type equality.
-            # This prevents headaches like MyGeneric(x=1) != MyGeneric[Any](x=1).
-            self_type = self.__pydantic_generic_metadata__['origin'] or self.__class__
-            other_type = other.__pydantic_generic_metadata__['origin'] or other.__class__
+    def diff(
+        self, other: "MetadataBase" | dict | str | pd.Series | et.Element
+    ) -> dict[str, tuple[Any, Any]]:
+        """
+        Get all the differences between this metadata object and another.
 
-            # Perform common checks first
-            if not (
-                self_type == other_type
-                and getattr(self, '__pydantic_private__', None) == getattr(other, '__pydantic_private__', None)
-                and self.__pydantic_extra__ == other.__pydantic_extra__
-            ):
-                return False
-
-            # We only want to compare pydantic fields but ignoring fields is costly.
-            # We'll perform a fast check first, and fallback only when needed
-            # See GH-7444 and GH-7825 for rationale and a performance benchmark
-
-            # First, do the fast (and sometimes faulty) __dict__ comparison
-            if self.__dict__ == other.__dict__:
-                # If the check above passes, then pydantic fields are equal, we can return early
-                return True
-
-            # We don't want to trigger unnecessary costly filtering of __dict__ on all unequal objects, so we return
-            # early if there are no keys to ignore (we would just return False later on anyway)
-            model_fields = type(self).model_fields.keys()
-            if self.__dict__.keys() <= model_fields and other.__dict__.keys() <= model_fields:
-                return False
-
-            # If we reach here, there are non-pydantic-fields keys, mapped to unequal values, that we need to ignore
-            # Resort to costly filtering of the __dict__ objects
-            # We use operator.itemgetter because it is much faster than dict comprehensions
-            # NOTE: Contrary to standard python class and instances, when the Model class has a default value for an
-            # attribute and the model instance doesn't have a corresponding attribute, accessing the missing attribute
-            # raises an error in BaseModel.__getattr__ instead of returning the class attribute
-            # So we can use operator.itemgetter() instead of operator.attrgetter()
-            getter = operator.itemgetter(*model_fields) if model_fields else lambda _: _utils._SENTINEL
-            try:
-                return getter(self.__dict__) == getter(other.__dict__)
-            except KeyError:
-                # In rare cases (such as when using the deprecated BaseModel.copy() method),
-                # the __dict__ may not contain all model fields, which is how we can get here.
-                # getter(self.__dict__) is much faster than any 'safe' method that accounts
-                # for missing keys, and wrapping it in a `try` doesn't slow things down much
-                # in the common case.
-                self_fields_proxy = _utils.SafeGetItemProxy(self.__dict__)
-                other_fields_proxy = _utils.SafeGetItemProxy(other.__dict__)
-                return getter(self_fields_proxy) == getter(other_fields_proxy)
-
-        # other instance is not a BaseModel
-        else:
-            return NotImplemented  # delegate to the other item in the comparison
+        Uses the same rules as `__eq__` but does not stop at the first
+        difference and does not log anything.
+
+        Parameters
+        ----------
+        other : MetadataBase | dict | str | pd.Series | et.Element
+            Object to compare with.
+
+        Returns
+        -------
+        dict[str, tuple[Any, Any]]
+            Dotted attribute name mapped to (this value, other value) for each
+            attribute that differs.  Empty if the objects are equal.
+
+        Raises
+        ------
+        MTSchemaError
+            If the other object cannot be loaded for comparison.
+
+        Examples
+        --------
+        >>> station_01.diff(station_02)
+        {'location.latitude': (40.0, 41.0)}
         """
-        if other in [None]:
-            return False
+        differences = self._compare(other)
+        if differences is None:
+            msg = f"Cannot compare {self.__class__.__name__} with {type(other)}"
+            logger.error(msg)
+            raise MTSchemaError(msg)
+        return differences
+
+    def _compare(
+        self,
+        other: "MetadataBase" | dict | str | pd.Series | et.Element,
+        stop_at_first: bool = False,
+    ) -> dict[str, tuple[Any, Any]] | None:
+        """
+        Walk the fields of this object and compare them with the other object.
+
+        Parameters
+        ----------
+        other : MetadataBase | dict | str | pd.Series | et.Element
+            Object to compare with.
+        stop_at_first : bool, optional
+            Return as soon as a difference is found. Default is False.
+
+        Returns
+        -------
+        dict[str, tuple[Any, Any]] | None
+            Differences keyed by attribute name, None if the other object
+            could not be loaded.
+        """
+        if other is None:
+            return None
 
         elif isinstance(other, (dict, str, pd.Series, et.Element)):
             try:
@@ -417,84 +706,38 @@ class MetadataBase(DotNotationBaseModel):
                 logger.error(
                     f"Failed to load other object of type {type(other)}: {other}. Error is: {e} "
                 )
-                return False
+                return None
             if not other_obj:
-                return False
+                return None
 
             if hasattr(other_obj, "to_dict") and callable(other_obj.to_dict):
-                other_dict = other_obj.to_dict(single=True, required=False)
+                other_items = other_obj.to_dict(single=True, required=False)
             else:
-                return False
+                return None
 
         elif isinstance(other, MetadataBase):
-            other_dict = other.to_dict(single=True, required=False)
+            # only serialize as much of the other object as is needed
+            other_items = _LazyItems(other._iter_dict_items(required=False))
         else:
             raise ValueError(
                 f"Cannot compare {self.__class__.__name__} with {type(other)}"
             )
-        home_dict = self.to_dict(single=True, required=False)
-        try:
-            if home_dict == other_dict:
-                return True
-        except ValueError:
-            # Handle numpy arrays in dictionaries which cannot be directly compared
-            pass
 
-        equals = True
-        for key, value in home_dict.items():
-            skip_key_bool = False
-            for skip_key in self._skip_equals:
-                if skip_key in key:
-                    skip_key_bool = True
-            if skip_key_bool:
+        differences = {}
+        for key, value in self._iter_dict_items(required=False):
+            if any(skip_key in key for skip_key in self._skip_equals):
                 continue
             try:
-                other_value = other_dict[key]
-                if isinstance(value, np.ndarray):
-                    if value.size != other_value.size:
-                        msg = f"Array sizes for {key} differ: {value.size} != {other_value.size}"
-                        logger.info(msg)
-                        equals = False
-                        continue
-                    if not (value == other_value).all():
-                        msg = f"{key}: {value} != {other_value}"
-                        logger.info(msg)
-                        equals = False
-                elif isinstance(value, (float, int, complex)):
-                    # Handle None values in numeric comparisons
-                    if other_value is None or value is None:
-                        # Special case for coordinate fields: treat None and 0.0 as equal
-                        coordinate_fields = ["x", "y", "z", "x2", "y2", "z2"]
-                        is_coordinate_field = any(
-                            key.endswith(f".{coord}") for coord in coordinate_fields
-                        )
-
-                        if is_coordinate_field and (
-                            (value is None and other_value == 0.0)
-                            or (value == 0.0 and other_value is None)
-                        ):
-                            # Coordinate fields: None and 0.0 are considered equivalent
-                            continue
-                        elif value != other_value:
-                            msg = f"{key}: {value} != {other_value}"
-                            logger.info(msg)
-                            equals = False
-                    elif not np.isclose(value, other_value):
-                        msg = f"{key}: {value} != {other_value}"
-                        logger.info(msg)
-                        equals = False
-                else:
-                    if value in NULL_VALUES and other_value in NULL_VALUES:
-                        continue
-                    if value != other_value:
-                        msg = f"{key}: {value} != {other_value}"
-                        logger.info(msg)
-                        equals = False
+                other_value = other_items[key]
             except KeyError:
-                msg = "Cannot find {0} in other".format(key)
-                logger.info(msg)
+                logger.debug(f"Cannot find {key} in other")
+                continue
+            if not _values_equal(key, value, other_value):
+                differences[key] = (value, other_value)
+                if stop_at_first:
+                    break
 
-        return equals
+        return differences
 
     def __ne__(
         self, other: "MetadataBase" | dict | str | pd.Series | et.Element
@@ -853,10 +1096,18 @@ class MetadataBase(DotNotationBaseModel):
         Notes
         -----
         This is a helper function for names with '.' for easier access when
-        reading from dictionaries or other flat structures.
+        reading from dictionaries or other flat structures.  Field names are
+        resolved through the compiled accessor table of the class, anything
+        else falls back on splitting the name.
         """
-        value, _ = helpers.recursive_split_getattr(self, name)
-        return value
+        accessor = pydantic_helpers.get_accessor_table(type(self)).get(name)
+        if accessor is None:
+            value, _ = helpers.recursive_split_getattr(self, name)
+            return value
+
+        parent_getter, leaf = accessor
+        parent = self if parent_getter is None else parent_getter(self)
+        return getattr(parent, leaf, None)
 
     @deprecated(
         "set_attr_from_name will be deprecated in the future. Use update_attribute."
@@ -953,80 +1204,46 @@ class MetadataBase(DotNotationBaseModel):
             **all_fields,
         )
 
-    def to_dict(
-        self, nested: bool = False, single: bool = False, required: bool = True
-    ) -> dict[str, Any]:
+    def _iter_dict_items(
+        self, nested: bool = False, required: bool = True
+    ) -> Iterator[tuple[str, Any]]:
         """
-        Convert metadata to a dictionary representation.
+        Lazily yield the flat ``(name, value)`` items of `to_dict`.
+
+        Items come out in attribute order, before any nesting or sorting, so
+        that callers like `__eq__` can stop as soon as they have what they
+        need.
 
         Parameters
         ----------
         nested : bool, optional
-            If True, return a nested dictionary structure. If False, use
-            dot-notation for nested keys. Default is False.
-        single : bool, optional
-            If True, return just the metadata dictionary without the class name
-            wrapper (meta_dict[class_name]). Default is False.
+            Serialize values as they would be for a nested dictionary.
+            Default is False.
         required : bool, optional
-            If True, return only required elements and elements with non-None
-            values. If False, include all fields. Default is True.
+            If True, yield only required elements and elements with non-None
+            values. Default is True.
 
-        Returns
-        -------
-        dict[str, Any]
-            Dictionary representation of the metadata
-
-        Notes
-        -----
-        - Comment objects are converted to simple strings for backward compatibility
-          when they only contain a value (no author or custom timestamp)
-        - Numpy arrays, Enums, and nested MetadataBase objects are handled specially
-        - Required fields are always included even if None
-
-        Examples
-        --------
-        >>> metadata.to_dict(nested=True, single=True)
-        >>> metadata.to_dict(required=False)  # Include all fields
+        Yields
+        ------
+        tuple[str, Any]
+            Dotted attribute name and serialized value.
         """
-
-        meta_dict = {}
-
         # Keep track of processed comment attributes to avoid duplication
         processed_comments = set()
 
-        for name in self.get_attribute_list():
+        for entry in pydantic_helpers.get_serialization_plan(type(self)):
+            name = entry.name
             # Special handling for comment attributes for backwards compatibility
             if (
-                ".value" in name
-                and name.replace(".value", "") not in processed_comments
+                entry.comment_base is not None
+                and entry.comment_base not in processed_comments
             ):
-                base_attr_name = name.replace(".value", "")
+                base_attr_name = entry.comment_base
                 # Check if this is a comment attribute
                 try:
                     comment_obj = self.get_attr_from_name(base_attr_name)
-                    if (
-                        hasattr(comment_obj, "__class__")
-                        and comment_obj.__class__.__name__ == "Comment"
-                    ):
-                        # Check if this is a simple comment (only value set, no author or custom timestamp)
-                        default_timestamp = "1980-01-01T00:00:00+00:00"
-                        is_simple_comment = (
-                            hasattr(comment_obj, "value")
-                            and comment_obj.value is not None
-                            and isinstance(comment_obj.value, str)
-                            and (
-                                not hasattr(comment_obj, "author")
-                                or comment_obj.author is None
-                                or comment_obj.author == ""
-                            )
-                            and (
-                                not hasattr(comment_obj, "time_stamp")
-                                or comment_obj.time_stamp is None
-                                or str(comment_obj.time_stamp) == default_timestamp
-                            )
-                        )
-
-                        if is_simple_comment and not nested:
+                    if comment_obj.__class__.__name__ == "Comment":
+                        if _is_simple_comment(comment_obj) and not nested:
                             # Use simple string format for backwards compatibility
                             if required:
                                 if comment_obj.value not in [
@@ -1036,56 +1253,33 @@ class MetadataBase(DotNotationBaseModel):
                                     [],
                                     "",
                                 ]:
-                                    meta_dict[base_attr_name] = str(comment_obj.value)
+                                    yield base_attr_name, str(comment_obj.value)
                             else:
-                                meta_dict[base_attr_name] = str(comment_obj.value)
+                                yield base_attr_name, str(comment_obj.value)
 
                             # Mark this comment as processed to skip its nested attributes
                             processed_comments.add(base_attr_name)
                             continue
-                        else:
-                            # Use nested format - let individual attributes be processed normally
-                            pass
                 except (AttributeError, KeyError):
                     # Not a comment object or attribute doesn't exist, process normally
                     pass
 
             # Skip nested comment attributes if we already processed the base comment
-            skip_attribute = False
-            for processed_comment in processed_comments:
-                if name.startswith(processed_comment + "."):
-                    skip_attribute = True
-                    break
-
-            if skip_attribute:
+            if processed_comments and any(
+                parent in processed_comments for parent in entry.parents
+            ):
                 continue
 
             try:
-                value = self.get_attr_from_name(name)
+                parent_getter, leaf = entry.accessor
+                parent = self if parent_getter is None else parent_getter(self)
+                value = getattr(parent, leaf, None)
+                if type(value) in _PRIMITIVE_TYPES:
+                    # nothing to convert, skip the type checks below
+                    pass
                 # Special handling for Comment objects for backwards compatibility
-                if (
-                    hasattr(value, "__class__")
-                    and value.__class__.__name__ == "Comment"
-                ):
-                    # Check if this is a simple comment (only value set, no author or custom timestamp)
-                    default_timestamp = "1980-01-01T00:00:00+00:00"
-                    is_simple_comment = (
-                        hasattr(value, "value")
-                        and value.value is not None
-                        and isinstance(value.value, str)
-                        and (
-                            not hasattr(value, "author")
-                            or value.author is None
-                            or value.author == ""
-                        )
-                        and (
-                            not hasattr(value, "time_stamp")
-                            or value.time_stamp is None
-                            or str(value.time_stamp) == default_timestamp
-                        )
-                    )
-
-                    if is_simple_comment and not nested:
+                elif value.__class__.__name__ == "Comment":
+                    if _is_simple_comment(value) and not nested:
                         # Return simple string for backwards compatibility
                         value = str(value.value)
                     else:
@@ -1115,38 +1309,71 @@ class MetadataBase(DotNotationBaseModel):
                     value = value.value
                 elif hasattr(value, "unicode_string"):
                     value = value.unicode_string()
-                elif isinstance(value, (str, int, float, bool)):
-                    value = value
             except AttributeError as error:
                 logger.debug(error)
                 value = None
             if required:
                 if isinstance(value, (np.ndarray)):
                     if name == "zeros" or name == "poles":
-                        meta_dict[name] = value
+                        yield name, value
                     elif value.all() != 0:
-                        meta_dict[name] = value
+                        yield name, value
                 elif hasattr(value, "size"):
                     if value.size > 0:
-                        meta_dict[name] = value
+                        yield name, value
                 elif (
-                    value not in [None, "1980-01-01T00:00:00+00:00", "1980", [], ""]
-                    or name in self._required_fields
-                    or helpers._should_include_coordinate_field(name)
-                    or helpers._should_convert_none_to_empty_string(name)
+                    value not in _EMPTY_VALUES
+                    or entry.required
+                    or entry.coordinate
+                    or entry.none_to_empty
                 ):
                     # Convert None coordinate fields to 0.0 for backward compatibility
-                    if helpers._should_include_coordinate_field(name) and value is None:
+                    if entry.coordinate and value is None:
                         value = 0.0
                     # Convert None string fields to empty string for backward compatibility
-                    elif (
-                        helpers._should_convert_none_to_empty_string(name)
-                        and value is None
-                    ):
+                    elif entry.none_to_empty and value is None:
                         value = ""
-                    meta_dict[name] = value
+                    yield name, value
             else:
-                meta_dict[name] = value
+                yield name, value
+
+    def to_dict(
+        self, nested: bool = False, single: bool = False, required: bool = True
+    ) -> dict[str, Any]:
+        """
+        Convert metadata to a dictionary representation.
+
+        Parameters
+        ----------
+        nested : bool, optional
+            If True, return a nested dictionary structure. If False, use
+            dot-notation for nested keys. Default is False.
+        single : bool, optional
+            If True, return just the metadata dictionary without the class name
+            wrapper (meta_dict[class_name]). Default is False.
+        required : bool, optional
+            If True, return only required elements and elements with non-None
+            values. If False, include all fields. Default is True.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dictionary representation of the metadata
+
+        Notes
+        -----
+        - Comment objects are converted to simple strings for backward compatibility
+          when they only contain a value (no author or custom timestamp)
+        - Numpy arrays, Enums, and nested MetadataBase objects are handled specially
+        - Required fields are always included even if None
+
+        Examples
+        --------
+        >>> metadata.to_dict(nested=True, single=True)
+        >>> metadata.to_dict(required=False)  # Include all fields
+        """
+
+        meta_dict = dict(self._iter_dict_items(nested=nested, required=required))
         if nested:
             meta_dict = helpers.structure_dict(meta_dict)
         meta_dict = {
@@ -44,16 +44,33 @@ from __future__ import annotations
 import enum
 import hashlib
 import json
+import operator
 import os
 import sys
 from pathlib import Path
 from threading import RLock
-from typing import Annotated, Any, Dict, get_args, get_origin, Literal, Union
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    get_args,
+    get_origin,
+    Literal,
+    NamedTuple,
+    Tuple,
+    Union,
+)
 
 from pydantic import __version__ as _PYDANTIC_VERSION
 from pydantic import TypeAdapter  # Pydantic v2
 from pydantic import BaseModel
 
+from .helpers import (
+    _should_convert_none_to_empty_string,
+    _should_include_coordinate_field,
+)
+
 # try:
 #     # Optional dependency for platform-aware cache directory
 #     from platformdirs import user_cache_dir
@@ -74,6 +91,32 @@ SPECIAL_CASE_MODEL_NAMES = {"MTime"}
 _FIELDS_TREE_CACHE: Dict[type[BaseModel], Dict[str, Any]] = {}
 _CACHE_LOCK = RLock()
 
+# (parent getter or None for top-level attributes, leaf attribute name)
+Accessor = Tuple[Union[Callable[[Any], Any], None], str]
+
+# Compiled dotted-path accessors (per class), see `get_accessor_table`
+_ACCESSOR_TABLE_CACHE: Dict[type[BaseModel], Dict[str, Accessor]] = {}
+
+
+class SerializationEntry(NamedTuple):
+    """
+    One precompiled step of `MetadataBase.to_dict` for a single dotted field.
+    """
+
+    name: str
+    accessor: Accessor
+    # name with ".value" removed if the field could be the value of a Comment
+    comment_base: Union[str, None]
+    # all parent paths, used to skip children of simple comments
+    parents: Tuple[str, ...]
+    required: bool
+    coordinate: bool
+    none_to_empty: bool
+
+
+# Compiled to_dict plans (per class), see `get_serialization_plan`
+_SERIALIZATION_PLAN_CACHE: Dict[type[BaseModel], Tuple[SerializationEntry, ...]] = {}
+
 # Environment flag to disable disk caching (e.g., for tests)
 _DISABLE_DISK_CACHE = os.environ.get("MT_METADATA_DISABLE_DISK_CACHE", "0") in {
     "1",
@@ -189,14 +232,100 @@ def flatten_field_tree_map(
     return out
 
 
+def get_accessor_table(
+    model_or_cls: Union[type[BaseModel], BaseModel],
+) -> Dict[str, Accessor]:
+    """
+    Get the compiled dotted-path accessor table for a Pydantic BaseModel.
+
+    The table is built once per class from `get_all_fields_serializable` and
+    maps every dotted path (leaf fields and the nested models leading to them)
+    to a ``(parent_getter, leaf_name)`` pair, where ``parent_getter`` is an
+    :func:`operator.attrgetter` for the parent path (None for top-level
+    attributes).  Resolving a path then costs one C-level attribute chain plus
+    a single ``getattr``/``setattr`` instead of re-splitting the string.
+
+    Parameters
+    ----------
+    model_or_cls : type[BaseModel] or BaseModel
+        The BaseModel class (preferred) or an instance.
+
+    Returns
+    -------
+    Dict[str, Accessor]
+        Mapping of dotted path to ``(parent_getter, leaf_name)``.
+
+    Examples
+    --------
+    >>> parent_getter, leaf = get_accessor_table(Station)["location.latitude"]
+    >>> getattr(parent_getter(station), leaf)
+    """
+    model_cls: type[BaseModel] = (
+        model_or_cls if isinstance(model_or_cls, type) else type(model_or_cls)
+    )
+
+    # lock-free hit, this is the hot path
+    table = _ACCESSOR_TABLE_CACHE.get(model_cls)
+    if table is not None:
+        return table
+
+    with _CACHE_LOCK:
+        table = _ACCESSOR_TABLE_CACHE.get(model_cls)
+        if table is None:
+            table = _compile_accessor_table(model_cls)
+            _ACCESSOR_TABLE_CACHE[model_cls] = table
+        return table
+
+
+def get_serialization_plan(
+    model_or_cls: Union[type[BaseModel], BaseModel],
+) -> Tuple[SerializationEntry, ...]:
+    """
+    Get the compiled serialization plan used by `MetadataBase.to_dict`.
+
+    The plan is one `SerializationEntry` per dotted field, sorted by name,
+    with everything that only depends on the class resolved up front: the
+    accessor, whether the field is required by the standards, the
+    coordinate and empty-string backwards compatibility rules and the
+    candidate Comment paths.
+
+    Parameters
+    ----------
+    model_or_cls : type[BaseModel] or BaseModel
+        The BaseModel class (preferred) or an instance.
+
+    Returns
+    -------
+    Tuple[SerializationEntry, ...]
+        Sorted serialization steps for the class.
+    """
+    model_cls: type[BaseModel] = (
+        model_or_cls if isinstance(model_or_cls, type) else type(model_or_cls)
+    )
+
+    plan = _SERIALIZATION_PLAN_CACHE.get(model_cls)
+    if plan is not None:
+        return plan
+
+    with _CACHE_LOCK:
+        plan = _SERIALIZATION_PLAN_CACHE.get(model_cls)
+        if plan is None:
+            plan = _compile_serialization_plan(model_cls)
+            _SERIALIZATION_PLAN_CACHE[model_cls] = plan
+        return plan
+
+
 def clear_field_caches() -> None:
     """
-    Clear the in-memory field tree cache.
+    Clear the in-memory field tree, accessor table and serialization plan
+    caches.
 
     This does not remove any on-disk cache files.
     """
     with _CACHE_LOCK:
         _FIELDS_TREE_CACHE.clear()
+        _ACCESSOR_TABLE_CACHE.clear()
+        _SERIALIZATION_PLAN_CACHE.clear()
 
 
 # -------------------------------
@@ -252,6 +381,78 @@ def _compute_fields_tree(model_cls: type[BaseModel]) -> Dict[str, Any]:
     return out
 
 
+def _compile_accessor_table(model_cls: type[BaseModel]) -> Dict[str, Accessor]:
+    """
+    Build the dotted-path accessor table for a BaseModel class.
+
+    Parameters
+    ----------
+    model_cls : type[BaseModel]
+        The Pydantic BaseModel subclass to compile.
+
+    Returns
+    -------
+    Dict[str, Accessor]
+        Mapping of dotted path to ``(parent_getter, leaf_name)``, including
+        the intermediate nested model paths (e.g. ``"location"``).
+    """
+    table: Dict[str, Accessor] = {}
+    getters: Dict[str, Callable[[Any], Any]] = {}
+
+    paths = flatten_field_tree_map(get_all_fields_serializable(model_cls))
+    for path in paths:
+        parts = path.split(".")
+        for index in range(1, len(parts) + 1):
+            sub_path = ".".join(parts[:index])
+            if sub_path in table:
+                continue
+            if index == 1:
+                table[sub_path] = (None, parts[0])
+            else:
+                parent = ".".join(parts[: index - 1])
+                if parent not in getters:
+                    getters[parent] = operator.attrgetter(parent)
+                table[sub_path] = (getters[parent], parts[index - 1])
+
+    return table
+
+
+def _compile_serialization_plan(
+    model_cls: type[BaseModel],
+) -> Tuple[SerializationEntry, ...]:
+    """
+    Build the serialization plan for a BaseModel class.
+
+    Parameters
+    ----------
+    model_cls : type[BaseModel]
+        The Pydantic BaseModel subclass to compile.
+
+    Returns
+    -------
+    Tuple[SerializationEntry, ...]
+        Serialization steps sorted by dotted name.
+    """
+    table = get_accessor_table(model_cls)
+    fields = flatten_field_tree_map(get_all_fields_serializable(model_cls))
+
+    plan = []
+    for name in sorted(fields.keys()):
+        parts = name.split(".")
+        plan.append(
+            SerializationEntry(
+                name=name,
+                accessor=table[name],
+                comment_base=name.replace(".value", "") if ".value" in name else None,
+                parents=tuple(".".join(parts[:ii]) for ii in range(1, len(parts))),
+                required=bool(fields[name].get("required", False)),
+                coordinate=_should_include_coordinate_field(name),
+                none_to_empty=_should_convert_none_to_empty_string(name),
+            )
+        )
+    return tuple(plan)
+
+
 def _extract_base_type(annotation: Any) -> Any:
     """
     Extract a primary base type from complex type annotations (Optional/Union, Annotated, List, Dict).
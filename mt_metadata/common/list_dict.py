@@ -13,6 +13,20 @@ from collections import OrderedDict
 # =============================================================================
 
 
+class _LazyValue:
+    """
+    Placeholder for a value that is created the first time it is accessed.
+    """
+
+    __slots__ = ("loader",)
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __repr__(self):
+        return "<not loaded>"
+
+
 class ListDict:
     """
     Hack together an object that acts like a dictionary and list such that a
@@ -21,10 +35,21 @@ class ListDict:
     This is the first attempt, seems to work, might think about inheriting
     an OrderedDict and overloading.
 
+    Positions of the keys are kept in a key list and a key -> position
+    dictionary so integer indexing, slicing and `index` do not scan the
+    keys.  Both are built on demand, kept up to date when keys are added
+    and rebuilt after keys are removed or reordered.
+
+    `version` changes every time a value is set or removed, so containers
+    can tell if something they computed from the values is out of date.
+
     """
 
     def __init__(self, values={}):
         self._home = OrderedDict(values)
+        self._keys = None
+        self._positions = None
+        self._version = 0
 
     def __str__(self):
         lines = ["Contents:", "-" * 12]
@@ -50,25 +75,87 @@ class ListDict:
         return f"ListDict({items_str})"
 
     def __eq__(self, other):
+        self._load_all()
+        other._load_all()
         return self._home.__eq__(other._home)
 
     def __len__(self):
         return self._home.__len__()
 
-    def _get_key_from_index(self, index):
-        try:
-            return next(key for ii, key in enumerate(self._home) if ii == index)
+    @property
+    def version(self):
+        """
+        Number of times values have been set or removed.
+
+        :return: version of the contents
+        :rtype: int
 
-        except StopIteration:
-            raise KeyError(f"Could not find {index}")
+        """
+        return self._version
+
+    def _get_positions(self):
+        """
+        Get the key list and key -> position dictionary, building them if
+        keys were removed or reordered since they were last used.
+
+        :return: keys in order and the position of each key
+        :rtype: tuple(list, dict)
+
+        """
+        if self._keys is None:
+            self._keys = list(self._home.keys())
+            self._positions = {key: index for index, key in enumerate(self._keys)}
+        return self._keys, self._positions
+
+    def _reset_positions(self):
+        """
+        Keys were removed or reordered, rebuild positions when next needed.
+        """
+        self._keys = None
+        self._positions = None
+        self._version += 1
+
+    def _set(self, key, value):
+        """
+        Set the value of a key, adding the key to the end of the positions
+        if it is new.
+
+        :param key: key verbatim
+        :type key: str
+        :param value: value
+
+        """
+        if self._keys is not None and key not in self._home:
+            self._positions[key] = len(self._keys)
+            self._keys.append(key)
+        self._home[key] = value
+        self._version += 1
+
+    def _get_key_from_index(self, index):
+        keys = self._get_positions()[0]
+        if 0 <= index < len(keys):
+            return keys[index]
+        raise KeyError(f"Could not find {index}")
 
     def _get_index_from_key(self, key):
         try:
-            return next(index for index, k in enumerate(self._home) if k == key)
-
-        except StopIteration:
+            return self._get_positions()[1][key]
+        except KeyError:
             raise KeyError(f"Could not find {key}")
 
+    def index(self, key):
+        """
+        Get the position of a key
+
+        :param key: key verbatim
+        :type key: str
+        :return: position of the key
+        :rtype: int
+        :raises KeyError: if the key is not in the ListDict
+
+        """
+        return self._get_index_from_key(key)
+
     def _get_key_from_object(self, obj):
         """
         Get the key from the metadata object
@@ -96,10 +183,10 @@ class ListDict:
 
         """
         copied = type(self)()
-        for key, value in self.items():
-            if hasattr(value, "copy"):
-                value = value.copy()
-            copied[key] = value
+        copied._home = OrderedDict(
+            (key, value.copy() if hasattr(value, "copy") else value)
+            for key, value in self.items()
+        )
 
         return copied
 
@@ -111,6 +198,17 @@ class ListDict:
 
         return self.__deepcopy__()
 
+    def __getstate__(self):
+        """
+        Loaders of lazy values cannot be pickled, create them before pickling.
+
+        """
+        self._load_all()
+        state = self.__dict__.copy()
+        state["_keys"] = None
+        state["_positions"] = None
+        return state
+
     def _get_index_slice_from_slice(self, items, key_slice):
         """
         Get the slice index values from either an integer or key value
@@ -140,30 +238,75 @@ class ListDict:
 
         return slice(start, stop, key_slice.step)
 
+    def _load(self, key):
+        """
+        Get the value of a key, creating it first if it has not been loaded.
+
+        :param key: key verbatim
+        :type key: str
+        :return: value
+
+        """
+        value = self._home[key]
+        if isinstance(value, _LazyValue):
+            value = value.loader()
+            self._home[key] = value
+        return value
+
+    def _load_all(self):
+        """
+        Create all values that have not been loaded yet.
+        """
+        for key in list(self._home.keys()):
+            self._load(key)
+
+    def set_lazy(self, key, loader):
+        """
+        Add a value that is created by calling `loader` the first time it
+        is accessed.
+
+        :param key: key of the value
+        :type key: str
+        :param loader: function without arguments that returns the value
+        :type loader: callable
+
+        """
+        self._set(key, _LazyValue(loader))
+
+    def is_loaded(self, key):
+        """
+        Has the value of key been created.
+
+        :param key: key verbatim
+        :type key: str
+        :return: False if the value is still waiting to be loaded
+        :rtype: bool
+
+        """
+        return not isinstance(self._home[key], _LazyValue)
+
     def __getitem__(self, value):
         if isinstance(value, str):
             try:
-                return self._home[value]
+                return self._load(value)
             except KeyError:
                 raise KeyError(f"Could not find {value}")
 
         elif isinstance(value, int):
             key = self._get_key_from_index(value)
-            return self._home[key]
+            return self._load(key)
 
         elif isinstance(value, slice):
-            return ListDict(
-                list(self.items())[
-                    self._get_index_slice_from_slice(self.items(), value)
-                ]
-            )
+            keys = self._get_positions()[0]
+            keys = keys[self._get_index_slice_from_slice(keys, value)]
+            return ListDict([(key, self._load(key)) for key in keys])
 
         else:
             raise TypeError("Index must be a string or integer value.")
 
     def __setitem__(self, index, value):
         if isinstance(index, str):
-            self._home[index] = value
+            self._set(index, value)
 
         elif isinstance(index, int):
             try:
@@ -174,7 +317,7 @@ class ListDict:
                 except TypeError:
                     key = str(index)
 
-            self._home[key] = value
+            self._set(key, value)
 
         elif isinstance(index, slice):
             raise NotImplementedError(
@@ -185,12 +328,14 @@ class ListDict:
         return iter(self.values())
 
     def keys(self):
-        return list(self._home.keys())
+        return list(self._get_positions()[0])
 
     def values(self):
+        self._load_all()
         return list(self._home.values())
 
     def items(self):
+        self._load_all()
         return self._home.items()
 
     def append(self, obj):
@@ -207,9 +352,9 @@ class ListDict:
         try:
             key = self._get_key_from_object(obj)
         except TypeError:
-            key = str(len(self.keys()))
+            key = str(len(self._home))
 
-        self._home[key] = obj
+        self._set(key, obj)
 
     def remove(self, key):
         """
@@ -237,6 +382,8 @@ class ListDict:
         else:
             raise TypeError("could not identify an appropriate key from object")
 
+        self._reset_positions()
+
     def extend(self, other, skip_keys=[]):
         """
         extend the dictionary from another ListDict object
@@ -254,7 +401,7 @@ class ListDict:
             for key, value in other.items():
                 if key in skip_keys:
                     continue
-                self._home[key] = value
+                self._set(key, value)
 
         else:
             raise TypeError(f"Cannot extend from {type(other)}")
@@ -270,6 +417,7 @@ class ListDict:
 
         if inplace:
             self._home = od
+            self._reset_positions()
         else:
             return od
 
@@ -285,6 +433,7 @@ class ListDict:
             )
 
         self._home.update(other)
+        self._reset_positions()
 
     def pop(self, key):
         """
@@ -296,8 +445,11 @@ class ListDict:
 
         """
 
-        if key in self.keys():
-            return dict([self._home.popitem(key)])
+        if key in self._home:
+            value = self._load(key)
+            del self._home[key]
+            self._reset_positions()
+            return {key: value}
         else:
             raise KeyError(f"{key} is not in ListDict keys.")
 
@@ -329,6 +481,7 @@ class ListDict:
             new_home[new_key] = obj
 
         self._home = new_home
+        self._reset_positions()
         return updates
 
     def to_dict(self, single=False, nested=False, required=False) -> None:
@@ -338,3 +491,4 @@ class ListDict:
     def clear(self) -> None:
         """Clear all items from the ListDict."""
         self._home.clear()
+        self._reset_positions()
@@ -9,10 +9,12 @@ have a look at https://github.com/pydantic/pydantic/discussions/3673.
 """
 
 import datetime
+import re
 
 # =============================================================================
 # IMPORTS
 # =============================================================================
+from functools import lru_cache
 from typing import Annotated, Optional
 
 import numpy as np
@@ -21,6 +23,7 @@ from dateutil.parser import parse as dtparser
 from loguru import logger
 from pandas._libs.tslibs import OutOfBoundsDatetime
 
+
 try:
     from obspy.core.utcdatetime import UTCDateTime  # for type hinting
 
@@ -38,6 +41,7 @@ from pydantic import (
     ValidationInfo,
 )
 
+
 # =============================================================================
 #  Get leap seconds
 # =============================================================================
@@ -171,6 +175,30 @@ def _localize_utc(stamp: pd.Timestamp) -> pd.Timestamp:
 TMIN = _localize_utc(pd.Timestamp.min)
 TMAX = _localize_utc(pd.Timestamp.max)
 
+# default time stamp, parsed once so comparisons against it are integer
+# comparisons of nanoseconds since the epoch
+DEFAULT_TIME = "1980-01-01T00:00:00+00:00"
+DEFAULT_TIME_STAMP = pd.Timestamp(DEFAULT_TIME)
+DEFAULT_TIME_NS = DEFAULT_TIME_STAMP.value
+DEFAULT_DATE = DEFAULT_TIME_STAMP.date().isoformat()
+
+# number of parsed strings to keep, time stamps repeat a lot when reading
+# files (default times, run start and end times for every channel).
+PARSE_CACHE_SIZE = 4096
+
+# strict ISO-8601 that datetime.fromisoformat can parse the same as pandas
+_ISO_8601_PATTERN = re.compile(
+    r"^\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?"
+    r"(?:Z|[+-]\d{2}:\d{2})?$"
+)
+# ISO-8601 with up to nanosecond precision, used for bulk parsing
+_ISO_8601_NS_PATTERN = (
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,9})?)?)?"
+    r"(?:Z|[+-]\d{2}:\d{2})?"
+)
+
 
 def _parse_string(dt_str: str) -> datetime.datetime:
     """
@@ -289,6 +317,8 @@ def _check_timestamp(pd_timestamp):
     t_min_max = False
     pd_timestamp = _localize_utc(pd_timestamp)
 
+    # compare time stamps, not nanoseconds, the value of a time stamp outside
+    # of the nanosecond bounds cannot be converted to nanoseconds
     if pd_timestamp <= TMIN:
         t_min_max = True
         pd_timestamp = TMIN
@@ -344,6 +374,63 @@ def parse(
     - Timestamps outside pandas bounds are clamped to min/max values
     - GPS time conversion uses calculated leap seconds for the date
     - All outputs are forced to UTC timezone regardless of input timezone
+    - Parsed strings are cached, see `PARSE_CACHE_SIZE`
+    """
+    if type(dt_str) is str:
+        return _parse_cached(dt_str, gps_time)
+    if type(dt_str) is MTime and not gps_time:
+        # already parsed, pd.Timestamp is immutable so it can be shared
+        return dt_str.time_stamp
+    return _parse(dt_str, gps_time=gps_time)
+
+
+def _to_time_stamp(
+    value: float | int | np.datetime64 | pd.Timestamp | str,
+) -> pd.Timestamp:
+    """
+    Get the time stamp of an MTime, or parse any other value, to compare
+    against an MTime without creating one.
+    """
+    if isinstance(value, MTime):
+        return value.time_stamp
+    return parse(value)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(dt_str: str, gps_time: bool) -> pd.Timestamp:
+    """
+    Parse a string with `_parse`, keeping the most recent results.
+
+    pd.Timestamp is immutable so the cached value can be shared.
+    """
+    return _parse(dt_str, gps_time=gps_time)
+
+
+def _parse_iso_8601(dt_str: str) -> pd.Timestamp | None:
+    """
+    Parse a strict ISO-8601 string without going through the generic
+    pandas/dateutil string parsers.
+
+    Returns None if the string is not strict ISO-8601 so the caller can
+    fall back on the generic parsers.
+    """
+    if _ISO_8601_PATTERN.match(dt_str) is None:
+        return None
+    try:
+        return pd.Timestamp(datetime.datetime.fromisoformat(dt_str))
+    except ValueError:
+        # for example T24:00:00, let the generic parsers deal with it
+        return None
+
+
+def _parse(
+    dt_str: Optional[
+        float | int | np.number | np.datetime64 | pd.Timestamp | str | dict
+    ] = None,
+    gps_time: bool = False,
+) -> pd.Timestamp:
+    """
+    Parse a datetime input into a pandas Timestamp, see `parse`.
     """
     t_min_max = False
     if dt_str in [None, "", "none", "None", "NONE", "Na", {}]:
@@ -385,7 +472,12 @@ def parse(
                 gps_time = dt_str.get("gps_time", gps_time)
                 dt_str = dt_str.get("time_stamp", "1980-01-01T00:00:00+00:00")
 
-            t_min_max, stamp = _check_timestamp(pd.Timestamp(dt_str))
+            stamp = None
+            if isinstance(dt_str, str):
+                stamp = _parse_iso_8601(dt_str)
+            if stamp is None:
+                stamp = pd.Timestamp(dt_str)
+            t_min_max, stamp = _check_timestamp(stamp)
         except (ValueError, TypeError, OutOfBoundsDatetime, OverflowError):
             dt = _parse_string(dt_str)
             stamp, t_min_max = _fix_out_of_bounds_time_stamp(dt)
@@ -410,6 +502,108 @@ def parse(
     return _localize_utc(stamp)
 
 
+def parse_many(
+    values: np.ndarray | pd.Series | pd.Index | list | tuple,
+    gps_time: bool = False,
+) -> pd.DatetimeIndex:
+    """
+    Parse an array of time stamps in one call.
+
+    Columns of ISO-8601 strings and numpy datetime64 arrays are converted
+    with one vectorized pandas call, anything else (including GPS time) is
+    parsed value by value with `parse`, which caches repeated strings.  Null
+    values and values outside of the nanosecond bounds are always parsed
+    with `parse`.  Each value gets the same
+    treatment as `parse`: null values are set to 1980-01-01, values are
+    clamped to TMIN/TMAX and GPS time is converted to UTC.
+
+    Parameters
+    ----------
+    values : np.ndarray, pd.Series, pd.Index, list or tuple
+        Time stamps in any format accepted by `parse`.
+    gps_time : bool, optional
+        If True, converts GPS time to UTC by subtracting leap seconds.
+        Default is False.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        UTC time stamps in the same order as the input.
+
+    Examples
+    --------
+    >>> parse_many(["2020-01-01T00:00:00+00:00", "2020-01-02T00:00:00"])
+    DatetimeIndex(['2020-01-01 00:00:00+00:00', '2020-01-02 00:00:00+00:00'],
+                  dtype='datetime64[us, UTC]', freq=None)
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy()
+    values = np.asarray(values)
+    if values.ndim == 0:
+        values = values.reshape(1)
+    elif values.ndim > 1:
+        values = values.ravel()
+
+    stamps = None
+    if not gps_time:
+        if np.issubdtype(values.dtype, np.datetime64):
+            # an array of only NaT can have no unit, let parse deal with it
+            if np.datetime_data(values.dtype)[0] != "generic":
+                stamps = pd.DatetimeIndex(values).tz_localize("UTC")
+        elif values.size > 0 and values.dtype.kind in "OU":
+            stamps = _parse_many_iso_8601(values)
+
+    if stamps is None:
+        return pd.DatetimeIndex(
+            [
+                parse(value, gps_time=gps_time).tz_convert("UTC")
+                for value in values.tolist()
+            ]
+        )
+
+    # same machine round off correction as parse
+    round_off = np.asarray(stamps.nanosecond) > 500
+    if round_off.any():
+        stamps = stamps.where(~round_off, stamps.round(freq="us"))
+
+    # null values and values outside of the nanosecond bounds are rare, parse
+    # them one by one so they get the default time stamp or are clamped
+    # exactly like parse does
+    special = np.asarray(stamps.isna() | (stamps <= TMIN) | (stamps >= TMAX))
+    if special.any():
+        stamps = pd.DatetimeIndex(
+            [
+                parse(value).tz_convert("UTC") if is_special else stamp
+                for value, stamp, is_special in zip(values, stamps, special)
+            ]
+        )
+    return stamps
+
+
+def _parse_many_iso_8601(values: np.ndarray) -> pd.DatetimeIndex | None:
+    """
+    Parse an array of ISO-8601 strings in one pandas call.
+
+    Returns None if any value is not an ISO-8601 string (null values
+    excepted) so the caller can fall back on parsing value by value.
+    """
+    strings = pd.Series(values, dtype=object)
+    is_null = strings.isin(["", "none", "None", "NONE", "Na"]) | strings.isna()
+    strings = strings[~is_null]
+    if not strings.map(type).eq(str).all():
+        return None
+    if not strings.str.fullmatch(_ISO_8601_NS_PATTERN).all():
+        return None
+    try:
+        parsed = pd.to_datetime(strings, format="ISO8601", utc=True)
+    except (ValueError, OutOfBoundsDatetime, OverflowError):
+        return None
+
+    stamps = pd.Series(pd.NaT, index=range(values.size), dtype=parsed.dtype)
+    stamps[strings.index] = parsed
+    return pd.DatetimeIndex(stamps)
+
+
 # ==============================================================================
 # convenience date-time container
 # ==============================================================================
@@ -478,7 +672,7 @@ class MTime(BaseModel):
     1767225045.0
     """
 
-    _default_time: str = PrivateAttr("1980-01-01T00:00:00+00:00")
+    _default_time: str = PrivateAttr(DEFAULT_TIME)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -592,7 +786,7 @@ class MTime(BaseModel):
         equal.
 
         The input will be parsed first into a pd.Timestamp object and then
-        compared to the current time stamp.
+        the nanoseconds since the epoch are compared.
 
         Parameters
         ----------
@@ -604,27 +798,21 @@ class MTime(BaseModel):
         bool
             if equal return True, otherwise False
         """
-        if not isinstance(other, MTime):
-            try:
-                other = MTime(time_stamp=other)
-            except Exception as e:
-                logger.debug(f"Failed to convert {other} to MTime: {e}")
-                return False
-
-        epoch_seconds = bool(self.time_stamp.value == other.time_stamp.value)
+        try:
+            other_stamp = _to_time_stamp(other)
+        except Exception as e:
+            logger.debug(f"Failed to convert {other} to MTime: {e}")
+            return False
 
-        tz = bool(self.time_stamp.tz == other.time_stamp.tz)
+        if self.time_stamp.value != other_stamp.value:
+            return False
 
-        if epoch_seconds and tz:
+        if self.time_stamp.tz == other_stamp.tz:
             return True
-        elif epoch_seconds and not tz:
-            logger.info(
-                f"Time zones are not equal {self.time_stamp.tz} != "
-                f"{other.time_stamp.tz}"
-            )
-            return False
-        elif not epoch_seconds:
-            return False
+        logger.info(
+            f"Time zones are not equal {self.time_stamp.tz} != {other_stamp.tz}"
+        )
+        return False
 
     def __ne__(
         self,
@@ -662,10 +850,7 @@ class MTime(BaseModel):
         bool
             _True if other is less than the current time stamp, otherwise False
         """
-        if not isinstance(other, MTime):
-            other = MTime(time_stamp=other)
-
-        return bool(self.time_stamp < other.time_stamp)
+        return self.time_stamp.value < _to_time_stamp(other).value
 
     def __le__(
         self,
@@ -685,10 +870,7 @@ class MTime(BaseModel):
             True if other is less than or equal to the current time stamp,
             otherwise False
         """
-        if not isinstance(other, MTime):
-            other = MTime(time_stamp=other)
-
-        return bool(self.time_stamp <= other.time_stamp)
+        return self.time_stamp.value <= _to_time_stamp(other).value
 
     def __gt__(
         self,
@@ -727,10 +909,7 @@ class MTime(BaseModel):
             True if other is greater than or equal to the current time stamp,
             otherwise False
         """
-        if not isinstance(other, MTime):
-            other = MTime(time_stamp=other)
-
-        return bool(self.time_stamp >= other.time_stamp)
+        return self.time_stamp.value >= _to_time_stamp(other).value
 
     def __add__(
         self, other: int | float | datetime.timedelta | np.timedelta64
@@ -782,31 +961,30 @@ class MTime(BaseModel):
 
         else:
             try:
-                other = MTime(time_stamp=other)
+                other = parse(other)
             except ValueError as error:
                 raise TypeError(error)
 
-        if not isinstance(other, (pd.Timedelta, MTime)):
+        if not isinstance(other, (pd.Timedelta, pd.Timestamp)):
             msg = "Subtracting times must be either timedelta or another time."
             logger.error(msg)
             raise ValueError(msg)
 
-        if isinstance(other, MTime):
-            other = MTime(time_stamp=other)
-
-            return (self.time_stamp - other.time_stamp).total_seconds()
+        if isinstance(other, pd.Timestamp):
+            return (self.time_stamp - other).total_seconds()
 
         elif isinstance(other, pd.Timedelta):
             return MTime(time_stamp=self.time_stamp - other)
 
     def __hash__(self) -> int:
+        # equal to the hash of the ISO string, which compares equal
         return hash(self.isoformat())
 
     def is_default(self) -> bool:
         """
         Test if the time_stamp value is the default value
         """
-        return self.time_stamp == pd.Timestamp(self._default_time)
+        return self.time_stamp.value == DEFAULT_TIME_NS
 
     def to_dict(self, nested=False, single=False, required=True) -> str:
         """
@@ -863,6 +1041,19 @@ class MTime(BaseModel):
         """
         return self.time_stamp.isoformat().split("+", 1)[0]
 
+    @property
+    def epoch_nanoseconds(self) -> int:
+        """
+        Nanoseconds since the epoch (1970-01-01 00:00:00 UTC), the value
+        used to compare time stamps.
+
+        Returns
+        -------
+        int
+            nanoseconds since the epoch.
+        """
+        return self.time_stamp.value
+
     @property
     def epoch_seconds(self) -> float:
         """
@@ -1224,7 +1415,7 @@ class MDate(MTime):
         """
         Test if time_stamp is the default value
         """
-        return self.isoformat() == pd.Timestamp(self._default_time).date().isoformat()
+        return self.isodate() == DEFAULT_DATE
 
     def isoformat(self) -> str:
         """
@@ -8,7 +8,7 @@ import pandas as pd
 from pydantic import Field, field_validator, ValidationInfo
 
 from mt_metadata.base import MetadataBase
-from mt_metadata.common.mttime import MDate, MTime
+from mt_metadata.common.mttime import DEFAULT_DATE, MDate, MTime
 
 
 # =====================================================
@@ -59,12 +59,16 @@ class TimePeriod(MetadataBase):
         """
         Check if the start time is the default time.
         """
+        if isinstance(self.start, MTime):
+            return self.start.is_default()
         return MTime(time_stamp=self.start).is_default()
 
     def end_is_default(self) -> bool:
         """
         Check if the end time is the default time.
         """
+        if isinstance(self.end, MTime):
+            return self.end.is_default()
         return MTime(time_stamp=self.end).is_default()
 
 
@@ -116,10 +120,15 @@ class TimePeriodDate(MetadataBase):
         """
         Check if the start time is the default time.
         """
+        # validated dates are stored as ISO date strings
+        if isinstance(self.start_date, str):
+            return self.start_date == DEFAULT_DATE
         return MDate(time_stamp=self.start_date).is_default()
 
     def end_is_default(self) -> bool:
         """
         Check if the end time is the default time.
         """
+        if isinstance(self.end_date, str):
+            return self.end_date == DEFAULT_DATE
         return MDate(time_stamp=self.end_date).is_default()
@@ -10,6 +10,7 @@ case strings.
 """
 
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Annotated
 
 # =============================================================================
@@ -180,6 +181,36 @@ for prefix_name, prefix_symbol in prefixes.items():
 UNITS_DF = pd.DataFrame(all_units)
 
 
+def _build_unit_index(key: str, lower: bool = False) -> dict[str, int]:
+    """
+    Map a column of ``all_units`` to the position of its first matching row.
+
+    Parameters
+    ----------
+    key : str
+        Column to index, "name" or "symbol".
+    lower : bool, optional
+        Index on the lower-cased value, by default False
+
+    Returns
+    -------
+    dict[str, int]
+        Column value to row position, first occurrence wins.
+    """
+    index = {}
+    for position, row in enumerate(all_units):
+        value = row[key].lower() if lower else row[key]
+        index.setdefault(value, position)
+    return index
+
+
+# hash indices into all_units so unit lookups do not scan UNITS_DF
+_NAME_LOWER_INDEX = _build_unit_index("name", lower=True)
+_SYMBOL_INDEX = _build_unit_index("symbol")
+_SYMBOL_LOWER_INDEX = _build_unit_index("symbol", lower=True)
+UNIT_CACHE_SIZE = 1024
+
+
 class Unit(BaseModel):
     model_config = ConfigDict(
         validate_assignment=True,
@@ -376,6 +407,12 @@ def get_unit_object(unit: str, allow_none=True) -> Unit:
             plot_label="Unknown",
         )
 
+    record = _get_unit_record(unit)
+    if record is not None:
+        return Unit(**record)
+
+    # at least one component is unknown, resolve again so the warning is
+    # logged or the KeyError is raised
     units_parts = parse_unit_string(unit)
     if len(units_parts) == 1:
         return get_unit_from_df(units_parts[0]["name"], allow_none=allow_none)
@@ -392,6 +429,72 @@ def get_unit_object(unit: str, allow_none=True) -> Unit:
     return unit
 
 
+def _find_unit_position(value: str) -> int | None:
+    """
+    Find the row of ``all_units`` matching a unit name or symbol.
+
+    The name is matched case-insensitively and the symbol exactly, so 'mV'
+    resolves to milliVolt rather than megaVolt.  Single character inputs fall
+    back to a case-insensitive symbol match ('M' -> meter) while longer ones
+    do not ('ft' stays unknown rather than becoming 'fT').
+
+    Parameters
+    ----------
+    value : str
+        The name or symbol of the unit to search for.
+
+    Returns
+    -------
+    int | None
+        Position in ``all_units`` of the first match, None if not found.
+    """
+    value_lower = value.lower()
+    name_position = _NAME_LOWER_INDEX.get(value_lower)
+    symbol_position = _SYMBOL_INDEX.get(value)
+    if name_position is None:
+        position = symbol_position
+    elif symbol_position is None:
+        position = name_position
+    else:
+        position = min(name_position, symbol_position)
+
+    if position is None and len(value) == 1:
+        position = _SYMBOL_LOWER_INDEX.get(value_lower)
+    return position
+
+
+@lru_cache(maxsize=UNIT_CACHE_SIZE)
+def _get_unit_record(unit: str) -> dict | None:
+    """
+    Resolve a possibly compound unit string into a unit record.
+
+    Results are memoized, callers should build a new :class:`Unit` from the
+    record so cached values are never mutated.
+
+    Parameters
+    ----------
+    unit : str
+        Unit string, e.g. "mV/km".
+
+    Returns
+    -------
+    dict | None
+        Unit record, None if any component of the unit is unknown.
+    """
+    unit_object = None
+    for entry in parse_unit_string(unit):
+        position = _find_unit_position(entry["name"])
+        if position is None:
+            return None
+        if unit_object is None:
+            unit_object = Unit(**all_units[position])
+        else:
+            unit_object = unit_object.combine(
+                Unit(**all_units[position]), separator=entry["sep"]
+            )
+    return unit_object.to_dict()
+
+
 def get_unit_from_df(value: str, allow_none=True) -> Unit:
     """
     Retrieve a row from the UNITS_DF DataFrame based on the unit's name or symbol.
@@ -411,22 +514,11 @@ def get_unit_from_df(value: str, allow_none=True) -> Unit:
     KeyError
         If the unit is not found in the DataFrame.
     """
-    # First try exact match for symbol (case-sensitive) to handle prefixes correctly
-    # (e.g., 'mV' should match milliVolt, not megaVolt)
-    unit_row = UNITS_DF[
-        (UNITS_DF["name"].str.lower() == value.lower()) | (UNITS_DF["symbol"] == value)
-    ]
-
-    # If no exact match, try case-insensitive symbol match only for single-character inputs
-    # This handles cases like 'M' -> 'meter' while preserving 'ft' as unknown (not 'fT')
-    if unit_row.empty and len(value) == 1:
-        unit_row = UNITS_DF[UNITS_DF["symbol"].str.lower() == value.lower()]
+    position = _find_unit_position(value)
 
     # Check if a match was found
-    if not unit_row.empty:
-        return Unit(
-            **unit_row.iloc[0].to_dict()
-        )  # Return the first matching row as a Series
+    if position is not None:
+        return Unit(**all_units[position])
     else:
         if allow_none:
             logger.warning(
@@ -9,6 +9,7 @@ from pydantic import computed_field, Field, field_validator, ValidationInfo
 
 from mt_metadata.base import MetadataBase
 from mt_metadata.common import TimePeriod
+from mt_metadata.common.mttime import parse_many
 from mt_metadata.processing.aurora.run import Run
 
 
@@ -181,8 +182,8 @@ class Station(MetadataBase):
 
         df = pd.DataFrame(data_list)
         if len(df) > 0:
-            df["start"] = pd.to_datetime(df["start"])
-            df["end"] = pd.to_datetime(df["end"])
+            df["start"] = parse_many(df["start"])
+            df["end"] = parse_many(df["end"])
 
         return df
 
@@ -16,20 +16,35 @@ Created on Mon Feb  8 21:25:40 2021
 """
 
 import json
+import pickle
+import struct
 
 # =============================================================================
 # Imports
 # =============================================================================
 from collections import OrderedDict
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Callable, Iterator
 from xml.etree import cElementTree as et
 
+import numpy as np
+import pandas as pd
 from loguru import logger
 from pydantic import computed_field, Field, field_validator
 
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow = None
+    pq = None
+
+from mt_metadata import __version__
 from mt_metadata.base import helpers, MetadataBase
+from mt_metadata.base.helpers import requires
 from mt_metadata.common.list_dict import ListDict
+from mt_metadata.utils.interval_index import RunIntervalIndex
 
 from . import Auxiliary, Electric, Magnetic, Run, Station, Survey
 from .filters import (
@@ -40,6 +55,96 @@ from .filters import (
     TimeDelayFilter,
 )
 
+
+# =============================================================================
+# Binary snapshot layout: magic, mt_metadata version, header, buffer lengths,
+# pickle payload, out-of-band buffers
+_PICKLE_MAGIC = b"MTMETADATA-EXPERIMENT\n"
+_PICKLE_FORMAT_VERSION = 1
+_PICKLE_PROTOCOL = 5
+_PICKLE_HEADER = struct.Struct("<HQQ")
+_PICKLE_BUFFER_LENGTH = struct.Struct("<Q")
+_PICKLE_STRING_LENGTH = struct.Struct("<H")
+
+
+def _pack_header_string(value: str) -> bytes:
+    """Pack a string as its length followed by its utf-8 bytes."""
+    encoded = value.encode("utf-8")
+    return _PICKLE_STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+def _read_header_string(fid) -> str:
+    """Read a string written by `_pack_header_string`."""
+    (length,) = _PICKLE_STRING_LENGTH.unpack(fid.read(_PICKLE_STRING_LENGTH.size))
+    return fid.read(length).decode("utf-8")
+
+
+# =============================================================================
+# Columnar tables: name of each table and the columns that link a row to its
+# parent, the other columns are the dotted attribute names of the level
+_TABLE_KEYS = {
+    "surveys": [],
+    "stations": ["survey_id"],
+    "runs": ["survey_id", "station_id"],
+    "channels": ["survey_id", "station_id", "run_id"],
+    "filters": ["survey_id"],
+}
+# parquet schema metadata key listing the columns stored as json
+_PARQUET_JSON_COLUMNS = b"mt_metadata.json_columns"
+
+
+def _rows_to_dataframe(rows: list[dict], keys: list[str]) -> pd.DataFrame:
+    """Make a table with the key columns first then sorted attributes."""
+    df = pd.DataFrame(rows)
+    attributes = sorted(column for column in df.columns if column not in keys)
+    return df.reindex(columns=keys + attributes)
+
+
+def _is_missing(value) -> bool:
+    """Is a table cell empty."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return True
+    return isinstance(value, float) and np.isnan(value)
+
+
+def _expand_collapsed_values(row: dict) -> dict:
+    """
+    A comment with only a value is written as a string in the column of the
+    comment, move it to <column>.value when the row also has attributes of
+    the comment so they do not replace it.
+    """
+    for key in [key for key, value in row.items() if isinstance(value, str)]:
+        prefix = f"{key}."
+        if f"{prefix}value" not in row and any(
+            other.startswith(prefix) for other in row
+        ):
+            row[f"{prefix}value"] = row.pop(key)
+    return row
+
+
+def _dataframe_to_rows(df: pd.DataFrame | None) -> list[dict]:
+    """Rows of a table as dictionaries without the empty cells."""
+    if df is None:
+        return []
+    return [
+        _expand_collapsed_values(
+            {
+                key: value.item() if isinstance(value, np.generic) else value
+                for key, value in row.items()
+                if not _is_missing(value)
+            }
+        )
+        for row in df.to_dict(orient="records")
+    ]
+
+
+def _decode_json_object(obj: dict):
+    """Complex arrays are written by NumpyEncoder as real and imag lists."""
+    if set(obj.keys()) == {"real", "imag"}:
+        return np.array(obj["real"]) + 1j * np.array(obj["imag"])
+    return obj
+
+
 # =============================================================================
 
 
@@ -186,9 +291,10 @@ class Experiment(MetadataBase):
 
         """
 
-        if self.has_survey(survey_id):
-            return self.survey_names.index(survey_id)
-        return None
+        try:
+            return self.surveys.index(survey_id)
+        except KeyError:
+            return None
 
     def add_survey(self, survey_obj: "Survey") -> None:
         """
@@ -229,6 +335,17 @@ class Experiment(MetadataBase):
             logger.warning(f"Could not find survey {survey_id}")
             return None
 
+    def run_interval_index(self) -> RunIntervalIndex:
+        """
+        Build an interval index over the runs of every station in every
+        survey, used to find runs that overlap in time.
+
+        :return: index of the run time periods
+        :rtype: :class:`mt_metadata.utils.interval_index.RunIntervalIndex`
+
+        """
+        return RunIntervalIndex.from_surveys(self.surveys)
+
     def remove_survey(self, survey_id: str, update: bool = True) -> None:
         """
         Remove a survey from the experiment
@@ -429,7 +546,7 @@ class Experiment(MetadataBase):
 
         if fn:
             with open(fn, "w") as fid:
-                fid.write(helpers.element_to_string(experiment_element))
+                helpers.write_element(experiment_element, fid)
         return experiment_element
 
     def from_xml(
@@ -438,61 +555,277 @@ class Experiment(MetadataBase):
         element: et.Element | None = None,
         sort: bool = True,
         skip_none: bool = True,
+        lazy: bool = False,
     ) -> None:
         """
+        Read an MT-XML file or element.
+
+        A file is read with `iterparse`, each station is converted as soon as
+        its end tag is parsed and its element is freed.
+
+        :param fn: MT-XML file name, defaults to None
+        :type fn: str | Path, optional
+        :param element: experiment element, used instead of fn,
+         defaults to None
+        :type element: et.Element | None, optional
+        :param sort: sort surveys, stations, runs and channels,
+         defaults to True
+        :type sort: bool, optional
+        :param skip_none: skip null values, defaults to True
+        :type skip_none: bool, optional
+        :param lazy: only create each station the first time it is accessed
+         through `survey.stations`, defaults to False
+        :type lazy: bool, optional
 
-        :param fn: DESCRIPTION, defaults to None
-        :type fn: TYPE, optional
-        :param element: DESCRIPTION, defaults to None
-        :type element: TYPE, optional
-        :return: DESCRIPTION
-        :rtype: TYPE
+        """
+        if element is not None:
+            xml_elements = self._iter_xml_element(element)
+        elif fn:
+            xml_elements = self._iterparse_xml(fn)
+        else:
+            return
+
+        survey_obj = None
+        for tag, xml_element in xml_elements:
+            if tag == "survey":
+                if survey_obj is not None:
+                    self._add_xml_survey(survey_obj, sort, lazy)
+                survey_obj = self._survey_from_element(xml_element, skip_none)
+            elif lazy:
+                station_id = xml_element.findtext("id", "").strip()
+                # the elements of a file are cleared once they are read
+                if element is None:
+                    xml_element = et.tostring(xml_element)
+                survey_obj.stations.set_lazy(
+                    station_id, self._station_loader(xml_element, skip_none, sort)
+                )
+            else:
+                survey_obj.add_station(
+                    self._station_from_element(xml_element, skip_none), update=False
+                )
+        if survey_obj is not None:
+            self._add_xml_survey(survey_obj, sort, lazy)
 
+    def _add_xml_survey(self, survey_obj: Survey, sort: bool, lazy: bool) -> None:
+        """
+        Add a survey read from MT-XML once all its stations are read.
 
+        :param survey_obj: survey with its stations
+        :type survey_obj: Survey
+        :param sort: sort surveys, stations, runs and channels
+        :type sort: bool
+        :param lazy: stations are created the first time they are accessed
+        :type lazy: bool
 
         """
-        if fn:
-            experiment_element = et.parse(fn).getroot()
-        if element is not None:
-            experiment_element = element
-
-        # need to set the lists for each layer, otherwise you get duplicates.
-        for survey_element in list(experiment_element):
-            survey_dict = helpers.element_to_dict(survey_element)
-            stations = self._pop_dictionary(survey_dict["survey"], "station")
-            survey_obj = Survey()
-            survey_obj.from_dict(survey_dict, skip_none=skip_none)
-            fd = survey_dict["survey"].pop("filters")
-            filter_dict = self._read_filter_dict(fd)
-            survey_obj.filters.update(filter_dict)
-
-            for station_dict in stations:
-                station_obj = Station()
-                runs = self._pop_dictionary(station_dict, "run")
-                station_obj.from_dict(station_dict, skip_none=skip_none)
-                for run_dict in runs:
-                    run_obj = Run()
-
-                    for ch in ["electric", "magnetic", "auxiliary"]:
-                        try:
-                            for ch_dict in self._pop_dictionary(run_dict, ch):
-                                if ch == "electric":
-                                    channel = Electric()
-                                elif ch == "magnetic":
-                                    channel = Magnetic()
-                                elif ch == "auxiliary":
-                                    channel = Auxiliary()
-                                channel.from_dict(ch_dict, skip_none=skip_none)
-                                run_obj.add_channel(channel)
-                        except KeyError:
-                            logger.debug(f"Could not find channel {ch}")
-                    run_obj.from_dict(run_dict, skip_none=skip_none)
-                    station_obj.add_run(run_obj)
-                survey_obj.add_station(station_obj)
+        if lazy:
             self.add_survey(survey_obj)
+            if sort:
+                self.surveys.sort()
+                survey_obj.stations.sort()
+            return
+
+        if survey_obj.n_stations > 0:
+            survey_obj.update_bounding_box()
+            survey_obj.update_time_period()
+            survey_obj.update_station_keys()
+        self.add_survey(survey_obj)
+        if sort:
+            self.sort()
+
+    def iterparse_xml(
+        self, fn: str | Path, skip_none: bool = True
+    ) -> Iterator[Survey | Station]:
+        """
+        Stream an MT-XML file.
+
+        Each Survey is yielded when its first station starts, with the
+        survey metadata and filters but not the stations, then each Station
+        is yielded as soon as its end tag is parsed.  The elements are freed
+        once they are converted.
+
+        :param fn: MT-XML file name
+        :type fn: str | Path
+        :param skip_none: skip null values, defaults to True
+        :type skip_none: bool, optional
+        :return: Survey and Station objects in file order
+        :rtype: Iterator[Survey | Station]
+
+        """
+        for tag, xml_element in self._iterparse_xml(fn):
+            if tag == "survey":
+                yield self._survey_from_element(xml_element, skip_none)
+            else:
+                yield self._station_from_element(xml_element, skip_none)
+
+    def _iterparse_xml(self, fn: str | Path) -> Iterator[tuple[str, et.Element]]:
+        """
+        Parse an MT-XML file with `iterparse`.
+
+        A survey element is yielded as ("survey", element) when its first
+        station starts, or at its end tag if it has no stations.  It holds
+        the survey metadata and filters, which are written before the
+        stations, and they are cleared once the survey is converted.  Each
+        station element is yielded as ("station", element) at its end tag
+        and is cleared and removed from the tree once it is converted.
+
+        :param fn: MT-XML file name
+        :type fn: str | Path
+        :return: tag and element of each survey and station in file order
+        :rtype: Iterator[tuple[str, et.Element]]
+
+        """
+        depth = 0
+        root = None
+        survey_element = None
+        survey_yielded = False
+        for event, element in et.iterparse(fn, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = element
+                elif depth == 2:
+                    survey_element = element
+                    survey_yielded = False
+                elif depth == 3 and element.tag == "station" and not survey_yielded:
+                    yield "survey", survey_element
+                    survey_yielded = True
+                    for child in list(survey_element):
+                        if child.tag != "station":
+                            survey_element.remove(child)
+                continue
+
+            if depth == 3 and element.tag == "station":
+                yield "station", element
+                element.clear()
+                survey_element.remove(element)
+            elif depth == 2:
+                if not survey_yielded:
+                    yield "survey", element
+                elif len(element):
+                    logger.warning(
+                        f"Survey metadata after the stations of {fn} is skipped"
+                    )
+                root.remove(element)
+            depth -= 1
+
+    def _iter_xml_element(
+        self, element: et.Element
+    ) -> Iterator[tuple[str, et.Element]]:
+        """
+        Surveys and stations of an experiment element in the same order as
+        `_iterparse_xml`.
+
+        :param element: experiment element
+        :type element: et.Element
+        :return: tag and element of each survey and station
+        :rtype: Iterator[tuple[str, et.Element]]
+
+        """
+        for survey_element in element:
+            yield "survey", survey_element
+            for station_element in survey_element:
+                if station_element.tag == "station":
+                    yield "station", station_element
+
+    def _survey_from_element(
+        self, survey_element: et.Element, skip_none: bool = True
+    ) -> Survey:
+        """
+        Create a Survey with its filters from a survey element, stations
+        are skipped.
+
+        :param survey_element: survey element
+        :type survey_element: et.Element
+        :param skip_none: skip null values, defaults to True
+        :type skip_none: bool, optional
+        :return: survey without stations
+        :rtype: Survey
+
+        """
+        survey_copy = et.Element(survey_element.tag, survey_element.attrib)
+        survey_copy.text = survey_element.text
+        survey_copy.extend(
+            [child for child in survey_element if child.tag != "station"]
+        )
+        survey_dict = helpers.element_to_dict(survey_copy)
+        survey_obj = Survey()
+        survey_obj.from_dict(survey_dict, skip_none=skip_none)
+        fd = survey_dict[survey_element.tag].pop("filters")
+        filter_dict = self._read_filter_dict(fd)
+        survey_obj.filters.update(filter_dict)
+        return survey_obj
+
+    def _station_from_element(
+        self, station_element: et.Element | bytes, skip_none: bool = True
+    ) -> Station:
+        """
+        Create a Station with its runs and channels from a station element.
 
+        :param station_element: station element or serialized element
+        :type station_element: et.Element | bytes
+        :param skip_none: skip null values, defaults to True
+        :type skip_none: bool, optional
+        :return: station
+        :rtype: Station
+
+        """
+        if isinstance(station_element, bytes):
+            station_element = et.fromstring(station_element)
+        station_dict = helpers.element_to_dict(station_element)["station"]
+        station_obj = Station()
+        runs = self._pop_dictionary(station_dict, "run")
+        station_obj.from_dict(station_dict, skip_none=skip_none)
+        for run_dict in runs:
+            run_obj = Run()
+
+            for ch in ["electric", "magnetic", "auxiliary"]:
+                try:
+                    for ch_dict in self._pop_dictionary(run_dict, ch):
+                        if ch == "electric":
+                            channel = Electric()
+                        elif ch == "magnetic":
+                            channel = Magnetic()
+                        elif ch == "auxiliary":
+                            channel = Auxiliary()
+                        channel.from_dict(ch_dict, skip_none=skip_none)
+                        run_obj.add_channel(channel)
+                except KeyError:
+                    logger.debug(f"Could not find channel {ch}")
+            run_obj.from_dict(run_dict, skip_none=skip_none)
+            station_obj.add_run(run_obj)
+        return station_obj
+
+    def _station_loader(
+        self,
+        station_element: et.Element | bytes,
+        skip_none: bool = True,
+        sort: bool = True,
+    ) -> Callable[[], Station]:
+        """
+        Function that creates a station from its element when it is first
+        accessed, used by `from_xml(lazy=True)`.
+
+        :param station_element: station element or serialized element
+        :type station_element: et.Element | bytes
+        :param skip_none: skip null values, defaults to True
+        :type skip_none: bool, optional
+        :param sort: sort the runs and channels, defaults to True
+        :type sort: bool, optional
+        :return: function that returns the station
+        :rtype: Callable[[], Station]
+
+        """
+
+        def load_station() -> Station:
+            station_obj = self._station_from_element(station_element, skip_none)
             if sort:
-                self.sort()
+                station_obj.runs.sort()
+                for run in station_obj.runs:
+                    run.channels.sort()
+            return station_obj
+
+        return load_station
 
     def _pop_dictionary(self, in_dict: dict, element: str) -> list:
         """
@@ -513,27 +846,252 @@ class Experiment(MetadataBase):
 
         return elements
 
-    def to_pickle(self, fn: str | Path = None) -> None:
+    def to_pickle(self, fn: str | Path) -> None:
         """
-        Write a pickle version of the experiment
+        Write a binary snapshot of the experiment.
 
-        :param fn: DESCRIPTION
-        :type fn: TYPE
-        :return: DESCRIPTION
-        :rtype: TYPE
+        The experiment is pickled with protocol 5, numpy arrays are written
+        as raw out-of-band buffers after a versioned header.  Lazy stations
+        are created before writing.
+
+        :param fn: file name to write to
+        :type fn: str | Path
+
+        """
+        buffers = []
+        payload = pickle.dumps(
+            self, protocol=_PICKLE_PROTOCOL, buffer_callback=buffers.append
+        )
+        buffers = [buffer.raw() for buffer in buffers]
+
+        with open(fn, "wb") as fid:
+            fid.write(_PICKLE_MAGIC)
+            fid.write(_pack_header_string(__version__))
+            fid.write(
+                _PICKLE_HEADER.pack(_PICKLE_FORMAT_VERSION, len(buffers), len(payload))
+            )
+            for buffer in buffers:
+                fid.write(_PICKLE_BUFFER_LENGTH.pack(buffer.nbytes))
+            fid.write(payload)
+            for buffer in buffers:
+                fid.write(buffer)
+
+    def from_pickle(self, fn: str | Path) -> None:
+        """
+        Read a binary snapshot written by `to_pickle`.
+
+        The snapshot is trusted, the metadata is restored without being
+        validated again.  Snapshots written by a different snapshot format or
+        a different version of mt_metadata are rejected.
+
+        :param fn: file name to read from
+        :type fn: str | Path
+        :raises ValueError: if the file is not an experiment snapshot or it
+         was written by a different version
 
         """
+        with open(fn, "rb") as fid:
+            if fid.read(len(_PICKLE_MAGIC)) != _PICKLE_MAGIC:
+                msg = f"{fn} is not an mt_metadata experiment snapshot"
+                logger.error(msg)
+                raise ValueError(msg)
+            version = _read_header_string(fid)
+            format_version, n_buffers, n_payload = _PICKLE_HEADER.unpack(
+                fid.read(_PICKLE_HEADER.size)
+            )
+            if format_version != _PICKLE_FORMAT_VERSION or version != __version__:
+                msg = (
+                    f"{fn} was written with snapshot format {format_version} by "
+                    f"mt_metadata {version}, expected format "
+                    f"{_PICKLE_FORMAT_VERSION} from mt_metadata {__version__}. "
+                    "Write the snapshot again."
+                )
+                logger.error(msg)
+                raise ValueError(msg)
+            lengths = [
+                _PICKLE_BUFFER_LENGTH.unpack(fid.read(_PICKLE_BUFFER_LENGTH.size))[0]
+                for _ in range(n_buffers)
+            ]
+            payload = fid.read(n_payload)
+            # bytearray so arrays backed by the buffers are writeable
+            buffers = [bytearray(fid.read(length)) for length in lengths]
+
+        experiment = pickle.loads(payload, buffers=buffers)
+        if not isinstance(experiment, Experiment):
+            msg = f"{fn} does not contain an Experiment, found {type(experiment)}"
+            logger.error(msg)
+            raise ValueError(msg)
+        self.__setstate__(experiment.__getstate__())
 
-    def from_pickle(self, fn: str | Path = None) -> None:
+    def to_dataframes(self, required: bool = False) -> dict[str, pd.DataFrame]:
         """
-        Read pickle version of experiment
+        Flatten the experiment into one table per level.
 
-        :param fn: DESCRIPTION
-        :type fn: TYPE
-        :return: DESCRIPTION
-        :rtype: TYPE
+        Tables are surveys, stations, runs, channels and filters with one row
+        per object and one column per dotted attribute name, see
+        `get_attribute_list`.  Rows are linked to their parent by the key
+        columns survey_id, station_id and run_id.  Lazy stations are created.
+
+        :param required: only include required attributes and attributes
+         that are not None, defaults to False so that every row of a table
+         has the same columns
+        :type required: bool, optional
+        :return: table for each level
+        :rtype: dict[str, pd.DataFrame]
+
+        """
+        kwargs = {"single": True, "required": required}
+        rows = {name: [] for name in _TABLE_KEYS}
+        for survey in self.surveys:
+            survey_dict = survey.to_dict(**kwargs)
+            survey_dict.pop("stations", None)
+            survey_dict.pop("filters", None)
+            rows["surveys"].append(survey_dict)
+            for station in survey.stations:
+                station_dict = station.to_dict(**kwargs)
+                station_dict.pop("runs", None)
+                rows["stations"].append({"survey_id": survey.id, **station_dict})
+                for run in station.runs:
+                    run_dict = run.to_dict(**kwargs)
+                    run_dict.pop("channels", None)
+                    rows["runs"].append(
+                        {"survey_id": survey.id, "station_id": station.id, **run_dict}
+                    )
+                    for channel in run.channels:
+                        rows["channels"].append(
+                            {
+                                "survey_id": survey.id,
+                                "station_id": station.id,
+                                "run_id": run.id,
+                                **channel.to_dict(**kwargs),
+                            }
+                        )
+            for f_object in survey.filters.values():
+                rows["filters"].append(
+                    {"survey_id": survey.id, **f_object.to_dict(**kwargs)}
+                )
+
+        return {
+            name: _rows_to_dataframe(rows[name], keys)
+            for name, keys in _TABLE_KEYS.items()
+        }
+
+    def from_dataframes(self, dataframes: dict[str, pd.DataFrame]) -> None:
+        """
+        Fill the experiment from tables made by `to_dataframes`.
+
+        Empty cells are skipped.  Tables that are missing are treated as
+        empty.
+
+        :param dataframes: table for each level
+        :type dataframes: dict[str, pd.DataFrame]
+        :raises ValueError: if a row refers to a parent that is not in the
+         tables
+
+        """
+        surveys = OrderedDict()
+        for survey_dict in _dataframe_to_rows(dataframes.get("surveys")):
+            survey_dict["stations"] = []
+            survey_dict["filters"] = []
+            surveys[survey_dict.get("id")] = survey_dict
+
+        parents = {"surveys": surveys, "stations": {}, "runs": {}}
+        for name, parent, child in [
+            ("stations", "surveys", "runs"),
+            ("runs", "stations", "channels"),
+            ("channels", "runs", None),
+            ("filters", "surveys", None),
+        ]:
+            keys = _TABLE_KEYS[name]
+            for row in _dataframe_to_rows(dataframes.get(name)):
+                key = tuple(row.pop(column, None) for column in keys)
+                try:
+                    parent_dict = parents[parent][key[0] if len(key) == 1 else key]
+                except KeyError:
+                    msg = f"Could not find {parent[:-1]} {key} for a row of {name}"
+                    logger.error(msg)
+                    raise ValueError(msg)
+                parent_dict[name].append(row)
+                if child is not None:
+                    row[child] = []
+                    parents[name][key + (row.get("id"),)] = row
+
+        self.from_dict({"experiment": {"surveys": list(surveys.values())}})
+        # channels refer to filters by their lower case name
+        for survey in self.surveys:
+            survey.filters = ListDict(
+                [(key.lower(), value) for key, value in survey.filters.items()]
+            )
+
+    @requires(pyarrow=pyarrow)
+    def to_parquet(self, path: str | Path, required: bool = False) -> None:
+        """
+        Write the tables of `to_dataframes` as Parquet files named
+        <table>.parquet in the directory `path`.
+
+        Columns with values that Arrow cannot store, like lists and arrays,
+        are written as json strings and converted back by `from_parquet`.
+        Requires pyarrow.
+
+        :param path: directory to write to, created if it does not exist
+        :type path: str | Path
+        :param required: only include required attributes and attributes
+         that are not None, defaults to False
+        :type required: bool, optional
+
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name, df in self.to_dataframes(required=required).items():
+            json_columns = []
+            for column in df.columns[df.dtypes == object]:
+                values = df[column]
+                if all(isinstance(v, str) or _is_missing(v) for v in values):
+                    continue
+                df[column] = [
+                    None
+                    if _is_missing(value)
+                    else json.dumps(value, cls=helpers.NumpyEncoder)
+                    for value in values
+                ]
+                json_columns.append(column)
+
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[_PARQUET_JSON_COLUMNS] = json.dumps(json_columns).encode()
+            pq.write_table(
+                table.replace_schema_metadata(metadata),
+                path.joinpath(f"{name}.parquet"),
+            )
+
+    @requires(pyarrow=pyarrow)
+    def from_parquet(self, path: str | Path) -> None:
+        """
+        Read Parquet files written by `to_parquet`. Requires pyarrow.
+
+        :param path: directory with the <table>.parquet files
+        :type path: str | Path
 
         """
+        path = Path(path)
+        dataframes = {}
+        for name in _TABLE_KEYS:
+            fn = path.joinpath(f"{name}.parquet")
+            if not fn.exists():
+                continue
+            table = pq.read_table(fn)
+            metadata = table.schema.metadata or {}
+            df = table.to_pandas()
+            for column in json.loads(metadata.get(_PARQUET_JSON_COLUMNS, b"[]")):
+                df[column] = [
+                    None
+                    if pd.isna(value)
+                    else json.loads(value, object_hook=_decode_json_object)
+                    for value in df[column]
+                ]
+            dataframes[name] = df
+
+        self.from_dataframes(dataframes)
 
     # def validate_experiment(self):
     #     """
@@ -7,6 +7,8 @@ from .fir_filter import FIRFilter
 from .frequency_response_table_filter import FrequencyResponseTableFilter
 from .pole_zero_filter import PoleZeroFilter
 from .time_delay_filter import TimeDelayFilter
+from .response_cache import ResponseCache
+from .filter_registry import FilterRegistry
 from .channel_response import ChannelResponse
 
 
@@ -19,4 +21,6 @@ __all__ = [
     "TimeDelayFilter",
     "FrequencyResponseTableFilter",
     "ChannelResponse",
+    "ResponseCache",
+    "FilterRegistry",
 ]
@@ -26,6 +26,10 @@ from mt_metadata.timeseries.filters import (
     TimeDelayFilter,
 )
 from mt_metadata.timeseries.filters.plotting_helpers import plot_response
+from mt_metadata.timeseries.filters.pole_zero_filter import (
+    pole_zero_complex_responses,
+)
+from mt_metadata.timeseries.filters.response_cache import RESPONSE_CACHE
 
 try:
     from obspy.core import inventory
@@ -342,12 +346,15 @@ class ChannelResponse(FilterBase):
         include_decimation=False,
         include_delay=False,
         normalize=False,
+        use_cache=True,
         **kwargs,
     ):
         """
         Computes the complex response of self.
         Allows the user to optionally supply a subset of filters
 
+        Filter responses come from :meth:`get_filter_responses`.
+
         :param frequencies: frequencies to compute complex response,
          defaults to None
         :type frequencies: np.ndarray, optional
@@ -359,6 +366,9 @@ class ChannelResponse(FilterBase):
         :type include_decimation: bool, optional
         :param normalize: normalize the response to 1, defaults to False
         :type normalize: bool, optional
+        :param use_cache: get filter responses from the response cache,
+         defaults to True
+        :type use_cache: bool, optional
         :return: complex response along give frequency array
         :rtype: np.ndarray
 
@@ -380,21 +390,89 @@ class ChannelResponse(FilterBase):
             logger.warning(f"No filters associated with {self.__class__}, returning 1")
             return np.ones(len(self.frequencies), dtype=complex)
 
-        # define the product of all filters as the total response function
-        result = filters_list[0].complex_response(self.frequencies)
-        for ff in filters_list[1:]:
-            result *= ff.complex_response(self.frequencies)
+        # define the product of all filters as the total response function,
+        # cached responses are read only so multiply into a new array
+        responses = self.get_filter_responses(
+            self.frequencies, filters_list=filters_list, use_cache=use_cache
+        )
+        result = np.array(responses[0], copy=True)
+        for response in responses[1:]:
+            result = result * response
 
         if normalize:
             result /= np.max(np.abs(result))
         return result
 
-    def compute_instrument_sensitivity(self, normalization_frequency=None, sig_figs=6):
+    def get_filter_responses(self, frequencies, filters_list=None, use_cache=True):
+        """
+        Complex response of each filter on the same frequencies.
+
+        Responses are taken from a shared cache keyed by the filter content
+        and the frequencies, so identical filters on many channels are only
+        evaluated once per frequency array.  Pole zero filters that are not
+        cached are evaluated together with
+        :func:`pole_zero_complex_responses`.  Warnings logged while
+        computing a filter response are only logged when the response is not
+        already cached.
+
+        :param frequencies: frequencies to compute complex response
+        :type frequencies: np.ndarray
+        :param filters_list: filters to evaluate, defaults to all filters
+        :type filters_list: list, optional
+        :param use_cache: get filter responses from the response cache,
+         defaults to True
+        :type use_cache: bool, optional
+        :return: complex response of each filter, cached responses are read
+         only
+        :rtype: list[np.ndarray]
+
+        """
+        if filters_list is None:
+            filters_list = self.filters_list
+
+        responses = [None] * len(filters_list)
+        pole_zero_indices = []
+        for index, mt_filter in enumerate(filters_list):
+            if use_cache:
+                responses[index] = RESPONSE_CACHE.get(mt_filter, frequencies)
+                if responses[index] is not None:
+                    continue
+            if (
+                isinstance(mt_filter, PoleZeroFilter)
+                and type(mt_filter).complex_response
+                is PoleZeroFilter.complex_response
+            ):
+                pole_zero_indices.append(index)
+                continue
+            responses[index] = mt_filter.complex_response(frequencies)
+            if use_cache:
+                responses[index] = RESPONSE_CACHE.put(
+                    mt_filter, frequencies, responses[index]
+                )
+
+        if pole_zero_indices:
+            pole_zero_responses = pole_zero_complex_responses(
+                [filters_list[index] for index in pole_zero_indices], frequencies
+            )
+            for index, response in zip(pole_zero_indices, pole_zero_responses):
+                if use_cache:
+                    response = RESPONSE_CACHE.put(
+                        filters_list[index], frequencies, response
+                    )
+                responses[index] = response
+        return responses
+
+    def compute_instrument_sensitivity(
+        self, normalization_frequency=None, sig_figs=6, use_cache=True
+    ):
         """
         Compute the StationXML instrument sensitivity for the given normalization frequency
 
         :param normalization_frequency: DESCRIPTION
         :type normalization_frequency: TYPE
+        :param use_cache: get filter responses from the response cache,
+         defaults to True
+        :type use_cache: bool, optional
         :return: DESCRIPTION
         :rtype: TYPE
 
@@ -402,8 +480,9 @@ class ChannelResponse(FilterBase):
         if normalization_frequency is not None:
             self.normalization_frequency = normalization_frequency
         sensitivity = 1.0
-        for mt_filter in self.filters_list:
-            complex_response = mt_filter.complex_response(self.normalization_frequency)
+        for complex_response in self.get_filter_responses(
+            self.normalization_frequency, use_cache=use_cache
+        ):
             sensitivity *= complex_response.astype(complex)
         try:
             sensitivity = np.abs(sensitivity[0])
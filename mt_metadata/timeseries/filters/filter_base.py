@@ -1,6 +1,7 @@
 # =====================================================
 # Imports
 # =====================================================
+import hashlib
 from typing import Annotated
 
 import numpy as np
@@ -26,6 +27,60 @@ except ImportError:
 
 
 # =====================================================
+# attributes that describe a filter but do not change its response
+RESPONSE_HASH_EXCLUDE = ("name", "comments", "calibration_date", "sequence_number")
+# significant digits numbers are rounded to when comparing filter content
+FILTER_HASH_DIGITS = 8
+
+
+def round_significant(values, significant_digits: int) -> np.ndarray:
+    """
+    Round real or complex values to a number of significant digits, the
+    real and imaginary parts are rounded separately.
+
+    :param values: values to round
+    :type values: np.ndarray
+    :param significant_digits: number of significant digits
+    :type significant_digits: int
+    :return: rounded values
+    :rtype: np.ndarray
+
+    """
+    values = np.asarray(values)
+    if np.iscomplexobj(values):
+        return round_significant(
+            values.real, significant_digits
+        ) + 1j * round_significant(values.imag, significant_digits)
+
+    values = np.array(values, dtype=float)
+    finite = np.isfinite(values) & (values != 0)
+    exponent = np.floor(np.log10(np.abs(values[finite])))
+    scale = 10.0 ** (significant_digits - 1 - exponent)
+    values[finite] = np.round(values[finite] * scale) / scale
+    # adding 0 turns -0.0 into 0.0
+    return values + 0.0
+
+
+def _update_digest(digest, value, significant_digits: int | None = None) -> None:
+    """
+    Add a value to a hash, arrays are added as raw bytes with their dtype
+    and shape.  Real and complex numbers are rounded first if
+    `significant_digits` is given.
+    """
+    if isinstance(value, np.ndarray):
+        if significant_digits is not None and value.dtype.kind in "fc":
+            value = round_significant(value, significant_digits)
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update_digest(digest, item, significant_digits)
+    else:
+        if significant_digits is not None and isinstance(value, (float, complex)):
+            value = round_significant(value, significant_digits).item()
+        digest.update(repr(value).encode())
+    digest.update(b"\x00")
 
 
 def get_base_obspy_mapping():
@@ -270,6 +325,58 @@ class FilterBase(MetadataBase):
         """
         return self.gain
 
+    def _canonical_value(self, name: str, value, significant_digits: int):
+        """
+        Value of an attribute used in the content hash, filters where the
+        order of values does not change the response sort them here.
+        """
+        return value
+
+    def response_hash(self, significant_digits: int | None = None) -> str:
+        """
+        Hash of the filter type and the attributes that determine the
+        complex response.  Name, comments, calibration date and sequence
+        number are left out so identical filters with different names have
+        the same hash.
+
+        By default values are hashed exactly.  If `significant_digits` is
+        given numbers are rounded and values are put in a canonical order
+        first, so filters that differ only by rounding, like the same sensor
+        response repeated in a StationXML file, have the same hash.
+
+        :param significant_digits: significant digits to round numbers to,
+         defaults to None
+        :type significant_digits: int, optional
+        :return: hexadecimal digest
+        :rtype: str
+
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(type(self).__name__.encode())
+        for name in sorted(type(self).model_fields):
+            if name in RESPONSE_HASH_EXCLUDE:
+                continue
+            value = getattr(self, name)
+            if significant_digits is not None:
+                value = self._canonical_value(name, value, significant_digits)
+            digest.update(name.encode())
+            _update_digest(digest, value, significant_digits)
+        return digest.hexdigest()
+
+    def content_hash(self, significant_digits: int = FILTER_HASH_DIGITS) -> str:
+        """
+        Canonical hash of the filter content with numbers rounded to
+        `significant_digits`, used to find duplicate filters.
+
+        :param significant_digits: significant digits to round numbers to,
+         defaults to 8
+        :type significant_digits: int, optional
+        :return: hexadecimal digest
+        :rtype: str
+
+        """
+        return self.response_hash(significant_digits=significant_digits)
+
     def get_filter_description(self):
         """
 
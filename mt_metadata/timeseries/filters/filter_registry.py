@@ -0,0 +1,132 @@
+# =====================================================
+# Imports
+# =====================================================
+from mt_metadata.timeseries.filters.filter_base import FILTER_HASH_DIGITS
+
+# =====================================================
+
+
+class FilterRegistry:
+    """
+    Index of filters by their content hash so filters with the same response
+    can be found without comparing every filter.
+
+    The content hash rounds numbers to `significant_digits` and leaves out
+    the name, comments, calibration date and sequence number, see
+    :meth:`FilterBase.content_hash`.  The first filter added with a given
+    content is the registered one, later filters with the same content are
+    duplicates of it.
+
+    Filters changed after they are added are not tracked, remove and add
+    them again.
+
+    :param filters: filters to add, defaults to None
+    :type filters: iterable of :class:`FilterBase`, optional
+    :param significant_digits: significant digits numbers are rounded to,
+     defaults to 8
+    :type significant_digits: int, optional
+
+    """
+
+    def __init__(self, filters=None, significant_digits: int = FILTER_HASH_DIGITS):
+        self.significant_digits = significant_digits
+        self._by_hash = {}
+        self._by_name = {}
+        # id of each registered filter -> (content hash, name) it was added with
+        self._entries = {}
+        if filters is not None:
+            for mt_filter in filters:
+                self.add(mt_filter)
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def __contains__(self, mt_filter) -> bool:
+        return self.find(mt_filter) is not None
+
+    @property
+    def names(self) -> list[str]:
+        """
+        Names of the registered filters.
+        """
+        return list(self._by_name.keys())
+
+    def content_hash(self, mt_filter) -> str:
+        """
+        Content hash of a filter with the registry's rounding.
+
+        :param mt_filter: filter to hash
+        :type mt_filter: :class:`FilterBase`
+        :return: hexadecimal digest
+        :rtype: str
+
+        """
+        return mt_filter.content_hash(significant_digits=self.significant_digits)
+
+    def find(self, mt_filter):
+        """
+        Find the registered filter with the same content.
+
+        :param mt_filter: filter to look for
+        :type mt_filter: :class:`FilterBase`
+        :return: registered filter or None if there is no filter with the
+         same content
+        :rtype: :class:`FilterBase` | None
+
+        """
+        return self._by_hash.get(self.content_hash(mt_filter))
+
+    def get(self, name: str):
+        """
+        Get a registered filter by name.
+
+        :param name: filter name
+        :type name: str
+        :return: registered filter or None
+        :rtype: :class:`FilterBase` | None
+
+        """
+        return self._by_name.get(name)
+
+    def add(self, mt_filter):
+        """
+        Register a filter unless a filter with the same content is already
+        registered.  A registered filter with the same name but different
+        content is replaced.
+
+        :param mt_filter: filter to add
+        :type mt_filter: :class:`FilterBase`
+        :return: the registered filter with the content of `mt_filter`,
+         which is `mt_filter` if it was added
+        :rtype: :class:`FilterBase`
+
+        """
+        key = self.content_hash(mt_filter)
+        existing = self._by_hash.get(key)
+        if existing is not None:
+            return existing
+
+        previous = self._by_name.get(mt_filter.name)
+        if previous is not None:
+            self.remove(previous)
+
+        self._by_hash[key] = mt_filter
+        self._by_name[mt_filter.name] = mt_filter
+        self._entries[id(mt_filter)] = (key, mt_filter.name)
+        return mt_filter
+
+    def remove(self, mt_filter) -> None:
+        """
+        Remove a registered filter, nothing is done if it is not registered.
+
+        :param mt_filter: filter to remove
+        :type mt_filter: :class:`FilterBase`
+
+        """
+        key, name = self._entries.get(id(mt_filter), (None, None))
+        if key is None or self._by_hash.get(key) is not mt_filter:
+            return
+        del self._by_hash[key]
+        del self._entries[id(mt_filter)]
+        if self._by_name.get(name) is mt_filter:
+            del self._by_name[name]
@@ -14,15 +14,23 @@ try:
     from obspy.core.inventory.response import FIRResponseStage
 except ImportError:
     FIRResponseStage = None
+import scipy.fft as sp_fft
 import scipy.signal as signal
 
 from mt_metadata.common import SymmetryEnum
 
 # =====================================================
+# error of the FFT response relative to the sum of the absolute coefficients
+FFT_TOLERANCE = 1e-6
+# the FFT response is only used automatically for filters with at least this
+# many taps, or for this many frequencies once the FFT has been computed
+FFT_MIN_TAPS = 64
+FFT_MIN_FREQUENCIES = 256
 
 
 class FIRFilter(FilterBase):
     _filter_type: str = PrivateAttr("fir")
+    _derived: dict = PrivateAttr(default_factory=dict)
     type: Annotated[
         str,
         Field(
@@ -139,14 +147,39 @@ class FIRFilter(FilterBase):
         mapping["stage_gain_frequency"] = "gain_frequency"
         return mapping
 
+    def _get_derived(self) -> dict:
+        """
+        Values derived from the coefficients are kept until the coefficients,
+        symmetry, gain, gain frequency or sample rate change.
+        """
+        state = (
+            self.coefficients.tobytes(),
+            str(self.symmetry),
+            self.gain,
+            self.gain_frequency,
+            self.decimation_input_sample_rate,
+        )
+        if self._derived.get("state") != state:
+            self._derived = {"state": state}
+        return self._derived
+
     @property
     def symmetry_corrected_coefficients(self):
-        if self.symmetry == "EVEN":
-            return np.hstack((self.coefficients, np.flipud(self.coefficients)))
-        elif self.symmetry == "ODD":
-            return np.hstack((self.coefficients, np.flipud(self.coefficients[1:])))
-        else:
-            return self.coefficients
+        derived = self._get_derived()
+        if "coefficients" not in derived:
+            if self.symmetry == "EVEN":
+                coefficients = np.hstack(
+                    (self.coefficients, np.flipud(self.coefficients))
+                )
+            elif self.symmetry == "ODD":
+                coefficients = np.hstack(
+                    (self.coefficients, np.flipud(self.coefficients[1:]))
+                )
+            else:
+                coefficients = np.array(self.coefficients, copy=True)
+            coefficients.setflags(write=False)
+            derived["coefficients"] = coefficients
+        return derived["coefficients"]
 
     @property
     def coefficient_gain(self):
@@ -155,6 +188,10 @@ class FIRFilter(FilterBase):
         Sometimes this is different from the gain in the stationxml and a
         corrective scalar must be applied
         """
+        derived = self._get_derived()
+        if "coefficient_gain" in derived:
+            return derived["coefficient_gain"]
+
         if self.gain_frequency == 0.0:
             coefficient_gain = self.symmetry_corrected_coefficients.sum()
         else:
@@ -165,6 +202,7 @@ class FIRFilter(FilterBase):
                 fs=2 * np.pi * self.decimation_input_sample_rate,
             )
             coefficient_gain = np.abs(hh)
+        derived["coefficient_gain"] = coefficient_gain
         return coefficient_gain
 
     @property
@@ -174,10 +212,105 @@ class FIRFilter(FilterBase):
     @property
     def corrective_scalar(self):
         """ """
-        if self.coefficient_gain != self.gain:
-            return self.coefficient_gain / self.total_gain
-        else:
-            return 1.0
+        derived = self._get_derived()
+        if "corrective_scalar" not in derived:
+            if self.coefficient_gain != self.gain:
+                derived["corrective_scalar"] = self.coefficient_gain / self.total_gain
+            else:
+                derived["corrective_scalar"] = 1.0
+        return derived["corrective_scalar"]
+
+    def fft_length(self, tolerance: float = FFT_TOLERANCE) -> int:
+        """
+        Length of the zero padded FFT of the coefficients needed so that
+        interpolating it gives the unscaled response within `tolerance`
+        times the sum of the absolute coefficients.
+
+        The linear phase of the filter delay c = (n_taps - 1) / 2 is removed
+        before interpolating.  Linearly interpolating a function with second
+        derivative bounded by M2 on a grid of spacing 2 pi / N radians per
+        sample has an error of at most sqrt(2) pi**2 M2 / (2 N**2), where
+        M2 = sum((n - c)**2 * abs(h[n])) for the coefficients h.
+
+        :param tolerance: largest error relative to sum(abs(h)),
+         defaults to 1e-6
+        :type tolerance: float, optional
+        :return: length of the FFT
+        :rtype: int
+
+        """
+        coefficients = self.symmetry_corrected_coefficients
+        n_taps = coefficients.size
+        weights = np.abs(coefficients)
+        delay = (n_taps - 1) / 2
+        m2 = np.sum((np.arange(n_taps) - delay) ** 2 * weights)
+        error = tolerance * max(weights.sum(), np.finfo(float).tiny)
+        n_fft = int(np.ceil(np.pi * np.sqrt(np.sqrt(2) * m2 / (2 * error))))
+        n_fft = sp_fft.next_fast_len(max(n_fft, 2 * n_taps, 16), real=True)
+        # an even length puts the Nyquist frequency on the grid
+        while n_fft % 2:
+            n_fft = sp_fft.next_fast_len(n_fft + 1, real=True)
+        return n_fft
+
+    def _get_spectrum(self, tolerance: float) -> np.ndarray:
+        """
+        Zero padded rFFT of the coefficients with the linear phase of the
+        filter delay removed, computed once for each tolerance.
+        """
+        derived = self._get_derived()
+        key = ("spectrum", tolerance)
+        if key not in derived:
+            coefficients = self.symmetry_corrected_coefficients
+            n_fft = self.fft_length(tolerance)
+            delay = (coefficients.size - 1) / 2
+            spectrum = sp_fft.rfft(coefficients, n=n_fft)
+            spectrum *= np.exp(2j * np.pi * delay * np.arange(spectrum.size) / n_fft)
+            spectrum.setflags(write=False)
+            derived[key] = spectrum
+        return derived[key]
+
+    def _fft_unscaled_response(
+        self, frequencies: np.ndarray, tolerance: float = FFT_TOLERANCE
+    ) -> np.ndarray:
+        """
+        Unscaled response interpolated from the cached spectrum.
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        spectrum = self._get_spectrum(tolerance)
+        n_fft = 2 * (spectrum.size - 1)
+        # normalized frequency in cycles per sample folded into [0, 0.5],
+        # the response of real coefficients is periodic and conjugate
+        # symmetric
+        cycles = np.mod(frequencies / self.decimation_input_sample_rate, 1.0)
+        mirrored = cycles > 0.5
+        folded = np.where(mirrored, 1.0 - cycles, cycles)
+        bins = folded * n_fft
+        grid = np.arange(spectrum.size)
+        response = np.interp(bins, grid, spectrum.real) + 1j * np.interp(
+            bins, grid, spectrum.imag
+        )
+        delay = (self.symmetry_corrected_coefficients.size - 1) / 2
+        response *= np.exp(-2j * np.pi * delay * folded)
+        return np.where(mirrored, np.conj(response), response)
+
+    def _use_fft(self, frequencies: np.ndarray, method: str, tolerance: float):
+        if method == "freqz":
+            return False
+        if method == "fft":
+            return True
+        if method != "auto":
+            raise ValueError(
+                f"method must be 'auto', 'fft' or 'freqz', not '{method}'"
+            )
+        n_taps = self.symmetry_corrected_coefficients.size
+        if n_taps < FFT_MIN_TAPS:
+            return False
+        n_frequencies = np.size(frequencies)
+        if ("spectrum", tolerance) in self._get_derived():
+            return n_frequencies >= FFT_MIN_FREQUENCIES
+        # computing the spectrum costs about n_fft log2(n_fft)
+        n_fft = self.fft_length(tolerance)
+        return n_frequencies * n_taps > n_fft * np.log2(n_fft)
 
     def plot_fir_response(self):
         w, h = signal.freqz(self.full_coefficients)
@@ -239,7 +372,9 @@ class FIRFilter(FilterBase):
 
         return rs
 
-    def unscaled_complex_response(self, frequencies):
+    def unscaled_complex_response(
+        self, frequencies, method="freqz", tolerance=FFT_TOLERANCE
+    ):
         """
         need this to avoid RecursionError.
         The problem is that some FIRs need a scale factor to make their gains be
@@ -252,8 +387,16 @@ class FIRFilter(FilterBase):
         I wanted to scale the coefficients so they equal the gain... but maybe
         we can add the gain in complex response
         :param frequencies:
+        :param method: 'freqz' evaluates the coefficients at each frequency,
+         'fft' interpolates a cached zero padded FFT of the coefficients and
+         'auto' uses the FFT when it is cheaper, defaults to 'freqz'
+        :param tolerance: error of the 'fft' method relative to the sum of
+         the absolute coefficients, see :meth:`fft_length`
         :return:
         """
+        if self._use_fft(frequencies, method, tolerance):
+            return self._fft_unscaled_response(frequencies, tolerance)
+
         angular_frequencies = 2 * np.pi * frequencies
         w, h = signal.freqz(
             self.symmetry_corrected_coefficients,
@@ -262,24 +405,33 @@ class FIRFilter(FilterBase):
         )
         return h
 
-    def complex_response(self, frequencies, **kwargs):
+    def complex_response(
+        self, frequencies, method="freqz", tolerance=FFT_TOLERANCE, **kwargs
+    ):
         """
 
         Parameters
         ----------
         frequencies: numpy array of frequencies, expected in Hz
+        method: str, optional
+            'freqz' evaluates the coefficients at each frequency, 'fft'
+            interpolates a zero padded FFT of the coefficients that is
+            computed once and 'auto' uses the FFT when it is cheaper, which
+            is for long filters evaluated at many frequencies, by default
+            'freqz'.  The error of 'fft' is bounded relative to the passband,
+            so in the stopband it can be larger than the response itself.
+        tolerance: float, optional
+            error of the 'fft' method in the unscaled response relative to
+            the sum of the absolute coefficients, see :meth:`fft_length`,
+            by default 1e-6
 
         Returns
         -------
         h : numpy array of (possibly complex-valued) frequency response at the input frequencies
 
         """
-        # fir_filter.full_coefficients
-        angular_frequencies = 2 * np.pi * frequencies
-        w, h = signal.freqz(
-            self.symmetry_corrected_coefficients,
-            worN=angular_frequencies,
-            fs=2 * np.pi * self.decimation_input_sample_rate,
+        h = self.unscaled_complex_response(
+            frequencies, method=method, tolerance=tolerance
         )
         h /= self.corrective_scalar
 
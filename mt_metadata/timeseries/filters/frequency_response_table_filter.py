@@ -5,7 +5,7 @@ from typing import Annotated
 
 import numpy as np
 from loguru import logger
-from pydantic import Field, field_validator, ValidationInfo
+from pydantic import Field, field_validator, PrivateAttr, ValidationInfo
 from scipy.interpolate import interp1d
 
 from mt_metadata.base.helpers import object_to_array, requires
@@ -25,6 +25,7 @@ except ImportError:
 
 class FrequencyResponseTableFilter(FilterBase):
     _filter_type: str = "fap"
+    _interpolators: dict = PrivateAttr(default_factory=dict)
     type: Annotated[
         str,
         Field(
@@ -207,15 +208,29 @@ class FrequencyResponseTableFilter(FilterBase):
 
         return rs
 
-    def complex_response(self, frequencies, interpolation_method="slinear"):
+    def _get_interpolator(self, interpolation_method: str = "slinear") -> interp1d:
         """
-        Computes complex response for given frequency range
-        :param frequencies: array of frequencies to estimate the response
-        :type frequencies: np.ndarray
-        :return: complex response
-        :rtype: np.ndarray
-
+        Interpolator of the amplitudes and phases, built once for each
+        interpolation method and rebuilt when the frequencies, amplitudes or
+        phases change.
         """
+        state = (
+            self.frequencies.tobytes(),
+            self.amplitudes.tobytes(),
+            self.phases.tobytes(),
+        )
+        if self._interpolators.get("state") != state:
+            self._interpolators = {"state": state}
+        if interpolation_method not in self._interpolators:
+            self._interpolators[interpolation_method] = interp1d(
+                self.frequencies,
+                np.vstack((self.amplitudes, self.phases)),
+                kind=interpolation_method,
+                fill_value="extrapolate",
+            )
+        return self._interpolators[interpolation_method]
+
+    def _check_extrapolation(self, frequencies) -> None:
         if np.min(frequencies) < self.min_frequency:
             # if there is a dc component skip it.
             if np.min(frequencies) != 0:
@@ -229,21 +244,53 @@ class FrequencyResponseTableFilter(FilterBase):
                 f"than table frequencies ({self.max_frequency} Hz)."
             )
 
-        phase_response = interp1d(
-            self.frequencies,
-            self.phases,
-            kind=interpolation_method,
-            fill_value="extrapolate",
+    def _evaluate(self, frequencies, interpolation_method: str) -> np.ndarray:
+        amplitudes, phases = self._get_interpolator(interpolation_method)(
+            frequencies
         )
+        return self.gain * amplitudes * np.exp(1.0j * phases)
 
-        amplitude_response = interp1d(
-            self.frequencies,
-            self.amplitudes,
-            kind=interpolation_method,
-            fill_value="extrapolate",
-        )
-        total_response_function = lambda f: amplitude_response(f) * np.exp(
-            1.0j * phase_response(f)
-        )
+    def complex_response(self, frequencies, interpolation_method="slinear"):
+        """
+        Computes complex response for given frequency range
+        :param frequencies: array of frequencies to estimate the response
+        :type frequencies: np.ndarray
+        :param interpolation_method: kind of interpolation passed to
+         :class:`scipy.interpolate.interp1d`, defaults to "slinear"
+        :type interpolation_method: str, optional
+        :return: complex response
+        :rtype: np.ndarray
+
+        """
+        self._check_extrapolation(frequencies)
+        return self._evaluate(frequencies, interpolation_method)
+
+    def complex_responses(self, frequency_grids, interpolation_method="slinear"):
+        """
+        Computes complex responses for several frequency arrays in one
+        evaluation of the interpolator.
+
+        :param frequency_grids: arrays of frequencies to estimate the
+         response
+        :type frequency_grids: list[np.ndarray]
+        :param interpolation_method: kind of interpolation passed to
+         :class:`scipy.interpolate.interp1d`, defaults to "slinear"
+        :type interpolation_method: str, optional
+        :return: complex response for each frequency array
+        :rtype: list[np.ndarray]
+
+        """
+        frequency_grids = [np.asarray(grid, dtype=float) for grid in frequency_grids]
+        if len(frequency_grids) == 0:
+            return []
+        frequencies = np.concatenate([grid.ravel() for grid in frequency_grids])
+        if frequencies.size == 0:
+            return [np.zeros(grid.shape, dtype=complex) for grid in frequency_grids]
 
-        return self.gain * total_response_function(frequencies)
+        self._check_extrapolation(frequencies)
+        response = self._evaluate(frequencies, interpolation_method)
+        splits = np.cumsum([grid.size for grid in frequency_grids])[:-1]
+        return [
+            part.reshape(grid.shape)
+            for part, grid in zip(np.split(response, splits), frequency_grids)
+        ]
@@ -14,6 +14,7 @@ import scipy.signal as signal
 
 from mt_metadata.base.helpers import object_to_array, requires
 from mt_metadata.timeseries.filters import FilterBase, get_base_obspy_mapping
+from mt_metadata.timeseries.filters.filter_base import round_significant
 
 
 # =====================================================
@@ -89,6 +90,15 @@ class PoleZeroFilter(FilterBase):
         mapping["normalization_factor"] = "normalization_factor"
         return mapping
 
+    def _canonical_value(self, name: str, value, significant_digits: int):
+        """
+        The order of poles and zeros does not change the response, sort them
+        after rounding.
+        """
+        if name in ["poles", "zeros"]:
+            return np.sort(round_significant(value, significant_digits))
+        return value
+
     @property
     def n_poles(self):
         """
@@ -237,3 +247,50 @@ class PoleZeroFilter(FilterBase):
 
         elif estimate == "max":
             return pass_band.max()
+
+
+def _product_of_roots(s: np.ndarray, roots_list: list) -> np.ndarray:
+    """
+    Product of (s - root) over the roots of each filter, roots are padded
+    to the largest order and padded entries multiply by 1.
+    """
+    order = max((np.size(roots) for roots in roots_list), default=0)
+    roots = np.zeros((len(roots_list), order), dtype=complex)
+    valid = np.zeros((len(roots_list), order), dtype=bool)
+    for ii, filter_roots in enumerate(roots_list):
+        filter_roots = np.ravel(filter_roots)
+        roots[ii, : filter_roots.size] = filter_roots
+        valid[ii, : filter_roots.size] = True
+
+    # multiply in the same order as scipy.signal.freqs_zpk so the result is
+    # the same as evaluating each filter on its own
+    product = np.ones((len(roots_list), s.size), dtype=complex)
+    for jj in range(order):
+        product *= np.where(valid[:, jj, None], s - roots[:, jj, None], 1)
+    return product
+
+
+def pole_zero_complex_responses(filters: list, frequencies) -> np.ndarray:
+    """
+    Complex responses of many pole zero filters on the same frequencies.
+
+    The zeros and poles of the filters are padded into (n_filters, order)
+    arrays and evaluated together, the response of each filter is the same
+    as :meth:`PoleZeroFilter.complex_response`.
+
+    :param filters: pole zero filters
+    :type filters: list[:class:`PoleZeroFilter`]
+    :param frequencies: frequencies to estimate the response
+    :type frequencies: np.ndarray
+    :return: complex responses, shape (n_filters,) + frequencies.shape, a
+     scalar frequency is treated as one frequency like freqs_zpk does
+    :rtype: np.ndarray
+
+    """
+    frequencies = np.atleast_1d(frequencies)
+    s = 1j * (2 * np.pi * frequencies).ravel()
+    gains = np.array([pz_filter.total_gain for pz_filter in filters], dtype=float)
+    numerator = _product_of_roots(s, [pz_filter.zeros for pz_filter in filters])
+    denominator = _product_of_roots(s, [pz_filter.poles for pz_filter in filters])
+    responses = gains[:, None] * numerator / denominator
+    return responses.reshape((len(filters),) + frequencies.shape)
@@ -0,0 +1,185 @@
+# =====================================================
+# Imports
+# =====================================================
+import hashlib
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+
+# =====================================================
+
+
+def frequency_fingerprint(frequencies) -> str:
+    """
+    Hash of a frequency array, its dtype, shape and values.
+
+    :param frequencies: frequencies in Hz
+    :type frequencies: np.ndarray
+    :return: hexadecimal digest
+    :rtype: str
+
+    """
+    frequencies = np.asarray(frequencies)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{frequencies.dtype.str}{frequencies.shape}".encode())
+    digest.update(frequencies.tobytes())
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Least recently used cache of filter complex responses keyed by the
+    filter :meth:`FilterBase.response_hash` and a fingerprint of the
+    frequency array, so identical filters shared by many channels are
+    evaluated once per frequency grid.
+
+    The cache is bounded by the number of entries and by the bytes of the
+    cached arrays.  Cached arrays are read only, copy them before changing
+    them.
+
+    :param max_bytes: largest total size of cached arrays, defaults to 64 MB
+    :type max_bytes: int, optional
+    :param max_entries: largest number of cached arrays, defaults to 1024
+    :type max_entries: int, optional
+
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, max_entries: int = 1024):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._responses = OrderedDict()
+        self._lock = RLock()
+        self._bytes = 0
+        self.reset_stats()
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def reset_stats(self) -> None:
+        """
+        Set hits, misses and evictions back to 0.
+        """
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses, statistics are kept.
+        """
+        with self._lock:
+            self._responses.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self) -> dict:
+        """
+        Cache statistics to size the cache.
+
+        :return: hits, misses, evictions, number of entries, bytes cached
+         and the limits
+        :rtype: dict
+
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._responses),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _evict(self) -> None:
+        while self._responses and (
+            len(self._responses) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, response = self._responses.popitem(last=False)
+            self._bytes -= response.nbytes
+            self._evictions += 1
+
+    @staticmethod
+    def _get_key(filter_object, frequencies) -> tuple:
+        return (filter_object.response_hash(), frequency_fingerprint(frequencies))
+
+    def get(self, filter_object, frequencies) -> np.ndarray | None:
+        """
+        Get a cached complex response.
+
+        :param filter_object: filter to evaluate
+        :type filter_object: :class:`mt_metadata.timeseries.filters.FilterBase`
+        :param frequencies: frequencies in Hz
+        :type frequencies: np.ndarray
+        :return: read only complex response or None if it is not cached
+        :rtype: np.ndarray | None
+
+        """
+        key = self._get_key(filter_object, frequencies)
+        with self._lock:
+            response = self._responses.get(key)
+            if response is None:
+                self._misses += 1
+                return None
+            self._responses.move_to_end(key)
+            self._hits += 1
+            return response
+
+    def put(self, filter_object, frequencies, response) -> np.ndarray:
+        """
+        Cache the complex response of a filter.  Responses larger than
+        `max_bytes` are not cached.
+
+        :param filter_object: filter the response belongs to
+        :type filter_object: :class:`mt_metadata.timeseries.filters.FilterBase`
+        :param frequencies: frequencies in Hz
+        :type frequencies: np.ndarray
+        :param response: complex response at the frequencies
+        :type response: np.ndarray
+        :return: read only copy of the response
+        :rtype: np.ndarray
+
+        """
+        if response is None:
+            return response
+        response = np.array(response, copy=True)
+        response.setflags(write=False)
+        if response.nbytes > self.max_bytes:
+            return response
+
+        key = self._get_key(filter_object, frequencies)
+        with self._lock:
+            if key not in self._responses:
+                self._responses[key] = response
+                self._bytes += response.nbytes
+                self._evict()
+        return response
+
+    def complex_response(self, filter_object, frequencies) -> np.ndarray:
+        """
+        Get the complex response of a filter, computing it only if the same
+        filter content has not been evaluated on the same frequencies.
+
+        :param filter_object: filter to evaluate
+        :type filter_object: :class:`mt_metadata.timeseries.filters.FilterBase`
+        :param frequencies: frequencies in Hz
+        :type frequencies: np.ndarray
+        :return: read only complex response
+        :rtype: np.ndarray
+
+        """
+        response = self.get(filter_object, frequencies)
+        if response is None:
+            response = self.put(
+                filter_object,
+                frequencies,
+                filter_object.complex_response(frequencies),
+            )
+        return response
+
+
+# cache used by ChannelResponse.complex_response
+RESPONSE_CACHE = ResponseCache()
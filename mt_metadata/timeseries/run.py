@@ -13,6 +13,7 @@ from pydantic import (
     Field,
     field_validator,
     model_validator,
+    PrivateAttr,
     ValidationInfo,
 )
 from typing_extensions import Self
@@ -29,6 +30,7 @@ from mt_metadata.common import (
 from mt_metadata.common.list_dict import ListDict
 from mt_metadata.timeseries import Auxiliary, DataLogger, Electric, Magnetic
 
+
 # =====================================================
 
 
@@ -240,6 +242,12 @@ class Run(MetadataBase):
         ),
     ]
 
+    # channels, channels.version and time_period the time period was last
+    # updated from, adding a channel only extends it while they are unchanged
+    _aggregate_version: tuple | None = PrivateAttr(None)
+    # flags of channels whose time period changed since then
+    _changed_time_periods: set = PrivateAttr(default_factory=set)
+
     @field_validator("comments", mode="before")
     @classmethod
     def validate_comments(cls, value, info: ValidationInfo) -> Comment:
@@ -772,6 +780,7 @@ class Run(MetadataBase):
         """
         channel_obj = self._get_correct_channel_type(channel_obj)
 
+        extend = False
         if self.has_channel(channel_obj.component):
             self.channels[channel_obj.component].update(channel_obj)
             logger.debug(
@@ -779,12 +788,19 @@ class Run(MetadataBase):
             )
 
         else:
+            extend = self._aggregates_are_current()
             self.channels.append(channel_obj)
 
         self._update_channels_recorded()
 
         if update:
-            self.update_time_period()
+            if extend:
+                self._extend_time_period(
+                    [flag.obj for flag in self._changed_time_periods] + [channel_obj]
+                )
+                self._set_aggregates_current()
+            else:
+                self.update_time_period()
 
     def remove_channel(self, channel_id: str) -> None:
         """
@@ -944,7 +960,9 @@ class Run(MetadataBase):
         - Only updates if channels exist (n_channels > 0)
         - Ignores channels with default timestamp
         - Always expands time period, never shrinks it
-        - Automatically called by add_channel() when update=True
+        - Automatically called by add_channel() when update=True, unless the
+          time period is current and the channel is new, then only the new
+          channel is included
 
         See Also
         --------
@@ -952,27 +970,85 @@ class Run(MetadataBase):
 
         """
         if self.n_channels > 0:
-            start = []
-            end = []
-            for channel in self.channels:
-                if channel.time_period.start != "1980-01-01T00:00:00+00:00":
-                    start.append(channel.time_period.start)
-                if channel.time_period.end != "1980-01-01T00:00:00+00:00":
-                    end.append(channel.time_period.end)
-
-            if start:
-                if self.time_period.start == "1980-01-01T00:00:00+00:00":
+            self._extend_time_period(self.channels)
+            self._set_aggregates_current()
+
+    def _aggregates_are_current(self) -> bool:
+        """
+        Check if the time period has been updated from the channels since a
+        channel was last added, replaced or removed.
+
+        Channels in the run whose time period changed since then are in
+        `_changed_time_periods` and only need to be included again.
+
+        Returns
+        -------
+        bool
+            True if adding a channel only needs to extend the time period
+
+        """
+        if self._aggregate_version is None:
+            return False
+        channels, version, time_period = self._aggregate_version
+        return (
+            channels is self.channels
+            and version == self.channels.version
+            and time_period is self.time_period
+            and all(
+                self.has_channel(flag.obj.component)
+                and self.channels[flag.obj.component] is flag.obj
+                for flag in self._changed_time_periods
+            )
+        )
+
+    def _set_aggregates_current(self) -> None:
+        """
+        Mark the time period as covering all of the channels.
+        """
+        self._aggregate_version = (
+            self.channels,
+            self.channels.version,
+            self.time_period,
+        )
+        self._changed_time_periods.clear()
+
+    def _extend_time_period(
+        self, channels: list[Electric | Magnetic | Auxiliary] | ListDict
+    ) -> None:
+        """
+        Extend the run's time period to include the given channels.
+
+        Parameters
+        ----------
+        channels : list[Electric | Magnetic | Auxiliary] | ListDict
+            Channels to include.
+
+        """
+        start = []
+        end = []
+        for channel in channels:
+            # flag changes to the time period of the channel
+            flag = channel._get_change_flag(self._changed_time_periods)
+            channel._attach_change_flag(flag, ("time_period",))
+            channel.time_period._attach_change_flag(flag, ("start", "end"))
+            if not channel.time_period.start_is_default():
+                start.append(channel.time_period.start)
+            if not channel.time_period.end_is_default():
+                end.append(channel.time_period.end)
+
+        if start:
+            if self.time_period.start_is_default():
+                self.time_period.start = min(start)
+            else:
+                if self.time_period.start > min(start):
                     self.time_period.start = min(start)
-                else:
-                    if self.time_period.start > min(start):
-                        self.time_period.start = min(start)
 
-            if end:
-                if self.time_period.end == "1980-01-01T00:00:00+00:00":
+        if end:
+            if self.time_period.end_is_default():
+                self.time_period.end = max(end)
+            else:
+                if self.time_period.end < max(end):
                     self.time_period.end = max(end)
-                else:
-                    if self.time_period.end < max(end):
-                        self.time_period.end = max(end)
 
     @classmethod
     def _get_correct_channel_type(
@@ -6,7 +6,13 @@ from typing import Annotated
 
 import numpy as np
 from loguru import logger
-from pydantic import Field, field_validator, model_validator, ValidationInfo
+from pydantic import (
+    Field,
+    field_validator,
+    model_validator,
+    PrivateAttr,
+    ValidationInfo,
+)
 from typing_extensions import Self
 
 from mt_metadata import NULL_VALUES
@@ -25,6 +31,7 @@ from mt_metadata.common import (
 from mt_metadata.common.list_dict import ListDict
 from mt_metadata.timeseries import Run
 
+
 # =====================================================
 
 
@@ -226,6 +233,12 @@ class Station(MetadataBase):
         ),
     ]
 
+    # runs, runs.version and time_period the time period and run list were
+    # last updated from, adding a run only extends them while they are unchanged
+    _aggregate_version: tuple | None = PrivateAttr(None)
+    # flags of runs whose time period changed since then
+    _changed_time_periods: set = PrivateAttr(default_factory=set)
+
     @field_validator("comments", mode="before")
     @classmethod
     def validate_comments(cls, value, info: ValidationInfo) -> Comment:
@@ -426,30 +439,80 @@ class Station(MetadataBase):
         self._empty_run_list()
         self.run_list = list(self.runs.keys())
 
+    def _aggregates_are_current(self):
+        """
+        Have the time period and run list been updated from the runs since a
+        run was last added, replaced or removed.
+
+        Runs in the station whose time period changed since then are in
+        `_changed_time_periods` and only need to be included again.
+
+        :return: True if adding a run only needs to extend them
+        :rtype: bool
+
+        """
+        if self._aggregate_version is None:
+            return False
+        runs, version, time_period = self._aggregate_version
+        return (
+            runs is self.runs
+            and version == self.runs.version
+            and time_period is self.time_period
+            and all(
+                self.has_run(flag.obj.id) and self.runs[flag.obj.id] is flag.obj
+                for flag in self._changed_time_periods
+            )
+        )
+
+    def _set_aggregates_current(self):
+        """
+        The time period and run list cover all of the runs.
+        """
+        self._aggregate_version = (
+            self.runs,
+            self.runs.version,
+            self.time_period,
+        )
+        self._changed_time_periods.clear()
+
+    def _extend_time_period(self, runs):
+        """
+        Extend the time period of the station to include the runs
+
+        :param runs: runs to include
+        :type runs: iterable of :class:`mt_metadata.timeseries.Run`
+
+        """
+        start = []
+        end = []
+        for run in runs:
+            # flag changes to the time period of the run
+            flag = run._get_change_flag(self._changed_time_periods)
+            run._attach_change_flag(flag, ("time_period",))
+            run.time_period._attach_change_flag(flag, ("start", "end"))
+            if not run.time_period.start_is_default():
+                start.append(run.time_period.start)
+            if not run.time_period.end_is_default():
+                end.append(run.time_period.end)
+        if start:
+            if self.time_period.start_is_default():
+                self.time_period.start = min(start)
+            else:
+                if self.time_period.start > min(start):
+                    self.time_period.start = min(start)
+        if end:
+            if self.time_period.end_is_default():
+                self.time_period.end = max(end)
+            else:
+                if self.time_period.end < max(end):
+                    self.time_period.end = max(end)
+
     def update_time_period(self):
         """
         update time period from run information
         """
         if self.__len__() > 0:
-            start = []
-            end = []
-            for run in self.runs:
-                if run.time_period.start != "1980-01-01T00:00:00+00:00":
-                    start.append(run.time_period.start)
-                if run.time_period.end != "1980-01-01T00:00:00+00:00":
-                    end.append(run.time_period.end)
-            if start:
-                if self.time_period.start == "1980-01-01T00:00:00+00:00":
-                    self.time_period.start = min(start)
-                else:
-                    if self.time_period.start > min(start):
-                        self.time_period.start = min(start)
-            if end:
-                if self.time_period.end == "1980-01-01T00:00:00+00:00":
-                    self.time_period.end = max(end)
-                else:
-                    if self.time_period.end < max(end):
-                        self.time_period.end = max(end)
+            self._extend_time_period(self.runs)
 
     def update_all(self):
         """
@@ -459,6 +522,7 @@ class Station(MetadataBase):
         self.update_time_period()
         # self.update_channels_recorded()
         self.update_run_list()
+        self._set_aggregates_current()
 
     def add_run(self, run_obj, update=True):
         """
@@ -476,14 +540,23 @@ class Station(MetadataBase):
 
         if run_obj.id is None:
             raise ValueError("The input run id is None. Input a string or integer.")
+        extend = False
         if self.has_run(run_obj.id):
             self.runs[run_obj.id].update(run_obj)
             logger.debug(f"Station {run_obj.id} already exists, updating metadata")
         else:
+            extend = self._aggregates_are_current()
             self.runs.append(run_obj)
 
         if update:
-            self.update_all()
+            if extend:
+                self._extend_time_period(
+                    [flag.obj for flag in self._changed_time_periods] + [run_obj]
+                )
+                self.run_list.append(str(run_obj.id))
+                self._set_aggregates_current()
+            else:
+                self.update_all()
 
     def get_run(self, run_id):
         """
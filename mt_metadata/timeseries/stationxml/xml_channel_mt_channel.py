@@ -87,13 +87,20 @@ class XMLChannelMTChannel(BaseTranslator):
         self.mt_comments_list = ["run.id"]
         self.run_list = None
 
-    def xml_to_mt(self, xml_channel, existing_filters={}):
+    def xml_to_mt(self, xml_channel, existing_filters={}, filter_registry=None):
         """
         Translate :class:`obspy.core.inventory.Channel` to
         :class:`mt_metadata.timeseries.Channel`
 
         :param xml_channel: Obspy Channel object
         :type xml_channel: :class:`obspy.core.inventory.Channel`
+        :param existing_filters: filters already read keyed by name
+        :type existing_filters: dict, optional
+        :param filter_registry: registry of the filters already read, stages
+         with the same content as a registered filter are named after it
+         and new filters are registered, defaults to None
+        :type filter_registry:
+         :class:`mt_metadata.timeseries.filters.FilterRegistry`, optional
         :returns: MT Channel
         :rtype: :class:`mt_metadata.timeseries.Channel`
 
@@ -119,7 +126,9 @@ class XMLChannelMTChannel(BaseTranslator):
         mt_channel = self._parse_xml_comments(xml_channel.comments, mt_channel)
         mt_channel = self._sensor_to_mt(xml_channel.sensor, mt_channel)
         mt_channel = self._get_mt_units(xml_channel, mt_channel)
-        mt_filters = self._xml_response_to_mt(xml_channel, existing_filters)
+        mt_filters = self._xml_response_to_mt(
+            xml_channel, existing_filters, filter_registry
+        )
 
         for xml_key, mt_key in self.xml_translator.items():
             if mt_key:
@@ -515,36 +524,67 @@ class XMLChannelMTChannel(BaseTranslator):
 
         return mt_channel
 
-    def _xml_response_to_mt(self, xml_channel, existing_filters={}):
+    def _xml_response_to_mt(
+        self, xml_channel, existing_filters={}, filter_registry=None
+    ):
         """
         parse the filters from obspy into mt filters
+
+        If a filter registry is given a stage with the same content as a
+        registered filter gets the name of that filter, so the same response
+        repeated for every channel epoch is only kept once.
         """
         ch_filter_dict = OrderedDict()
         for i_stage, stage in enumerate(xml_channel.response.response_stages):
             new_and_unnamed = False
             mt_filter = create_filter_from_stage(stage)
-            if not mt_filter.name:
-                filter_name, new_and_unnamed = self._add_filter_number(
-                    existing_filters, mt_filter
-                )
-                mt_filter.name = filter_name
 
-            if mt_filter.decimation_active:
-                # keep filter names unique if same one used more than once
-                mt_filter.name += f"_{mt_filter.decimation_input_sample_rate}"
+            existing = None
+            if filter_registry is not None:
+                existing = filter_registry.find(mt_filter)
+                # a channel can apply the same response more than once, keep
+                # each stage
+                if (
+                    existing is not None
+                    and existing.name.replace("/", " per ").lower() in ch_filter_dict
+                ):
+                    existing = None
 
-            if new_and_unnamed:
-                logger.info(f"Found an unnamed filter, named it: '{mt_filter.name}'")
-                existing_filters[filter_name] = mt_filter
+            if existing is not None:
+                mt_filter.name = existing.name
+            else:
+                if not mt_filter.name:
+                    filter_name, new_and_unnamed = self._add_filter_number(
+                        existing_filters, mt_filter, filter_registry
+                    )
+                    mt_filter.name = filter_name
+
+                if mt_filter.decimation_active:
+                    # keep filter names unique if same one used more than once
+                    mt_filter.name += f"_{mt_filter.decimation_input_sample_rate}"
+
+                if filter_registry is not None:
+                    filter_registry.add(mt_filter)
+                elif new_and_unnamed:
+                    existing_filters[filter_name] = mt_filter
+
+                if new_and_unnamed:
+                    logger.info(
+                        f"Found an unnamed filter, named it: '{mt_filter.name}'"
+                    )
 
             ch_filter_dict[mt_filter.name.replace("/", " per ").lower()] = mt_filter
 
         return ch_filter_dict
 
-    def _add_filter_number(self, existing_filters, mt_filter):
+    def _add_filter_number(self, existing_filters, mt_filter, filter_registry=None):
         """
         return the next number the number of filters
 
+        Without a filter registry existing filters of the same type with the
+        same amplitude at 1 Hz are reused, with a registry duplicates have
+        already been looked up by content.
+
         :param keys: DESCRIPTION
         :type keys: TYPE
         :return: DESCRIPTION
@@ -552,18 +592,20 @@ class XMLChannelMTChannel(BaseTranslator):
 
         """
 
-        # check for existing filters
-        for f_obj in existing_filters.values():
-            if f_obj.type == mt_filter.type:
-                if round(abs(f_obj.complex_response([1])[0])) == round(
-                    abs(mt_filter.complex_response([1])[0])
-                ):
-                    return f_obj.name, False
+        if filter_registry is None:
+            # check for existing filters
+            for f_obj in existing_filters.values():
+                if f_obj.type == mt_filter.type:
+                    if round(abs(f_obj.complex_response([1])[0])) == round(
+                        abs(mt_filter.complex_response([1])[0])
+                    ):
+                        return f_obj.name, False
+            names = existing_filters.keys()
+        else:
+            names = set(existing_filters.keys()).union(filter_registry.names)
 
         try:
-            last = sorted([k for k in existing_filters.keys() if mt_filter.type in k])[
-                -1
-            ]
+            last = sorted([k for k in names if mt_filter.type in k])[-1]
         except IndexError:
             return f"{mt_filter.type}_{0:02}", True
         try:
@@ -75,9 +75,19 @@ class XMLInventoryMTExperiment:
                 mt_station = self.station_translator.xml_to_mt(xml_station)
                 for xml_channel in xml_station:
                     mt_channel, mt_filters = self.channel_translator.xml_to_mt(
-                        xml_channel, mt_survey.filters
+                        xml_channel,
+                        mt_survey.filters,
+                        filter_registry=mt_survey.filter_registry,
                     )
-                    mt_survey.filters.update(mt_filters)
+                    # stages repeated for each channel epoch are only added
+                    # once, they are looked up by content not compared one
+                    # by one
+                    for filter_key, mt_filter in mt_filters.items():
+                        survey_filter = mt_survey.add_filter(mt_filter, key=filter_key)
+                        if survey_filter.name != mt_filter.name:
+                            # applied more than once by the channel, keep it
+                            # under its own name
+                            mt_survey.filters[filter_key] = mt_filter
                     # if there is a run list match channel to runs
                     if self.channel_translator.run_list:
                         for run_id in sorted(self.channel_translator.run_list):
@@ -5,7 +5,7 @@ from collections import OrderedDict
 from typing import Annotated
 
 from loguru import logger
-from pydantic import computed_field, Field, field_validator, ValidationInfo
+from pydantic import computed_field, Field, field_validator, PrivateAttr, ValidationInfo
 from pyproj import CRS
 
 from mt_metadata.base import MetadataBase
@@ -23,11 +23,15 @@ from mt_metadata.common.list_dict import ListDict
 from mt_metadata.timeseries import Station
 from mt_metadata.timeseries.filters import (
     CoefficientFilter,
+    FilterRegistry,
     FIRFilter,
     FrequencyResponseTableFilter,
     PoleZeroFilter,
     TimeDelayFilter,
 )
+from mt_metadata.utils.interval_index import RunIntervalIndex
+from mt_metadata.utils.spatial_index import SpatialIndex
+
 
 # =====================================================
 
@@ -332,6 +336,21 @@ class Survey(MetadataBase):
         ),
     ]
 
+    # stations, stations.version and time_period when the time period and
+    # bounding box were last updated, and the latitude and longitude range of
+    # the stations, adding a station only extends them while they are
+    # unchanged
+    _aggregate_version: tuple | None = PrivateAttr(None)
+    _station_extent: tuple | None = PrivateAttr(None)
+    # flags of stations whose time period changed since then, and of stations
+    # whose id or location changed, which needs a full update
+    _changed_time_periods: set = PrivateAttr(default_factory=set)
+    _changed_stations: set = PrivateAttr(default_factory=set)
+    # stations, stations.version and the spatial index built from them
+    _spatial_index: tuple | None = PrivateAttr(None)
+    # filters, filters.version and the filter registry built from them
+    _filter_registry: tuple | None = PrivateAttr(None)
+
     @field_validator("comments", mode="before")
     @classmethod
     def validate_comments(cls, value, info: ValidationInfo) -> Comment:
@@ -582,6 +601,66 @@ class Survey(MetadataBase):
         """return a list of filter names"""
         return list(self.filters.keys())
 
+    @property
+    def filter_registry(self) -> FilterRegistry:
+        """
+        Index of the filters by content hash, built the first time it is
+        needed and again after filters are set or removed other than with
+        :meth:`add_filter`.
+
+        :return: registry of the survey filters
+        :rtype: :class:`mt_metadata.timeseries.filters.FilterRegistry`
+
+        """
+        if self._filter_registry is not None:
+            filters, version, registry = self._filter_registry
+            if filters is self.filters and version == self.filters.version:
+                return registry
+
+        registry = FilterRegistry(self.filters.values())
+        self._filter_registry = (self.filters, self.filters.version, registry)
+        return registry
+
+    def find_filter(self, mt_filter):
+        """
+        Find a survey filter with the same content as `mt_filter`, names,
+        comments, calibration dates and sequence numbers are not compared.
+
+        :param mt_filter: filter to look for
+        :type mt_filter: :class:`mt_metadata.timeseries.filters.FilterBase`
+        :return: survey filter with the same content or None
+        :rtype: :class:`mt_metadata.timeseries.filters.FilterBase` | None
+
+        """
+        return self.filter_registry.find(mt_filter)
+
+    def add_filter(self, mt_filter, key=None):
+        """
+        Add a filter unless the survey already has a filter with the same
+        content, which is then returned instead.  Channels should refer to
+        the name of the returned filter.
+
+        :param mt_filter: filter to add
+        :type mt_filter: :class:`mt_metadata.timeseries.filters.FilterBase`
+        :param key: key of the filter in :attr:`filters`, defaults to the
+         filter name in lower case
+        :type key: str, optional
+        :return: survey filter with the content of `mt_filter`
+        :rtype: :class:`mt_metadata.timeseries.filters.FilterBase`
+
+        """
+        registry = self.filter_registry
+        existing = registry.find(mt_filter)
+        if existing is not None and existing is not mt_filter:
+            return existing
+
+        if key is None:
+            key = mt_filter.name.lower()
+        self.filters[key] = mt_filter
+        registry.add(mt_filter)
+        self._filter_registry = (self.filters, self.filters.version, registry)
+        return mt_filter
+
     def has_station(self, station_id):
         """
         Has station id
@@ -607,9 +686,10 @@ class Survey(MetadataBase):
 
         """
 
-        if self.has_station(station_id):
-            return self.station_names.index(station_id)
-        return None
+        try:
+            return self.stations.index(station_id)
+        except KeyError:
+            return None
 
     def add_station(self, station_obj, update=True):
         """
@@ -625,18 +705,27 @@ class Survey(MetadataBase):
                 f"Input must be a mt_metadata.timeseries.Station object not {type(station_obj)}"
             )
 
+        extend = False
         if self.has_station(station_obj.id):
             self.stations[station_obj.id].update(station_obj)
             logger.warning(
                 f"Station {station_obj.id} already exists, updating metadata"
             )
         else:
+            extend = self._aggregates_are_current()
             self.stations.append(station_obj)
 
         if update:
-            self.update_bounding_box()
-            self.update_time_period()
-            self.update_station_keys()
+            if extend:
+                self._extend_bounding_box([station_obj])
+                self._extend_time_period(
+                    [flag.obj for flag in self._changed_time_periods] + [station_obj]
+                )
+            else:
+                self.update_bounding_box()
+                self.update_time_period()
+                self.update_station_keys()
+            self._set_aggregates_current()
 
     def get_station(self, station_id):
         """
@@ -667,8 +756,7 @@ class Survey(MetadataBase):
         if self.has_station(station_id):
             self.stations.remove(station_id)
             if update:
-                self.update_bounding_box()
-                self.update_time_period()
+                self.update_all()
         else:
             logger.warning(f"Could not find {station_id} to remove.")
 
@@ -695,53 +783,135 @@ class Survey(MetadataBase):
         """
         return self.stations.update_keys()
 
+    def _aggregates_are_current(self):
+        """
+        Have the time period and bounding box been updated from the stations
+        since a station was last added, replaced or removed, or since the id
+        or location of a station was changed.
+
+        Stations in the survey whose time period changed since then are in
+        `_changed_time_periods` and only need to be included again.
+
+        :return: True if adding a station only needs to extend them
+        :rtype: bool
+
+        """
+        if self._aggregate_version is None or self._changed_stations:
+            return False
+        stations, version, time_period = self._aggregate_version
+        return (
+            stations is self.stations
+            and version == self.stations.version
+            and time_period is self.time_period
+            and all(
+                self.has_station(flag.obj.id) and self.stations[flag.obj.id] is flag.obj
+                for flag in self._changed_time_periods
+            )
+        )
+
+    def _set_aggregates_current(self):
+        """
+        The time period and bounding box cover all of the stations.
+        """
+        self._aggregate_version = (
+            self.stations,
+            self.stations.version,
+            self.time_period,
+        )
+        self._changed_time_periods.clear()
+        self._changed_stations.clear()
+
+    def _watch_station(self, station):
+        """
+        Flag changes to the time period, id and location of the station,
+        which the time period and bounding box are derived from.
+
+        :param station: station in the survey
+        :type station: :class:`mt_metadata.timeseries.Station`
+
+        """
+        flag = station._get_change_flag(self._changed_time_periods)
+        station._attach_change_flag(flag, ("time_period",))
+        station.time_period._attach_change_flag(flag, ("start", "end"))
+        flag = station._get_change_flag(self._changed_stations)
+        station._attach_change_flag(flag, ("id", "location"))
+        station.location._attach_change_flag(flag, ("latitude", "longitude"))
+
+    def _extend_bounding_box(self, stations):
+        """
+        Extend the latitude and longitude range of the stations already
+        included with the given stations and set the bounding box from it.
+
+        :param stations: stations to include
+        :type stations: iterable of :class:`mt_metadata.timeseries.Station`
+
+        """
+        min_lat, max_lat, min_lon, max_lon = self._station_extent or (None,) * 4
+        for station in stations:
+            self._watch_station(station)
+            lat = station.location.latitude
+            lon = station.location.longitude
+            if lat is not None:
+                min_lat = lat if min_lat is None else min(min_lat, lat)
+                max_lat = lat if max_lat is None else max(max_lat, lat)
+            if lon is not None:
+                min_lon = lon if min_lon is None else min(min_lon, lon)
+                max_lon = lon if max_lon is None else max(max_lon, lon)
+        self._station_extent = (min_lat, max_lat, min_lon, max_lon)
+
+        if min_lat is not None:
+            self.southeast_corner.latitude = min_lat
+            self.northwest_corner.latitude = max_lat
+        if min_lon is not None:
+            self.southeast_corner.longitude = max_lon
+            self.northwest_corner.longitude = min_lon
+
     def update_bounding_box(self):
         """
         Update the bounding box of the survey from the station information
 
         """
         if self.n_stations > 0:
-            lat = []
-            lon = []
-            for station in self.stations:
-                if station.location.latitude is not None:
-                    lat.append(station.location.latitude)
-                if station.location.longitude is not None:
-                    lon.append(station.location.longitude)
-
-            if not len(lat) == 0:
-                self.southeast_corner.latitude = min(lat)
-                self.northwest_corner.latitude = max(lat)
-            if not len(lon) == 0:
-                self.southeast_corner.longitude = max(lon)
-                self.northwest_corner.longitude = min(lon)
+            self._station_extent = None
+            self._extend_bounding_box(self.stations)
 
-    def update_time_period(self):
+    def _extend_time_period(self, stations):
         """
-        Update the start and end time of the survey based on the stations
+        Extend the start and end time of the survey to include the stations
+
+        :param stations: stations to include
+        :type stations: iterable of :class:`mt_metadata.timeseries.Station`
+
         """
-        if self.__len__() > 0:
-            start = []
-            end = []
-            for station in self.stations:
-                if not station.time_period.start_is_default():
-                    start.append(station.time_period.start)
-                if not station.time_period.end_is_default():
-                    end.append(station.time_period.end)
-
-            if start:
-                if self.time_period.start_is_default():
+        start = []
+        end = []
+        for station in stations:
+            self._watch_station(station)
+            if not station.time_period.start_is_default():
+                start.append(station.time_period.start)
+            if not station.time_period.end_is_default():
+                end.append(station.time_period.end)
+
+        if start:
+            if self.time_period.start_is_default():
+                self.time_period.start_date = min(start)
+            else:
+                if self.time_period.start_date > min(start):
                     self.time_period.start_date = min(start)
-                else:
-                    if self.time_period.start_date > min(start):
-                        self.time_period.start_date = min(start)
 
-            if end:
-                if self.time_period.end_is_default():
+        if end:
+            if self.time_period.end_is_default():
+                self.time_period.end_date = max(end)
+            else:
+                if self.time_period.end_date < max(end):
                     self.time_period.end_date = max(end)
-                else:
-                    if self.time_period.end_date < max(end):
-                        self.time_period.end_date = max(end)
+
+    def update_time_period(self):
+        """
+        Update the start and end time of the survey based on the stations
+        """
+        if self.__len__() > 0:
+            self._extend_time_period(self.stations)
 
     def update_all(self):
         """
@@ -749,3 +919,122 @@ class Survey(MetadataBase):
         """
         self.update_time_period()
         self.update_bounding_box()
+        self._set_aggregates_current()
+
+    def run_interval_index(self) -> RunIntervalIndex:
+        """
+        Build an interval index over the runs of every station, used to find
+        runs that overlap in time.
+
+        :return: index of the run time periods
+        :rtype: :class:`mt_metadata.utils.interval_index.RunIntervalIndex`
+
+        """
+        return RunIntervalIndex.from_stations(self.stations, survey=self.id)
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """
+        Index of the station locations, built the first time it is needed
+        and again after a station is added, replaced or removed.
+
+        Changes made to the location of a station after it was added are not
+        tracked, call :meth:`reset_spatial_index` after moving a station.
+
+        :return: index of the station locations keyed by station id
+        :rtype: :class:`mt_metadata.utils.spatial_index.SpatialIndex`
+
+        """
+        if self._spatial_index is not None:
+            stations, version, index = self._spatial_index
+            if stations is self.stations and version == self.stations.version:
+                return index
+
+        index = SpatialIndex.from_stations(
+            self.stations.values(), keys=self.stations.keys()
+        )
+        self._spatial_index = (self.stations, self.stations.version, index)
+        return index
+
+    def reset_spatial_index(self):
+        """
+        Build the spatial index again the next time it is needed.
+        """
+        self._spatial_index = None
+
+    def stations_within(self, bbox):
+        """
+        Get the stations inside a bounding box, edges are included.
+
+        :param bbox: bounding box in the form of :attr:`survey_extent`,
+         {"latitude": {"min", "max"}, "longitude": {"min", "max"}}, or
+         (min_latitude, max_latitude, min_longitude, max_longitude). If
+         the minimum longitude is larger than the maximum the box crosses
+         the antimeridian.
+        :type bbox: dict or tuple
+        :return: stations in the box
+        :rtype: list of :class:`mt_metadata.timeseries.Station`
+
+        """
+        if isinstance(bbox, dict):
+            bbox = (
+                bbox["latitude"]["min"],
+                bbox["latitude"]["max"],
+                bbox["longitude"]["min"],
+                bbox["longitude"]["max"],
+            )
+        if len(bbox) != 4:
+            raise ValueError(
+                "bbox must be (min_latitude, max_latitude, min_longitude, "
+                f"max_longitude) not {bbox}"
+            )
+        keys = self.spatial_index.within_bounding_box(*bbox)
+        return [self.stations[key] for key in keys]
+
+    def nearest_stations(self, latitude, longitude, k=1, return_distance=False):
+        """
+        Get the k stations nearest to a point.
+
+        :param latitude: latitude of the point in decimal degrees
+        :type latitude: float
+        :param longitude: longitude of the point in decimal degrees
+        :type longitude: float
+        :param k: number of stations, defaults to 1
+        :type k: int, optional
+        :param return_distance: also return great circle distances in meters,
+         defaults to False
+        :type return_distance: bool, optional
+        :return: stations, closest first, and distances if return_distance
+        :rtype: list or tuple(list, np.ndarray)
+
+        """
+        keys, distances = self.spatial_index.nearest(latitude, longitude, k=k)
+        stations = [self.stations[key] for key in keys]
+        if return_distance:
+            return stations, distances
+        return stations
+
+    def stations_within_radius(
+        self, latitude, longitude, radius, return_distance=False
+    ):
+        """
+        Get the stations within a great circle distance of a point.
+
+        :param latitude: latitude of the point in decimal degrees
+        :type latitude: float
+        :param longitude: longitude of the point in decimal degrees
+        :type longitude: float
+        :param radius: distance from the point in meters
+        :type radius: float
+        :param return_distance: also return great circle distances in meters,
+         defaults to False
+        :type return_distance: bool, optional
+        :return: stations, closest first, and distances if return_distance
+        :rtype: list or tuple(list, np.ndarray)
+
+        """
+        keys, distances = self.spatial_index.within_radius(latitude, longitude, radius)
+        stations = [self.stations[key] for key in keys]
+        if return_distance:
+            return stations, distances
+        return stations
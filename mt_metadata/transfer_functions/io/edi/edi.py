@@ -15,8 +15,9 @@ Updated 2021 to used mt_metadata type metadata and how spectra are read.
 # ==============================================================================
 #  Imports
 # ==============================================================================
+import re
 from pathlib import Path
-from typing import Literal
+from typing import Iterable, Iterator, Literal, TextIO
 
 import numpy as np
 from loguru import logger
@@ -31,6 +32,7 @@ from mt_metadata.transfer_functions.io.edi.metadata import (
     Information,
 )
 from mt_metadata.transfer_functions.io.tools import (
+    _clean_edi_line,
     _validate_edi_lines,
     _validate_str_with_equals,
     get_nm_elev,
@@ -38,6 +40,28 @@ from mt_metadata.transfer_functions.io.tools import (
 )
 
 
+# flags, width and precision of a format spec that printf style formatting
+# writes the same way, e.g. " 15.6e"
+_PRINTF_SPEC_PATTERN = re.compile(r"[ +]?\d*(?:\.\d+)?[eEfFgG]")
+
+
+def _format_spec_to_printf(format_spec: str) -> str | None:
+    """
+    Convert a format spec to a printf style format so values can be
+    formatted in bulk with ``np.char.mod``.
+
+    :param format_spec: format spec used with ``format``, e.g. " 15.6e"
+    :type format_spec: str
+    :return: printf style format, e.g. "% 15.6e", None if the spec has
+     no printf equivalent
+    :rtype: str | None
+
+    """
+    if _PRINTF_SPEC_PATTERN.fullmatch(format_spec):
+        return f"%{format_spec}"
+    return None
+
+
 # ==============================================================================
 # EDI Class
 # ==============================================================================
@@ -303,15 +327,17 @@ class EDI:
             msg = f"Cannot find EDI file: {self.fn}"
             self.logger.error(msg)
             raise IOError(msg)
+        # only the metadata sections are kept in memory, the data blocks are
+        # streamed from the open file
         with open(self.fn, "r") as fid:
-            self._edi_lines = _validate_edi_lines(fid.readlines())
-        self.Header.read_header(self._edi_lines)
-        self.Info.read_info(self._edi_lines)
-        self.Measurement.read_measurement(self._edi_lines)
-        self.Data.read_data(self._edi_lines)
-        self.Data.match_channels(self.Measurement.channel_ids)
+            self._edi_lines = _validate_edi_lines(self._read_metadata_lines(fid))
+            self.Header.read_header(self._edi_lines)
+            self.Info.read_info(self._edi_lines)
+            self.Measurement.read_measurement(self._edi_lines)
+            self.Data.read_data(self._edi_lines)
+            self.Data.match_channels(self.Measurement.channel_ids)
 
-        self._read_data()
+            self._read_data(self._stream_data_lines(fid))
 
         if self.Header.latitude in [None, 0.0]:
             self.Header.latitude = self.Measurement.reflat
@@ -327,13 +353,60 @@ class EDI:
             if self.lat != 0 and self.lon != 0:
                 self.elev = get_nm_elev(self.lat, self.lon)
 
-    def _read_data(self) -> None:
+    @staticmethod
+    def _read_metadata_lines(fid: TextIO) -> list[str]:
+        """
+        Read lines from an open edi file up to and including the first line
+        of the data blocks, the rest of the file is left unread.
+
+        Follows the same rules as
+        :meth:`mt_metadata.transfer_functions.io.edi.metadata.DataSection.get_data`,
+        the first line containing '>' after the '>=...SECT' line starts the
+        data blocks.
+
+        :param fid: open edi file
+        :type fid: TextIO
+        :return: lines of the metadata sections
+        :rtype: list[str]
+
+        """
+        lines = []
+        data_find = False
+        for line in fid:
+            lines.append(line)
+            if ">=" in line and "sect" in line.lower():
+                data_find = True
+            elif ">" in line and data_find:
+                break
+        return lines
+
+    def _stream_data_lines(self, fid: TextIO) -> Iterator[str]:
+        """
+        Iterate over the data block lines, starting with the lines already
+        read into ``_edi_lines`` and continuing with the rest of the file.
+
+        :param fid: open edi file positioned after the metadata lines
+        :type fid: TextIO
+        :return: data block lines
+        :rtype: Iterator[str]
+
+        """
+        yield from self._edi_lines[self.Data._line_num :]
+        for line in fid:
+            yield _clean_edi_line(line)
+
+    def _read_data(self, lines: Iterable[str] | None = None) -> None:
         """
         Read either impedance or spectra data depending on what the type is
         in the data section.
+
+        :param lines: data block lines, defaults to the lines in
+         ``_edi_lines`` after the data section
+        :type lines: Iterable[str] | None
         """
 
-        lines = self._edi_lines[self.Data._line_num :]
+        if lines is None:
+            lines = self._edi_lines[self.Data._line_num :]
 
         if self.Data._data_type_in == "spectra":
             self.logger.debug("Converting Spectra to Impedance and Tipper")
@@ -352,15 +425,16 @@ class EDI:
         elif self.Data._data_type_in == "z":
             self._read_mt(lines)
 
-    def _read_mt(self, data_lines: list[str]) -> None:
+    def _read_mt(self, data_lines: Iterable[str]) -> None:
         """
         Read in impedance and tipper data
 
-        :param data_lines: list of data lines from the edi file
-        :type data_lines: list
+        :param data_lines: data lines from the edi file
+        :type data_lines: Iterable[str]
         """
 
-        data_dict = {}
+        # collect the text of each data block and convert it in bulk
+        block_dict = {}
         data_find = False
         for line in data_lines:
             line = line.strip()
@@ -371,25 +445,15 @@ class EDI:
                 key = line_list[0].lower()
                 if key in self._accepted_keys:
                     data_find = True
-                    data_dict[key] = []
+                    block_dict[key] = []
                 else:
                     data_find = False
             elif data_find and ">" not in line and "!" not in line:
-                d_lines = line.strip().split()
-                for ii, dd in enumerate(d_lines):
-                    # check for empty values and set them to 0, check for any
-                    # other characters sometimes there are ****** for a null
-                    # component
-                    try:
-                        d_lines[ii] = float(dd)
-                        if d_lines[ii] == self.Header.empty:
-                            d_lines[ii] = 0.0
-                    except ValueError:
-                        d_lines[ii] = 0.0
-                data_dict[key] += d_lines
-        # put everything into arrays
-        for key, k_list in data_dict.items():
-            data_dict[key] = np.array(k_list)
+                block_dict[key].append(line)
+
+        data_dict = {
+            key: self._parse_data_block(block) for key, block in block_dict.items()
+        }
         # fill useful arrays
         self.frequency = data_dict["freq"]
         self.z = np.zeros((self.frequency.size, 2, 2), dtype=complex)
@@ -457,6 +521,47 @@ class EDI:
             except KeyError:
                 self.rotation_angle = np.zeros_like(self.frequency)
 
+    def _parse_data_block(self, block_lines: list[str]) -> np.ndarray:
+        """
+        Convert the lines of a data block into an array of floats.
+
+        Empty values and any other non-numeric entries, sometimes there are
+        ****** for a null component, are set to 0.
+
+        :param block_lines: data lines of a single block
+        :type block_lines: list[str]
+        :return: values of the block
+        :rtype: np.ndarray
+
+        """
+        tokens = np.array(" ".join(block_lines).split())
+        if tokens.size == 0:
+            return np.array([], dtype=float)
+
+        tokens[np.char.startswith(tokens, "*")] = "0"
+        try:
+            values = tokens.astype(float)
+        except ValueError:
+            values = np.array([self._token_to_float(token) for token in tokens])
+        values[values == self.Header.empty] = 0.0
+        return values
+
+    @staticmethod
+    def _token_to_float(token: str) -> float:
+        """
+        Convert a single data value to a float, 0 if it is not a number.
+
+        :param token: data value
+        :type token: str
+        :return: value
+        :rtype: float
+
+        """
+        try:
+            return float(token)
+        except ValueError:
+            return 0.0
+
     def _read_spectra(
         self,
         data_lines: list[str],
@@ -530,161 +635,238 @@ class EDI:
         )
         self.tf_err = np.zeros_like(self.tf, dtype=float)
 
-        for kk, key in enumerate(self.frequency):
-            # read in spectra  as an (n_channel x n_channel) array
-            spectra_arr = np.reshape(
-                np.array(data_dict[key]), (len(comp_list), len(comp_list))
-            )
+        if self.frequency.size == 0:
+            return
+
+        # read in spectra as an (n_frequency x n_channel x n_channel) array
+        spectra_arr = np.array(
+            [data_dict[key] for key in self.frequency], dtype=float
+        ).reshape((self.frequency.size, len(comp_list), len(comp_list)))
+        avgt = np.array([avgt_dict[key] for key in self.frequency], dtype=float)
+
+        s_arr = self._spectra_to_cross_powers(spectra_arr)
+
+        # from A. Kelbert's EMTF
+        # cross spectra matrices
+        index_maps = self._get_spectra_index_maps(cc)
+        rh = self._gather_cross_powers(s_arr, index_maps["rh"], (2, 2))
+        rr = self._gather_cross_powers(s_arr, index_maps["rr"], (2, 2))
+        hh = self._gather_cross_powers(s_arr, index_maps["hh"], (2, 2))
+        re = self._gather_cross_powers(
+            s_arr, index_maps["re"], (cc.n_inputs, cc.n_outputs)
+        )
+        he = self._gather_cross_powers(
+            s_arr, index_maps["he"], (cc.n_inputs, cc.n_outputs)
+        )
+        ee = self._gather_cross_powers(
+            s_arr, index_maps["ee"], (cc.n_outputs, cc.n_outputs)
+        )
 
-            # compute cross powers
-            s_arr = np.zeros_like(spectra_arr, dtype=complex)
-            for ii in range(s_arr.shape[0]):
-                for jj in range(ii, s_arr.shape[0]):
-                    if ii == jj:
-                        s_arr[ii, jj] = spectra_arr[ii, jj]
-                    else:
-                        # minus sign for complex conjugation
-                        # original spectra data are of form <A,B*>, but we need
-                        # the order <B,A*>...
-                        # this is achieved by complex conjugation of the
-                        # original entries
-                        s_arr[ii, jj] = complex(
-                            spectra_arr[jj, ii], -spectra_arr[ii, jj]
-                        )
-                        # keep complex conjugated entries in the lower
-                        # triangular matrix:
-                        s_arr[jj, ii] = complex(
-                            spectra_arr[jj, ii], spectra_arr[ii, jj]
-                        )
-            # check for empty values
-            s_arr[s_arr == 0] = np.nan
-            s_arr[s_arr == self.Header.empty] = np.nan
-
-            # from A. Kelbert's EMTF
-            # cross spectra matrices
-
-            # Note we changed the indices to [ex, ey, hz] from [hz, ex, ey]
-            # input channels
-            rh = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
-            rr = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
-            hh = np.zeros((cc.n_inputs, cc.n_inputs), dtype=complex)
-
-            # output channels
-            re = np.zeros((cc.n_inputs, cc.n_outputs), dtype=complex)
-            he = np.zeros((cc.n_inputs, cc.n_outputs), dtype=complex)
-            ee = np.zeros((cc.n_outputs, cc.n_outputs), dtype=complex)
-
-            # fill in cross powers for input channels
-            rh[0, 0] = s_arr[cc.rhx, cc.hx]
-            rh[0, 1] = s_arr[cc.rhx, cc.hy]
-            rh[1, 0] = s_arr[cc.rhy, cc.hx]
-            rh[1, 1] = s_arr[cc.rhy, cc.hy]
-
-            rr[0, 0] = s_arr[cc.rhx, cc.rhx]
-            rr[0, 1] = s_arr[cc.rhx, cc.rhy]
-            rr[1, 0] = s_arr[cc.rhy, cc.rhx]
-            rr[1, 1] = s_arr[cc.rhy, cc.rhy]
-
-            hh[0, 0] = s_arr[cc.hx, cc.hx]
-            hh[0, 1] = s_arr[cc.hx, cc.hy]
-            hh[1, 0] = s_arr[cc.hy, cc.hx]
-            hh[1, 1] = s_arr[cc.hy, cc.hy]
-
-            # fill in cross powers for output channels
-            if cc.has_tipper and cc.has_electric:
-                re[0, 2] = s_arr[cc.rhx, cc.hz]
-                re[0, 0] = s_arr[cc.rhx, cc.ex]
-                re[0, 1] = s_arr[cc.rhx, cc.ey]
-                re[1, 2] = s_arr[cc.rhy, cc.hz]
-                re[1, 0] = s_arr[cc.rhy, cc.ex]
-                re[1, 1] = s_arr[cc.rhy, cc.ey]
-
-                he[0, 2] = s_arr[cc.hx, cc.hz]
-                he[0, 0] = s_arr[cc.hx, cc.ex]
-                he[0, 1] = s_arr[cc.hx, cc.ey]
-                he[1, 2] = s_arr[cc.hy, cc.hz]
-                he[1, 0] = s_arr[cc.hy, cc.ex]
-                he[1, 1] = s_arr[cc.hy, cc.ey]
-
-                ee[2, 2] = s_arr[cc.hz, cc.hz]
-                ee[2, 0] = s_arr[cc.hz, cc.ex]
-                ee[2, 1] = s_arr[cc.hz, cc.ey]
-                ee[0, 2] = s_arr[cc.ex, cc.hz]
-                ee[0, 0] = s_arr[cc.ex, cc.ex]
-                ee[0, 1] = s_arr[cc.ex, cc.ey]
-                ee[1, 2] = s_arr[cc.ey, cc.hz]
-                ee[1, 0] = s_arr[cc.ey, cc.ex]
-                ee[1, 1] = s_arr[cc.ey, cc.ey]
-            elif not cc.has_tipper and cc.has_electric:
-                re[0, 0] = s_arr[cc.rhx, cc.ex]
-                re[0, 1] = s_arr[cc.rhx, cc.ey]
-                re[1, 0] = s_arr[cc.rhy, cc.ex]
-                re[1, 0] = s_arr[cc.rhy, cc.ey]
-
-                he[0, 0] = s_arr[cc.hx, cc.ex]
-                he[0, 1] = s_arr[cc.hx, cc.ey]
-                he[0, 1] = s_arr[cc.hy, cc.ex]
-                he[1, 1] = s_arr[cc.hy, cc.ey]
-
-                ee[0, 0] = s_arr[cc.ex, cc.ex]
-                ee[0, 1] = s_arr[cc.ex, cc.ey]
-                ee[1, 0] = s_arr[cc.ey, cc.ex]
-                ee[1, 1] = s_arr[cc.ey, cc.ey]
-            elif cc.has_tipper and not cc.has_electric:
-                re[0, 0] = s_arr[cc.rhx, cc.hz]
-                re[1, 0] = s_arr[cc.rhy, cc.hz]
-
-                he[0, 0] = s_arr[cc.hx, cc.hz]
-                he[1, 0] = s_arr[cc.hy, cc.hz]
-
-                ee[0, 0] = s_arr[cc.hz, cc.hz]
-            # check to make sure the values are legit for accurate results
-            if abs(np.linalg.det(rh)) < np.finfo(float).eps:
+        # check to make sure the values are legit for accurate results
+        rh_det = np.abs(np.linalg.det(rh))
+        for key, det in zip(self.frequency, rh_det):
+            if det < np.finfo(float).eps:
                 self.logger.warning(
                     "spectral matrix determinant is too small "
-                    f"{abs(np.linalg.det(rh))} for period {key}. "
+                    f"{det} for period {key}. "
                     "Results may be inaccurate"
                 )
-            tfh = np.matmul(np.linalg.inv(rh), re)
-            tf = tfh.conj().T
 
-            sig = np.matmul(
-                np.linalg.inv(rh), np.matmul(rr, np.linalg.inv(rh.conj().T))
-            )
-            res = (
-                ee
-                - np.matmul(tf, he)
-                - np.matmul(he.conj().T, tfh)
-                + np.matmul(tf, np.matmul(hh, tfh))
-            ) / avgt_dict[key]
-
-            # variance = abs(np.dot(res[0 : cc.n_inputs, :].T, sig))
-            variance = np.zeros((cc.n_outputs, cc.n_inputs), dtype=complex)
-            for nn in range(cc.n_outputs):
-                for mm in range(cc.n_inputs):
-                    variance[nn, mm] = res[nn, nn] * sig[mm, mm]
-
-            tf_err = np.sqrt(np.abs(variance))
-            self.tf[kk, :, :] = tf
-            self.tf_err[kk, :, :] = np.sqrt(np.abs(variance))
-            self.signal_inverse_power[kk, :, :] = sig
-            self.residual_covariance[kk, :, :] = res
-
-            if cc.has_tipper and cc.has_electric:
-                self.z[kk, :, :] = tf[0:2, :]
-                self.z_err[kk, :, :] = tf_err[0:2, :]
-                self.t[kk, :, :] = tf[2, :]
-                self.t_err[kk, :, :] = tf_err[2, :]
-                self.z_err[np.where(np.nan_to_num(self.z_err) == 0.0)] = 1.0
-                self.t_err[np.nan_to_num(self.t_err) == 0.0] = 1.0
-            elif not cc.has_tipper and cc.has_electric:
-                self.z[kk, :, :] = tf[:, :]
-                self.z_err[kk, :, :] = tf_err[:, :]
-                self.z_err[np.where(np.nan_to_num(self.z_err) == 0.0)] = 1.0
-            elif cc.has_tipper and not cc.has_electric:
-                self.t[kk, :, :] = tf[:, :]
-                self.t_err[kk, :, :] = tf_err[:, :]
-                self.t_err[np.nan_to_num(self.t_err) == 0.0] = 1.0
+        rh_inv = np.linalg.inv(rh)
+        tfh = np.matmul(rh_inv, re)
+        tf = np.conj(np.swapaxes(tfh, -1, -2))
+
+        sig = np.matmul(
+            rh_inv,
+            np.matmul(rr, np.linalg.inv(np.conj(np.swapaxes(rh, -1, -2)))),
+        )
+        res = (
+            ee
+            - np.matmul(tf, he)
+            - np.matmul(np.conj(np.swapaxes(he, -1, -2)), tfh)
+            + np.matmul(tf, np.matmul(hh, tfh))
+        ) / avgt[:, np.newaxis, np.newaxis]
+
+        # variance[nn, mm] = res[nn, nn] * sig[mm, mm]
+        variance = (
+            np.diagonal(res, axis1=1, axis2=2)[:, :, np.newaxis]
+            * np.diagonal(sig, axis1=1, axis2=2)[:, np.newaxis, :]
+        )
+        tf_err = np.sqrt(np.abs(variance))
+
+        self.tf[:] = tf
+        self.tf_err[:] = tf_err
+        self.signal_inverse_power[:] = sig
+        self.residual_covariance[:] = res
+
+        if cc.has_tipper and cc.has_electric:
+            self.z[:] = tf[:, 0:2, :]
+            self.z_err[:] = tf_err[:, 0:2, :]
+            self.t[:] = tf[:, 2:3, :]
+            self.t_err[:] = tf_err[:, 2:3, :]
+            self.z_err[np.nan_to_num(self.z_err) == 0.0] = 1.0
+            self.t_err[np.nan_to_num(self.t_err) == 0.0] = 1.0
+        elif not cc.has_tipper and cc.has_electric:
+            self.z[:] = tf
+            self.z_err[:] = tf_err
+            self.z_err[np.nan_to_num(self.z_err) == 0.0] = 1.0
+        elif cc.has_tipper and not cc.has_electric:
+            self.t[:] = tf
+            self.t_err[:] = tf_err
+            self.t_err[np.nan_to_num(self.t_err) == 0.0] = 1.0
+
+    def _spectra_to_cross_powers(self, spectra_arr: np.ndarray) -> np.ndarray:
+        """
+        Convert real valued spectra into complex cross powers.
+
+        Original spectra data are of form <A,B*> with the real part in the
+        lower triangle and the imaginary part in the upper triangle, but we
+        need the order <B,A*>.  This is achieved by complex conjugation of the
+        original entries, the conjugated entries are kept in the lower
+        triangle.  Zeros and empty values are set to NaN.
+
+        :param spectra_arr: spectra of shape (n_frequency, n_channel, n_channel)
+        :type spectra_arr: np.ndarray
+        :return: cross powers of the same shape
+        :rtype: np.ndarray
+
+        """
+        n_channels = spectra_arr.shape[-1]
+        upper = np.triu(np.ones((n_channels, n_channels), dtype=bool), k=1)
+        lower = upper.T
+        spectra_t = np.swapaxes(spectra_arr, -1, -2)
+
+        # set real and imaginary parts separately, like complex(real, imag),
+        # so a NaN in one part does not leak into the other
+        s_arr = np.zeros(spectra_arr.shape, dtype=complex)
+        s_arr.real = np.where(upper, spectra_t, spectra_arr)
+        s_arr.imag = np.where(lower, spectra_t, np.where(upper, -spectra_arr, 0.0))
+
+        # check for empty values
+        s_arr[s_arr == 0] = np.nan
+        s_arr[s_arr == self.Header.empty] = np.nan
+        return s_arr
+
+    @staticmethod
+    def _get_spectra_index_maps(cc) -> dict[str, dict[tuple, tuple]]:
+        """
+        Map the entries of each cross spectra matrix to indices of the cross
+        power array.
+
+        Note we changed the indices to [ex, ey, hz] from [hz, ex, ey].
+
+        :param cc: channel indices of the spectra
+        :type cc: :class:`mt_metadata.transfer_functions.io.tools.index_locator`
+        :return: {matrix name: {(row, column): (channel_01, channel_02)}}
+        :rtype: dict
+
+        """
+        # fill in cross powers for input channels
+        index_maps = {
+            "rh": {
+                (0, 0): (cc.rhx, cc.hx),
+                (0, 1): (cc.rhx, cc.hy),
+                (1, 0): (cc.rhy, cc.hx),
+                (1, 1): (cc.rhy, cc.hy),
+            },
+            "rr": {
+                (0, 0): (cc.rhx, cc.rhx),
+                (0, 1): (cc.rhx, cc.rhy),
+                (1, 0): (cc.rhy, cc.rhx),
+                (1, 1): (cc.rhy, cc.rhy),
+            },
+            "hh": {
+                (0, 0): (cc.hx, cc.hx),
+                (0, 1): (cc.hx, cc.hy),
+                (1, 0): (cc.hy, cc.hx),
+                (1, 1): (cc.hy, cc.hy),
+            },
+        }
+
+        # fill in cross powers for output channels, entries are listed in the
+        # order they were historically assigned, later entries win
+        if cc.has_tipper and cc.has_electric:
+            re = [
+                ((0, 2), (cc.rhx, cc.hz)),
+                ((0, 0), (cc.rhx, cc.ex)),
+                ((0, 1), (cc.rhx, cc.ey)),
+                ((1, 2), (cc.rhy, cc.hz)),
+                ((1, 0), (cc.rhy, cc.ex)),
+                ((1, 1), (cc.rhy, cc.ey)),
+            ]
+            he = [
+                ((0, 2), (cc.hx, cc.hz)),
+                ((0, 0), (cc.hx, cc.ex)),
+                ((0, 1), (cc.hx, cc.ey)),
+                ((1, 2), (cc.hy, cc.hz)),
+                ((1, 0), (cc.hy, cc.ex)),
+                ((1, 1), (cc.hy, cc.ey)),
+            ]
+            ee = [
+                ((2, 2), (cc.hz, cc.hz)),
+                ((2, 0), (cc.hz, cc.ex)),
+                ((2, 1), (cc.hz, cc.ey)),
+                ((0, 2), (cc.ex, cc.hz)),
+                ((0, 0), (cc.ex, cc.ex)),
+                ((0, 1), (cc.ex, cc.ey)),
+                ((1, 2), (cc.ey, cc.hz)),
+                ((1, 0), (cc.ey, cc.ex)),
+                ((1, 1), (cc.ey, cc.ey)),
+            ]
+        elif not cc.has_tipper and cc.has_electric:
+            re = [
+                ((0, 0), (cc.rhx, cc.ex)),
+                ((0, 1), (cc.rhx, cc.ey)),
+                ((1, 0), (cc.rhy, cc.ex)),
+                ((1, 0), (cc.rhy, cc.ey)),
+            ]
+            he = [
+                ((0, 0), (cc.hx, cc.ex)),
+                ((0, 1), (cc.hx, cc.ey)),
+                ((0, 1), (cc.hy, cc.ex)),
+                ((1, 1), (cc.hy, cc.ey)),
+            ]
+            ee = [
+                ((0, 0), (cc.ex, cc.ex)),
+                ((0, 1), (cc.ex, cc.ey)),
+                ((1, 0), (cc.ey, cc.ex)),
+                ((1, 1), (cc.ey, cc.ey)),
+            ]
+        elif cc.has_tipper and not cc.has_electric:
+            re = [((0, 0), (cc.rhx, cc.hz)), ((1, 0), (cc.rhy, cc.hz))]
+            he = [((0, 0), (cc.hx, cc.hz)), ((1, 0), (cc.hy, cc.hz))]
+            ee = [((0, 0), (cc.hz, cc.hz))]
+        else:
+            re, he, ee = [], [], []
+
+        index_maps["re"] = dict(re)
+        index_maps["he"] = dict(he)
+        index_maps["ee"] = dict(ee)
+        return index_maps
+
+    @staticmethod
+    def _gather_cross_powers(
+        s_arr: np.ndarray, index_map: dict[tuple, tuple], shape: tuple[int, int]
+    ) -> np.ndarray:
+        """
+        Gather a stack of cross spectra matrices from the cross power array.
+
+        :param s_arr: cross powers of shape (n_frequency, n_channel, n_channel)
+        :type s_arr: np.ndarray
+        :param index_map: {(row, column): (channel_01, channel_02)}
+        :type index_map: dict
+        :param shape: shape of each cross spectra matrix
+        :type shape: tuple
+        :return: array of shape (n_frequency,) + shape
+        :rtype: np.ndarray
+
+        """
+        matrix = np.zeros((s_arr.shape[0],) + tuple(shape), dtype=complex)
+        if index_map:
+            rows, columns = zip(*index_map.keys())
+            channels_01, channels_02 = zip(*index_map.values())
+            matrix[:, rows, columns] = s_arr[:, channels_01, channels_02]
+        return matrix
 
     def write(
         self,
@@ -892,19 +1074,28 @@ class EDI:
             ]
         else:
             raise ValueError("Cannot write block for {0}".format(data_key))
-        for d_index, d_comp in enumerate(data_comp_arr, 1):
-            if d_comp == 0.0 and data_key.lower() not in ["zrot", "trot"]:
-                d_comp = self.Header.empty
-            # write the string in the specified format
-            num_str = "{0:{1}}".format(d_comp, self._num_format)
-
-            # check to see if a new line is needed
-            if d_index % self._block_len == 0:
-                num_str += "\n"
-            # at the end of the block add a return
-            if d_index == data_comp_arr.size:
-                num_str += "\n"
-            block_lines.append(num_str)
+        values = np.asarray(data_comp_arr).ravel()
+        if data_key.lower() not in ["zrot", "trot"]:
+            values = np.where(values == 0.0, self.Header.empty, values)
+        if values.size == 0:
+            return block_lines
+
+        # write the strings in the specified format
+        printf_format = _format_spec_to_printf(self._num_format)
+        if printf_format is None:
+            num_strs = [
+                "{0:{1}}".format(d_comp, self._num_format) for d_comp in values
+            ]
+        else:
+            num_strs = np.char.mod(printf_format, values).tolist()
+
+        # a new line every block_len values and a return at the end of the block
+        for index in range(0, values.size, self._block_len):
+            block_lines.append(
+                "".join(num_strs[index : index + self._block_len]) + "\n"
+            )
+        if values.size % self._block_len == 0:
+            block_lines.append("\n")
         return block_lines
 
     # -----------------------------------------------------------------------
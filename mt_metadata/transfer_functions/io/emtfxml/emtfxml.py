@@ -14,6 +14,7 @@ Created on Sat Sep  4 17:59:53 2021
 # Imports
 # =============================================================================
 import inspect
+import io
 from enum import Enum
 from pathlib import Path
 from xml.etree import cElementTree as et
@@ -323,10 +324,7 @@ class EMTFXML:
         with open(file=self.fn, mode="r", encoding="utf-8") as xml_fid:
             xml_string = xml_fid.read()
             xml_string = xml_string.replace("&", "and")
-            root = et.fromstring(
-                xml_string,
-                et.XMLParser(encoding="utf-8"),
-            )
+            root = self._parse_xml(xml_string)
 
         root_dict = helpers.element_to_dict(root)
         root_dict = root_dict[list(root_dict.keys())[0]]
@@ -334,6 +332,9 @@ class EMTFXML:
         self._root_dict = root_dict
 
         for element in self.element_keys:
+            if element == "data":
+                # read while parsing
+                continue
             attr = getattr(self, element)
             if hasattr(attr, "read_dict"):
                 attr.read_dict(root_dict)
@@ -358,6 +359,53 @@ class EMTFXML:
                     self.site.location.latitude, self.site.location.longitude
                 )
 
+    def _parse_xml(self, xml_string: str) -> et.Element:
+        """
+        Parse the xml string and read the <Data> block into `data`.
+
+        Each <Period> element is handed to `data.read_periods` as soon as it
+        is parsed and then removed, so the returned root only holds the
+        metadata elements and an empty <Data> element.
+
+        :param xml_string: contents of the xml file
+        :type xml_string: str
+        :return: root element without periods
+        :rtype: et.Element
+
+        """
+        elements = {}
+
+        def iter_periods():
+            depth = 0
+            in_data = False
+            for event, element in et.iterparse(
+                io.StringIO(xml_string), events=("start", "end")
+            ):
+                if event == "start":
+                    depth += 1
+                    if depth == 1:
+                        elements["root"] = element
+                    elif depth == 2 and element.tag.lower() == "data":
+                        elements["data"] = element
+                        in_data = True
+                    continue
+                if in_data and depth == 3 and element.tag.lower() == "period":
+                    yield element
+                    elements["data"].remove(element)
+                elif in_data and depth == 2:
+                    in_data = False
+                depth -= 1
+
+        self.data.read_periods(iter_periods())
+        if "data" in elements:
+            count = elements["data"].get("count")
+            if count is not None and int(float(count.strip())) != self.data.n_periods:
+                logger.warning(
+                    f"Data count {count.strip()} does not match the number of "
+                    f"periods {self.data.n_periods}."
+                )
+        return elements["root"]
+
     def write(self, fn: str | Path, skip_field_notes: bool = False) -> None:
         """
         Write an xml
@@ -411,7 +459,7 @@ class EMTFXML:
         emtf_element = emtf_helpers._remove_null_values(emtf_element)
 
         with open(fn, "w") as fid:
-            fid.write(helpers.element_to_string(emtf_element))
+            helpers.write_element(emtf_element, fid)
 
         self.fn = fn
 
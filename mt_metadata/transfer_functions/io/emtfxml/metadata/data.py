@@ -5,7 +5,7 @@ Created on Mon Sep  6 13:53:55 2021
 @author: jpeacock
 """
 
-from typing import Annotated, ClassVar
+from typing import Annotated, ClassVar, Iterable
 from xml.etree import cElementTree as et
 
 # =============================================================================
@@ -362,53 +362,164 @@ class TransferFunction(MetadataBase):
             self.period[ii] = float(block["value"])  # type: ignore[assignment]
             self.read_block(block, ii)
 
-    def write_block(self, parent: et.Element, index: int) -> et.Element:
+    def read_element(self, data_element: et.Element) -> None:
         """
-        Write a data block
+        Read a <Data> element directly, without converting it to a dictionary.
 
-        :param parent: DESCRIPTION
-        :type parent: TYPE
-        :return: DESCRIPTION
-        :rtype: TYPE
+        :param data_element: <Data> element with <Period> children
+        :type data_element: et.Element
+        :return: None
+        :rtype: None
 
         """
+        period_elements = [
+            element for element in data_element if element.tag.lower() == "period"
+        ]
+        count = data_element.get("count")
+        if count is not None:
+            n_periods = int(float(count.strip()))
+        else:
+            n_periods = len(period_elements)
+        self.read_periods(period_elements, n_periods)
 
-        period_element = et.SubElement(
-            parent,
-            "Period",
-            {"value": f"{self.period[index]:.12e}", "units": "secs"},  # type: ignore[arg-type]
-        )
+    def read_periods(
+        self, period_elements: Iterable[et.Element], n_periods: int | None = None
+    ) -> None:
+        """
+        Read <Period> elements and fill the arrays.
+
+        The text of each value is gathered for all periods and converted
+        once per component.  Only the text is kept, so `period_elements`
+        can be a generator that clears each element after it is read.
 
-        for key in self.array_dict.keys():
-            if self.array_dict[key] is None:
+        :param period_elements: <Period> elements in order
+        :type period_elements: Iterable[et.Element]
+        :param n_periods: number of periods, defaults to the number of
+         elements
+        :type n_periods: int | None
+        :return: None
+        :rtype: None
+
+        """
+        if self._skip_derived_data:
+            logger.debug("Skipping derived quantities.")
+
+        array_keys = self.array_dict.keys()
+        periods = []
+        # component: (dtype, [period, output, input] indices, value strings)
+        gathered = {}
+        for ii, period_element in enumerate(period_elements):
+            periods.append(float(period_element.get("value")))
+            for comp_element in period_element:
+                comp = comp_element.tag.lower().replace("_", "").replace(".", "_")
+                if self._skip_derived_data and comp in self._derived_keys:
+                    continue
+                if comp not in array_keys:
+                    logger.debug(f"Skipping unknown component {comp}.")
+                    continue
+                dtype = self._dtype_dict.get(comp_element.get("type"), "unknown")
+                if dtype not in [complex, float]:
+                    dtype = "unknown"
+                dtype, indices, values = gathered.setdefault(comp, (dtype, [], []))
+                for value_element in comp_element:
+                    if not value_element.text:
+                        continue
+                    indices.append(
+                        (
+                            ii,
+                            self._index_dict[value_element.get("output").lower()],
+                            self._index_dict[value_element.get("input").lower()],
+                        )
+                    )
+                    values.append(value_element.text)
+
+        if n_periods is None:
+            n_periods = len(periods)
+        self.initialize_arrays(n_periods)
+        self.period[: len(periods)] = periods
+        for comp, (dtype, indices, values) in gathered.items():
+            if not indices:
+                logger.debug(f"No value for {comp}")
                 continue
-            if self.array_dict[key].size == 0:
+            p_index, out_index, in_index = np.array(indices).T
+            self.array_dict[comp][p_index, out_index, in_index] = self._parse_values(
+                values, dtype
+            )
+
+    @staticmethod
+    def _parse_values(values: list[str], dtype: type | str) -> np.ndarray:
+        """
+        Convert value strings to numbers, "real imag" for complex values.
+
+        :param values: value strings
+        :type values: list[str]
+        :param dtype: complex, float or "unknown", in which case the
+         number of items in each string sets the type
+        :type dtype: type | str
+        :return: values
+        :rtype: np.ndarray
+
+        """
+        items = " ".join(values).split()
+        if dtype is complex and len(items) == 2 * len(values):
+            # pairs of real and imaginary parts
+            return np.array(items, dtype=float).view(complex)
+        if dtype is float and len(items) == len(values):
+            return np.array(items, dtype=float)
+
+        # unknown type or unexpected number of items, one value at a time
+        parsed = []
+        for value in values:
+            value = value.split()
+            if dtype is complex or (dtype == "unknown" and len(value) > 1):
+                parsed.append(complex(float(value[0]), float(value[1])))
+            else:
+                parsed.append(float(value[0]))
+        return np.array(parsed)
+
+    def _format_arrays(self, index: int | None = None) -> dict:
+        """
+        Format the values of each array as strings for all periods at once.
+
+        NaN values are set to 0 and 0 values are set to the empty value 1E32.
+
+        :param index: only format this period, defaults to all periods
+        :type index: int | None
+        :return: {key: (element attributes, [(row, column, value attributes)],
+         nested list of value strings [period][row][column])}
+        :rtype: dict
+
+        """
+        formatted = {}
+        for key, cube in self.array_dict.items():
+            if cube is None:
+                continue
+            if cube.size == 0:
                 logger.debug(f"No data for {key}, skipping.")
                 continue
-            arr = np.nan_to_num(self.array_dict[key][index])
+            if index is not None:
+                cube = cube[index : index + 1]
+            arr = np.nan_to_num(cube)
 
             # set zeros to empty value of 1E32
             if arr.dtype == complex:
-                arr[np.where(arr == 0)] = 1e32 + 1e32j
+                arr[arr == 0] = 1e32 + 1e32j
             else:
-                arr[np.where(arr == 0)] = 1e32
+                arr[arr == 0] = 1e32
 
             attr_dict = {
                 "type": self._dtype_dict[arr.dtype.name],
-                "size": str(arr.shape)[1:-1].replace(",", ""),
+                "size": str(arr.shape[1:])[1:-1].replace(",", ""),
             }
             try:
                 attr_dict["units"] = self._units_dict[key]
             except KeyError:
                 pass
 
-            comp_element = et.SubElement(
-                period_element, key.replace("_", ".").upper(), attr_dict
-            )
             idx_dict = self._write_dict[key]
-            shape = arr.shape
-            for ii in range(shape[0]):
-                for jj in range(shape[1]):
+            value_attrs = []
+            for ii in range(arr.shape[1]):
+                for jj in range(arr.shape[2]):
                     ch_out = idx_dict["out"][ii]
                     ch_in = idx_dict["in"][jj]
                     a_dict = {}
@@ -418,11 +529,53 @@ class TransferFunction(MetadataBase):
                         pass
                     a_dict["output"] = ch_out.capitalize()
                     a_dict["input"] = ch_in.capitalize()
-                    ch_element = et.SubElement(comp_element, "value", a_dict)
-                    ch_value = f"{arr[ii, jj].real:.6e}"
-                    if attr_dict["type"] in ["complex"]:
-                        ch_value = f"{ch_value} {arr[ii, jj].imag:.6e}"
-                    ch_element.text = ch_value
+                    value_attrs.append((ii, jj, a_dict))
+
+            values = np.char.mod("%.6e", arr.real)
+            if attr_dict["type"] in ["complex"]:
+                values = np.char.add(
+                    np.char.add(values, " "), np.char.mod("%.6e", arr.imag)
+                )
+            formatted[key] = (attr_dict, value_attrs, values.tolist())
+        return formatted
+
+    def write_block(
+        self, parent: et.Element, index: int, formatted: dict | None = None
+    ) -> et.Element:
+        """
+        Write a data block
+
+        :param parent: <Data> element to add the period to
+        :type parent: et.Element
+        :param index: index of the period
+        :type index: int
+        :param formatted: values of all periods formatted by `_format_arrays`,
+         if None only this period is formatted
+        :type formatted: dict | None
+        :return: <Period> element
+        :rtype: et.Element
+
+        """
+
+        period_element = et.SubElement(
+            parent,
+            "Period",
+            {"value": f"{self.period[index]:.12e}", "units": "secs"},  # type: ignore[arg-type]
+        )
+
+        if formatted is None:
+            formatted = self._format_arrays(index)
+            row = 0
+        else:
+            row = index
+
+        for key, (attr_dict, value_attrs, values) in formatted.items():
+            comp_element = et.SubElement(
+                period_element, key.replace("_", ".").upper(), attr_dict
+            )
+            for ii, jj, a_dict in value_attrs:
+                ch_element = et.SubElement(comp_element, "value", a_dict)
+                ch_element.text = values[row][ii][jj]
 
         return period_element
 
@@ -438,8 +591,9 @@ class TransferFunction(MetadataBase):
         """
         root = et.Element("Data", {"count": f"{self.n_periods:.0f}"})
 
+        formatted = self._format_arrays()
         for index in range(self.period.size):  # type: ignore[attribute-error]
-            self.write_block(root, index)
+            self.write_block(root, index, formatted)
 
         if string:
             return element_to_string(root)
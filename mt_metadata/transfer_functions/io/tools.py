@@ -137,6 +137,19 @@ class index_locator(object):
         return len(self.output_channels)
 
 
+def _clean_edi_line(line: str) -> str:
+    """
+    remove quotes and brackets from an edi line
+
+    :param line: line from an edi file
+    :type line: str
+
+    :returns: cleaned line
+    :rtype: str
+    """
+    return line.replace('"', "").replace("'", "").replace("[", "").replace("]", "")
+
+
 def _validate_edi_lines(edi_lines) -> list[str]:
     """
     check for carriage returns or hard returns
@@ -163,10 +176,7 @@ def _validate_edi_lines(edi_lines) -> list[str]:
         else:
             raise ValueError("*** EDI format not correct check file ***")
     else:
-        return [
-            line.replace('"', "").replace("'", "").replace("[", "").replace("]", "")
-            for line in edi_lines
-        ]
+        return [_clean_edi_line(line) for line in edi_lines]
 
 
 def get_nm_elev(latitude, longitude):
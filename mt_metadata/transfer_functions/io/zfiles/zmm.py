@@ -9,6 +9,7 @@ Translated from code by B. Murphy.
 # ==============================================================================
 # Imports
 # ==============================================================================
+import re
 from pathlib import Path
 
 import numpy as np
@@ -26,6 +27,24 @@ from .metadata import Channel
 # ==============================================================================
 PERIOD_FORMAT = ".10g"
 
+# patterns for the first token after each label of the period block header
+#   period :      0.01587    decimation level   1    freq. band from   46 to   80
+#   number of data point  951173 sampling freq.   0.004 Hz
+_PERIOD_PATTERN = re.compile(r":\s*(\S+)")
+_LEVEL_PATTERN = re.compile(r"level\s*(\S+)")
+_BAND_FROM_PATTERN = re.compile(r"from\s*(\S+)")
+_BAND_TO_PATTERN = re.compile(r"to\s*(\S+)")
+_NPTS_PATTERN = re.compile(r"point\s*(\S+)")
+_SAMPLE_RATE_PATTERN = re.compile(r"freq\.\s*(\S+)")
+# first two lines of each period block, the numbers follow
+_PERIOD_BLOCK_PATTERN = re.compile(r"period([^\n]*)\n([^\n]*)\n")
+# labels of the transfer function, signal power and residual covariance
+_SECTION_LABELS = (
+    "transfer functions",
+    "inverse coherent signal power matrix",
+    "residual covariance",
+)
+
 
 class ZMMError(Exception):
     pass
@@ -596,14 +615,8 @@ class ZMM(ZMMHeader):
         self._transfer_function = self._initialize_transfer_function()
         self.dataset = self._initialize_transfer_function()
 
-        ### read each data block and fill the appropriate array
-        for ii, period_block in enumerate(self._get_period_blocks()):
-            data_block = self._read_period_block(period_block)
-            self.periods[ii] = data_block["period"]
-
-            self._fill_tf_array_from_block(data_block["tf"], ii)
-            self._fill_sig_array_from_block(data_block["sig"], ii)
-            self._fill_res_array_from_block(data_block["res"], ii)
+        ### read the data blocks and fill the appropriate arrays
+        self._read_data_blocks()
         self._fill_dataset(
             rotate_to_measurement_coordinates=rotate_to_measurement_coordinates,
             use_declination=use_declination,
@@ -676,8 +689,22 @@ class ZMM(ZMMHeader):
         lines += [
             "",
         ]  # add 1 space separating header from data
-        for p in self.dataset.period.data:
-            a = self.dataset.sel(period=p)
+        tf_rows = self._format_matrix_rows(
+            self.dataset.transfer_function, self.output_channels, self.input_channels
+        )
+        isp_rows = self._format_matrix_rows(
+            self.dataset.inverse_signal_power,
+            self.input_channels,
+            self.input_channels,
+            lower=True,
+        )
+        res_rows = self._format_matrix_rows(
+            self.dataset.residual_covariance,
+            self.output_channels,
+            self.output_channels,
+            lower=True,
+        )
+        for index, p in enumerate(self.dataset.period.data):
             try:
                 dec_dict = self.decimation_dict[f"{p:{PERIOD_FORMAT}}"]
             except KeyError:
@@ -699,44 +726,199 @@ class ZMM(ZMMHeader):
             ]
             # write tf
             lines += [" Transfer Functions"]
-            for c_out in self.output_channels:
-                line = ""
-                for c_in in self.input_channels:
-                    c_in_name = self.channel_nomenclature[c_in]
-                    c_out_name = self.channel_nomenclature[c_out]
-                    tf_element = a.transfer_function.loc[
-                        dict(output=c_out_name, input=c_in_name)
-                    ].data
-                    line += f"{tf_element.real:>12.4E}{tf_element.imag:>12.4E}"
-                lines += [line]
+            lines += [row[index] for row in tf_rows]
             # write signal power
             lines += [" Inverse Coherent Signal Power Matrix"]
-            for ii, c_out in enumerate(self.input_channels):
-                line = ""
-                for c_in in self.input_channels[: ii + 1]:
-                    c_in_name = self.channel_nomenclature[c_in]
-                    c_out_name = self.channel_nomenclature[c_out]
-                    tf_element = a.inverse_signal_power.loc[
-                        dict(output=c_out_name, input=c_in_name)
-                    ].data
-                    line += f"{tf_element.real:>12.4E}{tf_element.imag:>12.4E}"
-                lines += [line]
+            lines += [row[index] for row in isp_rows]
             # write residual covariance
             lines += [" Residual Covariance"]
-            for ii, c_out in enumerate(self.output_channels):
-                line = ""
-                for c_in in self.output_channels[: ii + 1]:
-                    c_in_name = self.channel_nomenclature[c_in]
-                    c_out_name = self.channel_nomenclature[c_out]
-                    tf_element = a.residual_covariance.loc[
-                        dict(output=c_out_name, input=c_in_name)
-                    ].data
-                    line += f"{tf_element.real:>12.4E}{tf_element.imag:>12.4E}"
-                lines += [line]
+            lines += [row[index] for row in res_rows]
         with open(self.fn, "w") as fid:
             fid.write("\n".join(lines))
         return self.fn
 
+    def _format_matrix_rows(
+        self,
+        data_array: xr.DataArray,
+        row_channels: list[str],
+        column_channels: list[str],
+        lower: bool = False,
+    ) -> list[np.ndarray]:
+        """
+        Format the rows of a matrix for every period at once.
+
+        The data are pulled from the data array once, ordered by the channel
+        nomenclature, and each value is written as real and imaginary parts
+        with the format "%12.4E".
+
+        Parameters
+        ----------
+        data_array : xr.DataArray
+            Data array with dimensions period, output and input.
+        row_channels : list[str]
+            Channels of each row (output), standard names.
+        column_channels : list[str]
+            Channels of each column (input), standard names.
+        lower : bool, optional
+            Only write the lower triangle of the matrix, by default False.
+
+        Returns
+        -------
+        list[np.ndarray]
+            One array of strings for each row, indexed by period.
+        """
+        values = (
+            data_array.loc[
+                dict(
+                    output=[self.channel_nomenclature[ch] for ch in row_channels],
+                    input=[self.channel_nomenclature[ch] for ch in column_channels],
+                )
+            ]
+            .transpose("period", "output", "input")
+            .data
+        )
+        elements = np.char.add(
+            np.char.mod("%12.4E", values.real), np.char.mod("%12.4E", values.imag)
+        )
+        rows = []
+        for ii in range(len(row_channels)):
+            n_columns = ii + 1 if lower else len(column_channels)
+            row = np.full(values.shape[0], "", dtype=elements.dtype)
+            for jj in range(n_columns):
+                row = np.char.add(row, elements[:, ii, jj])
+            rows.append(row)
+        return rows
+
+    def _read_data_blocks(self) -> None:
+        """
+        Read all period blocks and fill the periods, transfer_functions,
+        sigma_s and sigma_e arrays.
+
+        The numbers of every block are converted to one float array and
+        reshaped with the number of output channels.  Each block holds
+
+            * transfer functions: n_out lines of 2 complex values
+            * inverse signal power: lower triangle of a 2 x 2 matrix
+            * residual covariance: lower triangle of an n_out x n_out matrix
+
+        If any block does not have the expected number of values the blocks
+        are read one at a time.
+        """
+        with open(self.fn, "r") as fid:
+            text = fid.read().lower()
+        for label in _SECTION_LABELS:
+            text = text.replace(label, "")
+
+        # [preamble, period line, npts line, numbers, period line, ...]
+        parts = _PERIOD_BLOCK_PATTERN.split(text)
+        if len(parts) < 4:
+            self._read_period_blocks()
+            return
+
+        n_out = self.num_channels - 2
+        n_tf = 2 * n_out
+        n_sig = 3
+        n_block = 2 * (n_tf + n_sig + n_out * (n_out + 1) // 2)
+
+        tokens = []
+        for block in parts[3::3]:
+            block_tokens = block.split()
+            if len(block_tokens) != n_block:
+                self._read_period_blocks()
+                return
+            tokens += block_tokens
+        try:
+            numbers = np.array(tokens, dtype=float)
+        except ValueError:
+            self._read_period_blocks()
+            return
+
+        periods = self._read_period_headers(parts[1::3], parts[2::3])
+        if periods is None:
+            self._read_period_blocks()
+            return
+        n_periods = len(periods)
+        self.periods[:n_periods] = periods
+
+        numbers = numbers.reshape((n_periods, n_block // 2, 2))
+        values = np.empty(numbers.shape[0:2], dtype=complex)
+        values.real = numbers[:, :, 0]
+        values.imag = numbers[:, :, 1]
+
+        # transfer functions are ordered by output channel then input channel
+        self.transfer_functions[:n_periods] = values[:, :n_tf].reshape(
+            (n_periods, n_out, 2)
+        )
+
+        # inverse signal power, lower triangle [00, 10, 11]
+        sig = values[:, n_tf : n_tf + n_sig]
+        self.sigma_s[:n_periods, 0, 0] = sig[:, 0]
+        self.sigma_s[:n_periods, 1, 0] = sig[:, 1]
+        self.sigma_s[:n_periods, 0, 1] = sig[:, 1].conjugate()
+        self.sigma_s[:n_periods, 1, 1] = sig[:, 2]
+
+        # residual covariance, lower triangle ordered by row
+        res = values[:, n_tf + n_sig :]
+        rows, columns = np.tril_indices(n_out)
+        self.sigma_e[:n_periods, columns, rows] = res.conjugate()
+        self.sigma_e[:n_periods, rows, columns] = res
+
+    def _read_period_blocks(self) -> None:
+        """
+        Read each period block one at a time and fill the appropriate arrays.
+        """
+        for ii, period_block in enumerate(self._get_period_blocks()):
+            data_block = self._read_period_block(period_block)
+            self.periods[ii] = data_block["period"]
+
+            self._fill_tf_array_from_block(data_block["tf"], ii)
+            self._fill_sig_array_from_block(data_block["sig"], ii)
+            self._fill_res_array_from_block(data_block["res"], ii)
+
+    def _read_period_headers(
+        self, period_lines: list[str], npts_lines: list[str]
+    ) -> list[float] | None:
+        """
+        Read the period and decimation information from the first two lines
+        of each period block and add them to the decimation_dict.
+
+        Parameters
+        ----------
+        period_lines : list[str]
+            Lower case period lines, starting after "period".
+        npts_lines : list[str]
+            Lower case lines with the number of points and sample rate.
+
+        Returns
+        -------
+        list[float] | None
+            Period of each block, None if a line could not be read.
+        """
+        period_text = "\n".join(period_lines)
+        npts_text = "\n".join(npts_lines)
+        fields = [
+            _PERIOD_PATTERN.findall(period_text),
+            _LEVEL_PATTERN.findall(period_text),
+            _BAND_FROM_PATTERN.findall(period_text),
+            _BAND_TO_PATTERN.findall(period_text),
+            _NPTS_PATTERN.findall(npts_text),
+            _SAMPLE_RATE_PATTERN.findall(npts_text),
+        ]
+        if any(len(field) != len(period_lines) for field in fields):
+            return None
+
+        periods = []
+        for period, level, band_from, band_to, npts, sample_rate in zip(*fields):
+            period = float(period)
+            self.decimation_dict[f"{period:{PERIOD_FORMAT}}"] = {
+                "level": int(level),
+                "bands": (int(band_from), int(band_to)),
+                "npts": int(npts),
+                "sample_rate": float(sample_rate),
+            }
+            periods.append(period)
+        return periods
+
     def _get_period_blocks(self) -> list[list[str]]:
         """
         split file into period blocks
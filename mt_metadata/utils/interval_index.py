@@ -0,0 +1,366 @@
+# ===============================================================
+# imports
+# ===============================================================
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from mt_metadata.common.mttime import MTime
+
+# ===============================================================
+
+INPUT_CHANNELS = ["hx", "hy"]
+RUN_COLUMNS = ["survey", "station", "run", "sample_rate", "start", "end"]
+PAIR_COLUMNS = [
+    "survey_01",
+    "station_01",
+    "run_01",
+    "survey_02",
+    "station_02",
+    "run_02",
+    "sample_rate",
+    "start",
+    "end",
+    "duration",
+]
+
+
+def _to_nanoseconds(value) -> int:
+    """
+    Get epoch nanoseconds from anything MTime understands.
+    """
+    if not isinstance(value, MTime):
+        value = MTime(time_stamp=value)
+    return value.epoch_nanoseconds
+
+
+class RunIntervalIndex:
+    """
+    Interval index over the time periods of runs for fast overlap queries
+    and for pairing simultaneous runs of different stations, as needed for
+    remote reference processing.
+
+    Start and end times are kept as int64 epoch nanoseconds sorted by
+    start time.  Runs with a default start or end time are not included.
+
+    Parameters
+    ----------
+    runs : pd.DataFrame
+        one row per run with columns survey, station, run, sample_rate,
+        start and end, start and end in epoch nanoseconds
+    channels : list[list[str]], optional
+        channels recorded by each run, used to fill input and output
+        channels of a dataset dataframe
+
+    Examples
+    --------
+    >>> index = survey.run_interval_index()
+    >>> index.overlapping_runs(("2020-01-01T00:00:00", "2020-01-02T00:00:00"))
+    >>> index.find_simultaneous_runs(min_overlap=3600, sample_rate=1)
+    """
+
+    def __init__(
+        self, runs: pd.DataFrame, channels: list[list[str]] | None = None
+    ) -> None:
+        if channels is None:
+            channels = [[] for _ in range(len(runs))]
+        if len(channels) != len(runs):
+            raise ValueError("channels must have one entry for each run")
+
+        runs = runs.reset_index(drop=True)
+        start = runs["start"].to_numpy(dtype=np.int64)
+        end = runs["end"].to_numpy(dtype=np.int64)
+        order = np.lexsort((end, start))
+
+        self._runs = runs.iloc[order].reset_index(drop=True)
+        self._channels = [channels[ii] for ii in order]
+        self._start = start[order]
+        self._end = end[order]
+        self._sample_rate = self._runs["sample_rate"].to_numpy(dtype=float)
+        self._stations = list(zip(self._runs["survey"], self._runs["station"]))
+        # runs are sorted by start, so the largest end of the runs up to each
+        # position increases and can be searched to skip runs that end early
+        self._max_end = np.maximum.accumulate(self._end)
+
+    @classmethod
+    def from_stations(cls, stations, survey: str | None = None) -> "RunIntervalIndex":
+        """
+        Build an index from the runs of station objects.
+
+        Parameters
+        ----------
+        stations : iterable of :class:`mt_metadata.timeseries.Station`
+            stations to index
+        survey : str, optional
+            survey id of the stations, by default None
+
+        Returns
+        -------
+        RunIntervalIndex
+            index of the run time periods
+        """
+        return cls._from_rows(cls._get_rows(stations, survey))
+
+    @classmethod
+    def from_surveys(cls, surveys) -> "RunIntervalIndex":
+        """
+        Build an index from the runs of all stations in survey objects.
+
+        Parameters
+        ----------
+        surveys : iterable of :class:`mt_metadata.timeseries.Survey`
+            surveys to index
+
+        Returns
+        -------
+        RunIntervalIndex
+            index of the run time periods
+        """
+        rows = []
+        for survey in surveys:
+            rows += cls._get_rows(survey.stations, survey.id)
+        return cls._from_rows(rows)
+
+    @staticmethod
+    def _get_rows(stations, survey: str | None) -> list[tuple]:
+        """
+        One row per run with a start and end time, the last entry is the
+        list of channels recorded.
+        """
+        rows = []
+        for station in stations:
+            for run in station.runs:
+                if run.time_period.start_is_default():
+                    continue
+                if run.time_period.end_is_default():
+                    continue
+                rows.append(
+                    (
+                        survey,
+                        station.id,
+                        run.id,
+                        run.sample_rate,
+                        run.time_period.start.epoch_nanoseconds,
+                        run.time_period.end.epoch_nanoseconds,
+                        run.channels_recorded_all,
+                    )
+                )
+        return rows
+
+    @classmethod
+    def _from_rows(cls, rows: list[tuple]) -> "RunIntervalIndex":
+        runs = pd.DataFrame([row[:-1] for row in rows], columns=RUN_COLUMNS)
+        runs = runs.astype({"start": np.int64, "end": np.int64})
+        return cls(runs, [row[-1] for row in rows])
+
+    def __len__(self) -> int:
+        return len(self._start)
+
+    @property
+    def runs(self) -> pd.DataFrame:
+        """
+        Runs in the index sorted by start time, start and end as timestamps.
+        """
+        return self._to_dataframe(np.arange(len(self)))
+
+    def _to_dataframe(self, indices: np.ndarray) -> pd.DataFrame:
+        df = self._runs.iloc[indices].reset_index(drop=True)
+        df["start"] = pd.to_datetime(self._start[indices], utc=True)
+        df["end"] = pd.to_datetime(self._end[indices], utc=True)
+        return df
+
+    def _overlapping(self, start: int, end: int) -> np.ndarray:
+        """
+        Positions of runs that overlap the interval [start, end).
+        """
+        # runs before `low` end before the interval starts, runs from `high`
+        # on start after the interval ends
+        low = np.searchsorted(self._max_end, start, side="right")
+        high = np.searchsorted(self._start, end, side="left")
+        candidates = np.arange(low, max(low, high))
+        return candidates[self._end[candidates] > start]
+
+    def overlapping_runs(self, time_period, sample_rate: float | None = None):
+        """
+        Get the runs that overlap a time period.
+
+        Parameters
+        ----------
+        time_period : :class:`mt_metadata.common.TimePeriod` | tuple
+            time period with start and end attributes or (start, end) in
+            any format MTime understands
+        sample_rate : float, optional
+            only include runs with this sample rate, by default None
+
+        Returns
+        -------
+        pd.DataFrame
+            runs that overlap the time period sorted by start time
+        """
+        if isinstance(time_period, (tuple, list)):
+            start, end = time_period
+        else:
+            start, end = time_period.start, time_period.end
+
+        indices = self._overlapping(_to_nanoseconds(start), _to_nanoseconds(end))
+        if sample_rate is not None:
+            indices = indices[np.isclose(self._sample_rate[indices], sample_rate)]
+        return self._to_dataframe(indices)
+
+    def _sweep(self, indices: np.ndarray, min_overlap: int) -> list[tuple]:
+        """
+        Sweep line over runs sorted by start, keeping the runs that have not
+        ended in a heap ordered by end time.  Every run in the heap overlaps
+        the run that is being added, so the work is O((n + k) log n) for k
+        overlapping pairs.
+        """
+        pairs = []
+        active = []
+        for index in indices:
+            start = self._start[index]
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            station = self._stations[index]
+            for end, other in active:
+                overlap_end = min(end, self._end[index])
+                if overlap_end - start < min_overlap:
+                    continue
+                if self._stations[other] == station:
+                    continue
+                pairs.append((other, index, start, overlap_end))
+            heapq.heappush(active, (self._end[index], index))
+        return pairs
+
+    def find_simultaneous_runs(
+        self, min_overlap: float = 0, sample_rate: float | None = None
+    ) -> pd.DataFrame:
+        """
+        Find every pair of runs from different stations with the same
+        sample rate that overlap in time.
+
+        Parameters
+        ----------
+        min_overlap : float, optional
+            minimum overlap in seconds, by default 0
+        sample_rate : float, optional
+            only pair runs with this sample rate, by default all sample rates
+
+        Returns
+        -------
+        pd.DataFrame
+            one row per pair with the survey, station and run of each run,
+            the sample rate and the start, end and duration in seconds of
+            the overlap, sorted by start of the overlap
+        """
+        min_overlap = int(round(min_overlap * 1e9))
+        pairs = []
+        for rate in np.unique(self._sample_rate):
+            if sample_rate is not None and not np.isclose(rate, sample_rate):
+                continue
+            indices = np.flatnonzero(self._sample_rate == rate)
+            pairs += self._sweep(indices, min_overlap)
+
+        pairs = np.array(pairs, dtype=np.int64).reshape(-1, 4)
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0], pairs[:, 2]))]
+        firsts, seconds, start, end = pairs.T
+        columns = {}
+        for suffix, indices in (("01", firsts), ("02", seconds)):
+            for key in ["survey", "station", "run"]:
+                columns[f"{key}_{suffix}"] = self._runs[key].to_numpy()[indices]
+        columns["sample_rate"] = self._sample_rate[firsts]
+        columns["start"] = start
+        columns["end"] = end
+        columns["duration"] = (end - start) / 1e9
+        df = pd.DataFrame(columns, columns=PAIR_COLUMNS)
+        df["start"] = pd.to_datetime(df["start"].astype(np.int64), utc=True)
+        df["end"] = pd.to_datetime(df["end"].astype(np.int64), utc=True)
+        return df
+
+    def to_dataset_dataframe(
+        self,
+        local_station: str,
+        remote_station: str,
+        min_overlap: float = 0,
+        sample_rate: float | None = None,
+        mth5_path: str = "",
+    ) -> pd.DataFrame:
+        """
+        Dataset dataframe of the simultaneous runs of a local and a remote
+        station that can be read by
+        :meth:`mt_metadata.processing.aurora.Stations.from_dataset_dataframe`.
+
+        Each overlap gives a row for the local run and a row for the remote
+        run with the start and end of the overlap.  Input channels are hx and
+        hy, output channels are the other channels recorded by the run.
+
+        Parameters
+        ----------
+        local_station : str
+            station id of the local station
+        remote_station : str
+            station id of the remote reference station
+        min_overlap : float, optional
+            minimum overlap in seconds, by default 0
+        sample_rate : float, optional
+            only pair runs with this sample rate, by default all sample rates
+        mth5_path : str, optional
+            path to the MTH5 file with the data, by default ""
+
+        Returns
+        -------
+        pd.DataFrame
+            dataset dataframe sorted by start time
+        """
+        pairs = self.find_simultaneous_runs(
+            min_overlap=min_overlap, sample_rate=sample_rate
+        )
+        positions = {
+            (row.survey, row.station, row.run): index
+            for index, row in enumerate(self._runs.itertuples())
+        }
+
+        rows = []
+        for pair in pairs.itertuples():
+            stations = {pair.station_01: "01", pair.station_02: "02"}
+            if set(stations) != {local_station, remote_station}:
+                continue
+            for station, remote in ((local_station, False), (remote_station, True)):
+                suffix = stations[station]
+                key = tuple(
+                    getattr(pair, f"{name}_{suffix}")
+                    for name in ("survey", "station", "run")
+                )
+                channels = self._channels[positions[key]]
+                input_channels = [ch for ch in INPUT_CHANNELS if ch in channels]
+                rows.append(
+                    {
+                        "survey": key[0],
+                        "station": key[1],
+                        "run": key[2],
+                        "start": pair.start,
+                        "end": pair.end,
+                        "mth5_path": mth5_path,
+                        "sample_rate": pair.sample_rate,
+                        "input_channels": input_channels,
+                        "output_channels": [
+                            ch for ch in channels if ch not in input_channels
+                        ],
+                        "remote": remote,
+                    }
+                )
+        return pd.DataFrame(
+            rows,
+            columns=[
+                "survey",
+                "station",
+                "run",
+                "start",
+                "end",
+                "mth5_path",
+                "sample_rate",
+                "input_channels",
+                "output_channels",
+                "remote",
+            ],
+        )
@@ -5,6 +5,9 @@ import numpy as np
 from loguru import logger
 
 # ===============================================================
+# mean radius of the Earth in meters (IUGG)
+EARTH_RADIUS = 6371008.8
+# ===============================================================
 
 
 def convert_position_float2str(position: float | int) -> str:
@@ -192,3 +195,45 @@ def validate_position(value: str | float, position_type: str) -> float:
     if not (abs(value) <= 180) and position_type in ["longitude", "lon"]:
         raise ValueError("longitude must be between -180 and 180 degrees")
     return value
+
+
+def great_circle_distance(
+    latitude_01: float | np.ndarray,
+    longitude_01: float | np.ndarray,
+    latitude_02: float | np.ndarray,
+    longitude_02: float | np.ndarray,
+    radius: float = EARTH_RADIUS,
+) -> float | np.ndarray:
+    """
+    Great circle distance between points on a sphere using the haversine
+    formula.  Inputs are broadcast against each other, so one point can be
+    compared to an array of points without a loop.
+
+    Parameters
+    ----------
+    latitude_01 : float | np.ndarray
+        latitude of the first point(s) in decimal degrees
+    longitude_01 : float | np.ndarray
+        longitude of the first point(s) in decimal degrees
+    latitude_02 : float | np.ndarray
+        latitude of the second point(s) in decimal degrees
+    longitude_02 : float | np.ndarray
+        longitude of the second point(s) in decimal degrees
+    radius : float, optional
+        radius of the sphere in meters, by default EARTH_RADIUS
+
+    Returns
+    -------
+    float | np.ndarray
+        distance in meters
+    """
+    lat_01 = np.radians(latitude_01)
+    lat_02 = np.radians(latitude_02)
+    d_lat = lat_02 - lat_01
+    d_lon = np.radians(np.subtract(longitude_02, longitude_01))
+
+    a = (
+        np.sin(d_lat / 2) ** 2
+        + np.cos(lat_01) * np.cos(lat_02) * np.sin(d_lon / 2) ** 2
+    )
+    return 2 * radius * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
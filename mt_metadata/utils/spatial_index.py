@@ -0,0 +1,256 @@
+# ===============================================================
+# imports
+# ===============================================================
+import numpy as np
+from scipy.spatial import cKDTree
+
+from mt_metadata.utils.location_helpers import EARTH_RADIUS, great_circle_distance
+
+
+# ===============================================================
+
+
+def _to_unit_vectors(latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    """
+    Convert latitude and longitude in decimal degrees to points on the unit
+    sphere, straight line distance between them increases with great
+    circle distance.
+    """
+    lat = np.radians(latitude)
+    lon = np.radians(longitude)
+    return np.column_stack(
+        (np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat))
+    )
+
+
+class SpatialIndex:
+    """
+    KD-tree over the locations of stations for nearest neighbour, radius
+    and bounding box queries.
+
+    Locations are placed on the unit sphere so the tree can be searched
+    with straight line distances, distances returned are great circle
+    distances in meters on the surface of the Earth.  Elevation is kept
+    with the locations but is not used in distances.
+
+    Stations without a latitude or longitude are not included.
+
+    Parameters
+    ----------
+    keys : list
+        key of each location, returned by the queries
+    latitude : np.ndarray
+        latitude of each location in decimal degrees
+    longitude : np.ndarray
+        longitude of each location in decimal degrees
+    elevation : np.ndarray, optional
+        elevation of each location in meters
+
+    Examples
+    --------
+    >>> index = SpatialIndex(["mt01", "mt02"], [40.0, 41.0], [-120.0, -120.0])
+    >>> index.nearest(40.1, -120.0, k=1)
+    (['mt01'], array([11119.49...]))
+    """
+
+    def __init__(
+        self,
+        keys: list,
+        latitude: np.ndarray,
+        longitude: np.ndarray,
+        elevation: np.ndarray | None = None,
+    ) -> None:
+        latitude = np.asarray(latitude, dtype=float)
+        longitude = np.asarray(longitude, dtype=float)
+        if elevation is None:
+            elevation = np.zeros_like(latitude)
+        elevation = np.asarray(elevation, dtype=float)
+        if not len(keys) == latitude.size == longitude.size == elevation.size:
+            raise ValueError(
+                "keys, latitude, longitude and elevation must be the same length"
+            )
+
+        keep = np.isfinite(latitude) & np.isfinite(longitude)
+        self.keys = [key for key, good in zip(keys, keep) if good]
+        self.latitude = latitude[keep]
+        self.longitude = longitude[keep]
+        self.elevation = elevation[keep]
+        self._tree = cKDTree(_to_unit_vectors(self.latitude, self.longitude))
+
+    @classmethod
+    def from_stations(cls, stations, keys: list | None = None) -> "SpatialIndex":
+        """
+        Build an index from station objects.
+
+        Parameters
+        ----------
+        stations : iterable of :class:`mt_metadata.timeseries.Station`
+            stations to index
+        keys : list, optional
+            key of each station, by default the station id
+
+        Returns
+        -------
+        SpatialIndex
+            index of the station locations
+        """
+        stations = list(stations)
+        if keys is None:
+            keys = [station.id for station in stations]
+        locations = []
+        for station in stations:
+            locations.append(
+                [
+                    np.nan if value is None else value
+                    for value in (
+                        station.location.latitude,
+                        station.location.longitude,
+                        station.location.elevation,
+                    )
+                ]
+            )
+        locations = np.array(locations, dtype=float).reshape(-1, 3)
+        return cls(keys, locations[:, 0], locations[:, 1], locations[:, 2])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _get_keys(self, indices: np.ndarray) -> list:
+        return [self.keys[ii] for ii in indices]
+
+    def distances(self, latitude: float, longitude: float) -> np.ndarray:
+        """
+        Great circle distance from a point to every location in the index.
+
+        Parameters
+        ----------
+        latitude : float
+            latitude of the point in decimal degrees
+        longitude : float
+            longitude of the point in decimal degrees
+
+        Returns
+        -------
+        np.ndarray
+            distance in meters to each location, in the order of `keys`
+        """
+        return great_circle_distance(latitude, longitude, self.latitude, self.longitude)
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int = 1
+    ) -> tuple[list, np.ndarray]:
+        """
+        Find the k locations nearest to a point.
+
+        Parameters
+        ----------
+        latitude : float
+            latitude of the point in decimal degrees
+        longitude : float
+            longitude of the point in decimal degrees
+        k : int, optional
+            number of locations to return, by default 1
+
+        Returns
+        -------
+        tuple[list, np.ndarray]
+            keys of the nearest locations, closest first, and their
+            distances in meters
+        """
+        k = min(int(k), len(self))
+        if k < 1:
+            return [], np.array([], dtype=float)
+
+        _, indices = self._tree.query(_to_unit_vectors([latitude], [longitude]), k=k)
+        indices = np.atleast_1d(indices[0])
+        return (
+            self._get_keys(indices),
+            great_circle_distance(
+                latitude,
+                longitude,
+                self.latitude[indices],
+                self.longitude[indices],
+            ),
+        )
+
+    def within_radius(
+        self, latitude: float, longitude: float, radius: float
+    ) -> tuple[list, np.ndarray]:
+        """
+        Find the locations within a great circle distance of a point.
+
+        Parameters
+        ----------
+        latitude : float
+            latitude of the point in decimal degrees
+        longitude : float
+            longitude of the point in decimal degrees
+        radius : float
+            distance from the point in meters
+
+        Returns
+        -------
+        tuple[list, np.ndarray]
+            keys of the locations, closest first, and their distances in
+            meters
+        """
+        if len(self) == 0 or radius < 0:
+            return [], np.array([], dtype=float)
+
+        # straight line distance on the unit sphere of the great circle
+        # distance, pad slightly so points on the radius are not missed
+        angle = min(radius / EARTH_RADIUS, np.pi)
+        chord = 2 * np.sin(angle / 2) * (1 + 1e-9)
+        indices = np.array(
+            self._tree.query_ball_point(
+                _to_unit_vectors([latitude], [longitude])[0], chord
+            ),
+            dtype=int,
+        )
+        distances = great_circle_distance(
+            latitude, longitude, self.latitude[indices], self.longitude[indices]
+        )
+        keep = distances <= radius
+        indices = indices[keep]
+        distances = distances[keep]
+        order = np.argsort(distances, kind="stable")
+        return self._get_keys(indices[order]), distances[order]
+
+    def within_bounding_box(
+        self,
+        min_latitude: float,
+        max_latitude: float,
+        min_longitude: float,
+        max_longitude: float,
+    ) -> list:
+        """
+        Find the locations inside a latitude and longitude box, edges are
+        included.  If `min_longitude` is larger than `max_longitude` the box
+        crosses the antimeridian.
+
+        Parameters
+        ----------
+        min_latitude : float
+            southern edge in decimal degrees
+        max_latitude : float
+            northern edge in decimal degrees
+        min_longitude : float
+            western edge in decimal degrees
+        max_longitude : float
+            eastern edge in decimal degrees
+
+        Returns
+        -------
+        list
+            keys of the locations in the box, in the order of `keys`
+        """
+        inside = (self.latitude >= min_latitude) & (self.latitude <= max_latitude)
+        if min_longitude <= max_longitude:
+            inside &= (self.longitude >= min_longitude) & (
+                self.longitude <= max_longitude
+            )
+        else:
+            inside &= (self.longitude >= min_longitude) | (
+                self.longitude <= max_longitude
+            )
+        return self._get_keys(np.flatnonzero(inside))
@@ -14,7 +14,7 @@ from xml.etree import ElementTree as ET
 import numpy as np
 import pandas as pd
 import pytest
-from pydantic import Field
+from pydantic import Field, field_validator, model_validator, ValidationError
 from pydantic.fields import FieldInfo
 
 from mt_metadata.base.metadata import DotNotationBaseModel, MetadataBase
@@ -54,6 +54,41 @@ class RequiredFieldModel(MetadataBase):
     )
 
 
+class NormalizedModel(MetadataBase):
+    """Test model with validators that change or reject values"""
+
+    name: str = Field(default="", description="Lower case name")
+    count: int = Field(default=0, description="Positive count")
+    nested_model: NestedModel = Field(default_factory=NestedModel)
+
+    @field_validator("name", mode="before")
+    @classmethod
+    def validate_name(cls, value):
+        return value.lower()
+
+    @field_validator("count")
+    @classmethod
+    def validate_count(cls, value):
+        if value < 0:
+            raise ValueError("count must be positive")
+        return value
+
+
+class DerivedModel(MetadataBase):
+    """Test model with a model validator that sets a list from a string"""
+
+    name: str = Field(default="", description="Name")
+    aliases: list[str] = Field(default_factory=list, description="Names")
+
+    @model_validator(mode="before")
+    @classmethod
+    def set_aliases(cls, values):
+        if isinstance(values, dict) and values.get("name"):
+            values = dict(values)
+            values["aliases"] = [values["name"].lower()]
+        return values
+
+
 # Fixtures at module level for efficiency
 @pytest.fixture
 def dot_notation_model():
@@ -326,6 +361,39 @@ class TestMetadataBaseEquality:
         result = model1 == model2
         assert isinstance(result, bool)
 
+    def test_equality_skip_equals(self):
+        """Test fields in _skip_equals are not compared"""
+        model1 = SampleModel(simple_attr="test1")
+        model2 = SampleModel(simple_attr="test2")
+        model1._skip_equals = ["simple_attr"]
+        assert model1 == model2
+
+    def test_diff_equal(self, test_model):
+        """Test diff of equal objects is empty"""
+        assert test_model.diff(SampleModel()) == {}
+
+    def test_diff_reports_all_differences(self):
+        """Test diff returns every difference instead of stopping at the first"""
+        model1 = SampleModel(simple_attr="test1", number_attr=1)
+        model2 = SampleModel(simple_attr="test2", number_attr=2)
+        model2.nested_model.value = "other"
+        assert model1.diff(model2) == {
+            "nested_model.value": ("test", "other"),
+            "number_attr": (1, 2),
+            "simple_attr": ("test1", "test2"),
+        }
+
+    def test_diff_close_float_values(self):
+        """Test diff uses np.isclose for numbers"""
+        model1 = SampleModel(float_attr=3.14159)
+        model2 = SampleModel(float_attr=3.14159 + 1e-12)
+        assert model1.diff(model2) == {}
+
+    def test_diff_invalid_other(self, test_model):
+        """Test diff raises when the other object cannot be compared"""
+        with pytest.raises(MTSchemaError):
+            test_model.diff(None)
+
 
 class TestMetadataBaseLoading:
     """Test MetadataBase load functionality"""
@@ -423,6 +491,104 @@ class TestMetadataBaseUpdate:
             mock_logger.assert_called_once()
 
 
+class TestMetadataBaseTrustedConstruction:
+    """Test deferring validation with trusted_construction"""
+
+    def test_validated_on_exit(self, subtests):
+        model = NormalizedModel()
+        with MetadataBase.trusted_construction():
+            model.name = "MT01"
+            model.nested_model.value = "nested"
+            with subtests.test("deferred"):
+                assert model.name == "MT01"
+
+        with subtests.test("validated"):
+            assert model.name == "mt01"
+            assert model.nested_model.value == "nested"
+
+        with subtests.test("fields set"):
+            assert "name" in model.model_fields_set
+
+    def test_other_types_validated(self):
+        """Values of a different type are validated on assignment"""
+        model = NormalizedModel()
+        with MetadataBase.trusted_construction():
+            model.count = "5"
+            assert model.count == 5
+
+    def test_nested_blocks(self):
+        model = NormalizedModel()
+        with MetadataBase.trusted_construction():
+            with MetadataBase.trusted_construction():
+                model.name = "MT01"
+            assert model.name == "MT01"
+        assert model.name == "mt01"
+
+    def test_invalid_value_raises(self, subtests):
+        model = NormalizedModel(name="mt00", count=3)
+        other = NormalizedModel()
+        with subtests.test("raised"):
+            with pytest.raises(ValidationError):
+                with MetadataBase.trusted_construction():
+                    model.name = "MT01"
+                    model.count = -1
+                    other.name = "MT02"
+
+        with subtests.test("previous values"):
+            assert model.count == 3
+            assert model.name == "mt00"
+        with subtests.test("valid object"):
+            assert other.name == "mt02"
+
+    def test_exception_restores_previous(self, subtests):
+        model = NormalizedModel(name="mt00", count=3)
+        with subtests.test("raised"):
+            with pytest.raises(KeyError):
+                with MetadataBase.trusted_construction():
+                    model.name = "MT01"
+                    model.count = 5
+                    raise KeyError("reader failed")
+
+        with subtests.test("previous values"):
+            assert model.name == "mt00"
+            assert model.count == 3
+
+    def test_model_validator_changes_kept(self, subtests):
+        model = DerivedModel()
+        nested = NormalizedModel()
+        nested_model = nested.nested_model
+        with MetadataBase.trusted_construction():
+            model.name = "MT01"
+            nested.name = "MT01"
+
+        with subtests.test("derived value"):
+            assert model.aliases == ["mt01"]
+        with subtests.test("same as assignment"):
+            assigned = DerivedModel()
+            assigned.name = "MT01"
+            assert model.aliases == assigned.aliases
+        with subtests.test("unchanged objects kept"):
+            assert nested.nested_model is nested_model
+
+    def test_outside_block_validated(self):
+        model = NormalizedModel()
+        with pytest.raises(ValidationError):
+            model.count = -1
+
+    def test_validate_fields(self, subtests):
+        model = NormalizedModel()
+        nested_model = model.nested_model
+        model._skip_equals = ["count"]
+        model.__dict__["name"] = "MT01"
+        model.validate_fields()
+        with subtests.test("validated"):
+            assert model.name == "mt01"
+        with subtests.test("nested object kept"):
+            assert model.nested_model is nested_model
+        with subtests.test("private attributes kept"):
+            assert model._skip_equals == ["count"]
+
+
 class TestMetadataBaseCopy:
     """Test MetadataBase copy functionality"""
 
@@ -512,6 +678,33 @@ class TestMetadataBaseFields:
         value = test_model.get_attr_from_name("nested_model.value")
         assert value == "test"
 
+    def test_get_attr_from_name_nested_model(self, test_model):
+        """Test get_attr_from_name returns the nested model for its path"""
+        value = test_model.get_attr_from_name("nested_model")
+        assert isinstance(value, NestedModel)
+
+    def test_get_attr_from_name_not_a_field(self, test_model):
+        """Test get_attr_from_name falls back for names not in the model"""
+        assert test_model.get_attr_from_name("not_a_field") is None
+
+    def test_accessor_table(self, test_model):
+        """Test the compiled accessor table covers leaf and nested paths"""
+        from mt_metadata.base import pydantic_helpers
+
+        table = pydantic_helpers.get_accessor_table(test_model)
+        assert table is pydantic_helpers.get_accessor_table(SampleModel)
+        for name in test_model.get_attribute_list():
+            assert name in table
+        assert table["simple_attr"] == (None, "simple_attr")
+        parent_getter, leaf = table["nested_model.number"]
+        assert leaf == "number"
+        assert parent_getter(test_model) is test_model.nested_model
+
+    def test_update_attribute_through_accessor_table(self, test_model):
+        """Test update_attribute validates values set through the table"""
+        test_model.update_attribute("nested_model.number", "7")
+        assert test_model.nested_model.number == 7
+
 
 class TestMetadataBaseFieldManagement:
     """Test MetadataBase field management functionality"""
@@ -576,6 +769,15 @@ class TestMetadataBaseDictConversion:
         assert "required_field" in model_dict
         assert "optional_field" in model_dict
 
+    def test_serialization_plan(self, required_model):
+        """Test the compiled serialization plan matches the attribute list"""
+        from mt_metadata.base import pydantic_helpers
+
+        plan = pydantic_helpers.get_serialization_plan(required_model)
+        assert [entry.name for entry in plan] == required_model.get_attribute_list()
+        required = {entry.name for entry in plan if entry.required}
+        assert required == set(required_model._required_fields)
+
     def test_from_dict_basic(self, test_model, sample_dict):
         """Test basic from_dict functionality"""
         test_model.from_dict(sample_dict)
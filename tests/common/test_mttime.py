@@ -27,9 +27,11 @@ from mt_metadata.common.mttime import (
     _fix_out_of_bounds_time_stamp,
     _localize_utc,
     calculate_leap_seconds,
+    DEFAULT_TIME_NS,
     MDate,
     MTime,
     parse,
+    parse_many,
     TMAX,
     TMIN,
 )
@@ -618,6 +620,38 @@ def test_mtime_hash(sample_data, subtests):
     t = MTime(time_stamp=sample_data["valid_iso"])
     with subtests.test("hash"):
         assert hash(t) == hash(sample_data["valid_iso"])
+    with subtests.test("equal times hash equal"):
+        assert hash(t) == hash(MTime(time_stamp="2020-01-20T12:15:20.123Z"))
+    with subtests.test("dict and set lookup with iso string"):
+        assert sample_data["valid_iso"] in {t: 1}
+        assert t in {sample_data["valid_iso"]}
+
+
+def test_mtime_compare_to_other_types(sample_data, subtests):
+    t = MTime(time_stamp=sample_data["valid_iso"])
+    with subtests.test("string"):
+        assert t == sample_data["valid_iso"]
+        assert t > "1980-01-01T00:00:00+00:00"
+        assert t <= "2020-01-20T12:15:20.123+00:00"
+    with subtests.test("time stamp"):
+        assert t == pd.Timestamp(sample_data["valid_iso"])
+        assert t >= pd.Timestamp(sample_data["valid_iso"])
+    with subtests.test("not a time"):
+        assert t != "not a time"
+    with subtests.test("min and max"):
+        times = [MTime(time_stamp=f"2020-01-0{day}") for day in (3, 1, 2)]
+        assert min(times) == "2020-01-01T00:00:00+00:00"
+        assert max(times) == "2020-01-03T00:00:00+00:00"
+
+
+def test_mtime_epoch_nanoseconds(sample_data, subtests):
+    t = MTime(time_stamp=sample_data["valid_iso"])
+    with subtests.test("value"):
+        assert t.epoch_nanoseconds == pd.Timestamp(sample_data["valid_iso"]).value
+    with subtests.test("default"):
+        assert MTime().epoch_nanoseconds == DEFAULT_TIME_NS
+        assert MTime().is_default()
+        assert not t.is_default()
 
 
 def test_mtime_copy(sample_data, subtests):
@@ -896,5 +930,62 @@ def test_isinstance_check_fix(subtests):
             assert isinstance(result, pd.Timestamp)
 
 
+def test_parse_cached(subtests):
+    """Repeated strings come from the cache and give the same time stamp."""
+    stamp_01 = parse("2020-01-20T12:15:20.123000+00:00")
+    stamp_02 = parse("2020-01-20T12:15:20.123000+00:00")
+    with subtests.test("same object"):
+        assert stamp_01 is stamp_02
+    with subtests.test("gps time is part of the key"):
+        assert parse("2020-01-20T12:15:20.123000+00:00", gps_time=True) != stamp_01
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2020-01-20T12:15:20.123000+00:00",
+        "2020-01-20T12:15:20Z",
+        "2020-01-20 12:15:20",
+        "2020-01-20",
+        "2020-01-20T05:15:20-07:00",
+    ],
+)
+def test_parse_iso_8601_fast_path(value):
+    """The ISO-8601 fast path matches pandas parsing."""
+    stamp = parse(value)
+    expected = _localize_utc(pd.Timestamp(value))
+    assert stamp == expected
+    assert stamp.tz == expected.tz
+    assert stamp.isoformat() == expected.isoformat()
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["2020-01-20T12:15:20+00:00", "2021-02-01T00:00:00", "", None],
+        ["2020-01-20T12:15:20.123456789+00:00", "2020-01-20T05:15:20-07:00"],
+        ["3000-01-01T00:00:00", "1400-01-01T00:00:00", "2020-01-20"],
+        ["2020-01-20T24:00:00", 1579522520.0, np.datetime64("2020-01-20")],
+        np.array(["2020-01-20T12:15:20.000000700", "NaT"], dtype="datetime64[ns]"),
+        np.array(["2020-01-20T12:15:20", "NaT", "1000-01-01"], dtype="datetime64[s]"),
+        np.array(["NaT", "NaT"], dtype="datetime64"),
+        ["2020-01-20T12:15:20+00:00", "3000-01-01T00:00:00", "none"],
+        pd.Series(["2020-01-20T12:15:20+00:00", "2020-01-21T12:15:20+00:00"]),
+    ],
+)
+def test_parse_many(values):
+    """parse_many gives the same time stamps as parse value by value."""
+    stamps = parse_many(values)
+    assert isinstance(stamps, pd.DatetimeIndex)
+    assert str(stamps.tz) == "UTC"
+    assert list(stamps) == [parse(value) for value in values]
+
+
+def test_parse_many_gps_time():
+    values = ["2020-01-20T12:15:20+00:00", "2020-01-21T12:15:20+00:00"]
+    stamps = parse_many(values, gps_time=True)
+    assert list(stamps) == [parse(value, gps_time=True) for value in values]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -15,6 +15,7 @@ from mt_metadata.timeseries.filters import (
     PoleZeroFilter,
     TimeDelayFilter,
 )
+from mt_metadata.timeseries.filters.response_cache import ResponseCache
 
 try:
     from obspy.core.inventory.response import ResponseListResponseStage
@@ -259,6 +260,103 @@ def test_complex_response(channel_response, subtests):
         assert abs(slope) < np.pi
 
 
+def test_complex_response_cache(channel_response, pole_zero_filter, subtests):
+    """Test the cached complex response matches the computed response"""
+    filters_list = channel_response.filters_list
+    cached = channel_response.complex_response(filters_list=filters_list)
+    computed = channel_response.complex_response(
+        filters_list=filters_list, use_cache=False
+    )
+
+    with subtests.test("same response"):
+        assert np.allclose(cached, computed)
+
+    with subtests.test("result is writeable"):
+        assert cached.flags.writeable
+
+    cache = ResponseCache()
+    frequencies = channel_response.frequencies
+    response = cache.complex_response(pole_zero_filter, frequencies)
+
+    with subtests.test("read only"):
+        assert not response.flags.writeable
+
+    with subtests.test("miss"):
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hits"] == 0
+        assert cache.stats["bytes"] == response.nbytes
+
+    renamed = pole_zero_filter.copy()
+    renamed.name = "renamed_zpk"
+    with subtests.test("hit for same filter content"):
+        assert cache.complex_response(renamed, frequencies) is response
+        assert cache.stats["hits"] == 1
+
+    with subtests.test("miss for new frequencies"):
+        cache.complex_response(pole_zero_filter, frequencies[::2])
+        assert cache.stats["misses"] == 2
+        assert cache.stats["entries"] == 2
+
+    renamed.normalization_factor = 1
+    with subtests.test("miss for new filter content"):
+        assert not np.allclose(
+            cache.complex_response(renamed, frequencies), response
+        )
+        assert cache.stats["misses"] == 3
+
+
+def test_filter_responses_batch(channel_response, pole_zero_filter, subtests):
+    """Test batched filter responses match the response of each filter"""
+    second_pole_zero = pole_zero_filter.copy()
+    second_pole_zero.normalization_factor = 1000.0
+    channel_response.filters_list = [second_pole_zero] + list(
+        channel_response.filters_list
+    )
+    frequencies = channel_response.frequencies
+
+    for use_cache in [False, True, True]:
+        responses = channel_response.get_filter_responses(
+            frequencies, use_cache=use_cache
+        )
+        for mt_filter, response in zip(channel_response.filters_list, responses):
+            with subtests.test(name=mt_filter.name, use_cache=use_cache):
+                assert np.allclose(
+                    response,
+                    mt_filter.complex_response(frequencies),
+                    rtol=1e-14,
+                    atol=0,
+                )
+
+    with subtests.test("instrument sensitivity"):
+        assert channel_response.compute_instrument_sensitivity(
+            use_cache=False
+        ) == channel_response.compute_instrument_sensitivity(use_cache=True)
+
+
+def test_response_cache_eviction(pole_zero_filter, subtests):
+    """Test the least recently used responses are evicted"""
+    cache = ResponseCache(max_bytes=2 * 100 * 16)
+    grids = [np.logspace(-3, 3, 100) * (ii + 1) for ii in range(3)]
+    for frequencies in grids:
+        cache.complex_response(pole_zero_filter, frequencies)
+
+    with subtests.test("bytes are bounded"):
+        assert cache.stats["entries"] == 2
+        assert cache.stats["evictions"] == 1
+        assert cache.stats["bytes"] <= cache.max_bytes
+
+    with subtests.test("oldest evicted"):
+        cache.complex_response(pole_zero_filter, grids[-1])
+        cache.complex_response(pole_zero_filter, grids[0])
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 4
+
+    with subtests.test("clear"):
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats["bytes"] == 0
+
+
 def test_unit_fail(channel_response):
     """Test that filters with inconsistent units raise an error"""
     cr1 = CoefficientFilter(units_in="volt", units_out="mV")
@@ -421,6 +421,43 @@ def test_complex_response_basic(fap_filter_basic, subtests):
         assert np.allclose(phase_response, fap_filter_basic.phases)
 
 
+def test_complex_response_interpolator_cached(fap_filter_basic, subtests):
+    frequencies = np.array([0.005, 0.05, 0.5, 5.0])
+    response = fap_filter_basic.complex_response(frequencies)
+    interpolator = fap_filter_basic._get_interpolator()
+
+    with subtests.test("interpolator reused"):
+        fap_filter_basic.complex_response(frequencies)
+        assert fap_filter_basic._get_interpolator() is interpolator
+
+    with subtests.test("rebuilt when amplitudes change"):
+        fap_filter_basic.amplitudes = fap_filter_basic.amplitudes * 2
+        assert fap_filter_basic._get_interpolator() is not interpolator
+        assert np.allclose(
+            fap_filter_basic.complex_response(frequencies), 2 * response
+        )
+
+
+def test_complex_responses(fap_filter_basic, subtests):
+    grids = [
+        np.array([0.001, 0.01, 0.1]),
+        np.logspace(-3, 1, 12).reshape(3, 4),
+        np.array([]),
+    ]
+    responses = fap_filter_basic.complex_responses(grids)
+
+    with subtests.test("one response per grid"):
+        assert len(responses) == len(grids)
+
+    for ii, (grid, response) in enumerate(zip(grids, responses)):
+        with subtests.test(grid=ii):
+            assert response.shape == grid.shape
+            if grid.size:
+                assert np.allclose(
+                    response, fap_filter_basic.complex_response(grid)
+                )
+
+
 @pytest.mark.skipif(ResponseListResponseStage is None, reason="obspy is not installed.")
 def test_to_obspy_stage_basic(fap_filter_basic, subtests):
     stage = fap_filter_basic.to_obspy(
@@ -159,3 +159,23 @@ def test_obspy_mapping(default_filter, subtests):
         assert "stage_gain" in mapping
         assert "input_units" in mapping
         assert "output_units" in mapping
+
+
+def test_content_hash(custom_filter, subtests):
+    """Test the content hash ignores names and small rounding differences."""
+    other = custom_filter.copy()
+    other.name = "other_name"
+    other.comments = "other comments"
+
+    with subtests.test("name and comments ignored"):
+        assert other.response_hash() == custom_filter.response_hash()
+        assert other.content_hash() == custom_filter.content_hash()
+
+    other.gain = 2.5000000001
+    with subtests.test("rounded"):
+        assert other.response_hash() != custom_filter.response_hash()
+        assert other.content_hash() == custom_filter.content_hash()
+
+    other.gain = 2.6
+    with subtests.test("different gain"):
+        assert other.content_hash() != custom_filter.content_hash()
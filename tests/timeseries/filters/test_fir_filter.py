@@ -4,6 +4,7 @@ import pytest
 from mt_metadata.common import SymmetryEnum
 from mt_metadata.timeseries.filters import FIRFilter
 
+
 try:
     from obspy.core.inventory.response import FIRResponseStage
 
@@ -138,6 +139,80 @@ def test_complex_response(fir_filter_with_data, subtests):
         assert np.allclose(response, unscaled / corrective_scalar)
 
 
+def test_derived_values_are_cached(fir_filter_with_data, subtests):
+    """Test derived coefficients and gains are cached until inputs change."""
+    fir_filter_with_data.gain = 1.0
+    fir_filter_with_data.symmetry = SymmetryEnum.NONE
+    coefficients = fir_filter_with_data.symmetry_corrected_coefficients
+
+    with subtests.test("cached coefficients"):
+        assert fir_filter_with_data.symmetry_corrected_coefficients is coefficients
+        assert not coefficients.flags.writeable
+        assert np.allclose(coefficients, [0.25, 0.5, 0.3])
+
+    with subtests.test("symmetry change"):
+        fir_filter_with_data.symmetry = SymmetryEnum.EVEN
+        assert np.allclose(
+            fir_filter_with_data.symmetry_corrected_coefficients,
+            [0.25, 0.5, 0.3, 0.3, 0.5, 0.25],
+        )
+
+    with subtests.test("coefficients change"):
+        fir_filter_with_data.coefficients = [0.5, 0.25]
+        assert np.allclose(
+            fir_filter_with_data.symmetry_corrected_coefficients,
+            [0.5, 0.25, 0.25, 0.5],
+        )
+
+    with subtests.test("gain change"):
+        fir_filter_with_data.gain_frequency = 0.0
+        scalar = fir_filter_with_data.corrective_scalar
+        fir_filter_with_data.gain = 0.5
+        assert np.isclose(fir_filter_with_data.corrective_scalar, 2 * scalar)
+
+
+def test_fft_complex_response(subtests):
+    """Test the FFT response is within its tolerance of the freqz response."""
+    n_taps = 201
+    taps = np.sinc(0.2 * (np.arange(n_taps) - n_taps // 2)) * np.hamming(n_taps)
+    fir = FIRFilter(
+        coefficients=taps,
+        decimation_input_sample_rate=100.0,
+        gain=1.0,
+        gain_frequency=0.0,
+    )
+    frequencies = np.linspace(0, 120, 3001)
+    exact = fir.unscaled_complex_response(frequencies, method="freqz")
+
+    for tolerance in [1e-4, 1e-6]:
+        with subtests.test(tolerance=tolerance):
+            fft = fir.unscaled_complex_response(
+                frequencies, method="fft", tolerance=tolerance
+            )
+            error = np.abs(fft - exact).max()
+            assert error <= tolerance * np.abs(taps).sum()
+
+    with subtests.test("auto uses fft for many frequencies"):
+        assert fir._use_fft(frequencies, "auto", 1e-6)
+        assert not fir._use_fft(frequencies[:3], "auto", 1e-6)
+
+    with subtests.test("scaled response"):
+        assert np.allclose(
+            fir.complex_response(frequencies, method="auto"),
+            exact / fir.corrective_scalar,
+            atol=1e-6 * np.abs(taps).sum(),
+        )
+
+    with subtests.test("freqz by default"):
+        np.testing.assert_array_equal(
+            fir.complex_response(frequencies), exact / fir.corrective_scalar
+        )
+
+    with subtests.test("bad method"):
+        with pytest.raises(ValueError):
+            fir.complex_response(frequencies, method="dft")
+
+
 @pytest.mark.skipif(not OBSPY_AVAILABLE, reason="obspy is not installed.")
 def test_to_obspy_stage(fir_filter_with_data, subtests):
     """Test the to_obspy method converts FirFilter to obspy FIRResponseStage correctly."""
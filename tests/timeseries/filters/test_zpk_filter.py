@@ -3,6 +3,9 @@ import pytest
 from pydantic import ValidationError
 
 from mt_metadata.timeseries.filters import PoleZeroFilter
+from mt_metadata.timeseries.filters.pole_zero_filter import (
+    pole_zero_complex_responses,
+)
 
 try:
     from obspy.core.inventory.response import PolesZerosResponseStage
@@ -158,6 +161,38 @@ def test_complex_response(pole_zero_filter_with_data, frequencies, subtests):
         assert abs(slope) < 1
 
 
+def test_pole_zero_complex_responses(
+    pole_zero_filter_with_data, pole_zero_filter_default, frequencies, subtests
+):
+    """Test batched responses match the response of each filter."""
+    high_pass = PoleZeroFilter(
+        units_in="volt", units_out="volt", name="high_pass", gain=2.0
+    )
+    high_pass.zeros = [0j]
+    high_pass.poles = [-1.0]
+    filters = [pole_zero_filter_with_data, pole_zero_filter_default, high_pass]
+    responses = pole_zero_complex_responses(filters, frequencies)
+
+    with subtests.test("shape"):
+        assert responses.shape == (len(filters), frequencies.size)
+
+    for pz_filter, response in zip(filters, responses):
+        with subtests.test(name=pz_filter.name):
+            assert np.allclose(
+                response, pz_filter.complex_response(frequencies), rtol=1e-14, atol=0
+            )
+
+    responses = pole_zero_complex_responses(filters, 1.0)
+    with subtests.test("scalar frequency shape"):
+        assert responses.shape == (len(filters), 1)
+
+    for pz_filter, response in zip(filters, responses):
+        with subtests.test(name=f"{pz_filter.name} scalar frequency"):
+            response_1 = pz_filter.complex_response(1.0)
+            assert response.shape == response_1.shape
+            assert np.allclose(response, response_1, rtol=1e-14, atol=0)
+
+
 @pytest.mark.skipif(PolesZerosResponseStage is None, reason="obspy is not installed.")
 def test_to_obspy_stage(pole_zero_filter_with_data, subtests):
     """Test the to_obspy method."""
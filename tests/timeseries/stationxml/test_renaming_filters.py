@@ -19,7 +19,7 @@ except ImportError:
     pytest.skip(reason="obspy is not installed", allow_module_level=True)
 
 from mt_metadata import STATIONXML_01
-from mt_metadata.timeseries.filters import PoleZeroFilter
+from mt_metadata.timeseries.filters import FilterRegistry, PoleZeroFilter
 from mt_metadata.timeseries.stationxml import XMLChannelMTChannel
 
 
@@ -202,3 +202,24 @@ def test_identical_filter_reuse(converter, subtests):
 
     with subtests.test(msg="second filter is not new"):
         assert is_new2 is False
+
+
+def test_registry_reuses_filters(inventory, subtests):
+    """Test that a filter registry names repeated stages after the first."""
+    converter = XMLChannelMTChannel()
+    registry = FilterRegistry()
+    xml_channel = inventory.networks[0].stations[0].channels[0]
+
+    _, first = converter.xml_to_mt(xml_channel, {}, filter_registry=registry)
+    n_registered = len(registry)
+    _, second = converter.xml_to_mt(xml_channel, {}, filter_registry=registry)
+
+    with subtests.test(msg="same names"):
+        assert list(second.keys()) == list(first.keys())
+
+    with subtests.test(msg="nothing new registered"):
+        assert len(registry) == n_registered
+
+    with subtests.test(msg="registered filters"):
+        for mt_filter in second.values():
+            assert registry.get(mt_filter.name) is not None
@@ -12,6 +12,7 @@ import copy
 
 import pytest
 
+from mt_metadata import MT_EXPERIMENT_MULTIPLE_RUNS, MT_EXPERIMENT_SINGLE_STATION
 from mt_metadata.common.mttime import MDate
 from mt_metadata.timeseries import (
     Auxiliary,
@@ -399,3 +400,252 @@ def test_experiment_validation(example_experiment, subtests):
         # Validation should fail or raise error - depending on implementation
         with pytest.raises(TypeError):
             invalid_exp.model_validate(id=None)
+
+
+@pytest.fixture(
+    params=[MT_EXPERIMENT_SINGLE_STATION, MT_EXPERIMENT_MULTIPLE_RUNS],
+    ids=["single_station", "multiple_runs"],
+)
+def mt_xml_fn(request):
+    return request.param
+
+
+def assert_experiments_equal(experiment, other):
+    """
+    Compare experiments level by level, the comparison of a survey, station
+    or run does not include the objects it holds.
+    """
+    assert experiment == other
+    assert experiment.survey_names == other.survey_names
+    for survey, other_survey in zip(experiment.surveys, other.surveys):
+        assert survey == other_survey
+        assert list(survey.filters.keys()) == list(other_survey.filters.keys())
+        for key, value in survey.filters.items():
+            assert other_survey.filters[key] == value
+        assert survey.station_names == other_survey.station_names
+        for station, other_station in zip(survey.stations, other_survey.stations):
+            assert station == other_station
+            assert station.run_list == other_station.run_list
+            for run, other_run in zip(station.runs, other_station.runs):
+                assert run == other_run
+                assert run.channels_recorded_all == other_run.channels_recorded_all
+                for channel, other_channel in zip(run.channels, other_run.channels):
+                    assert channel == other_channel
+                    assert channel.to_dict() == other_channel.to_dict()
+
+
+def test_from_xml_file_matches_element(mt_xml_fn):
+    """Streaming a file gives the same experiment as reading the element."""
+    from xml.etree import cElementTree as et
+
+    from_file = Experiment()
+    from_file.from_xml(fn=mt_xml_fn)
+    from_element = Experiment()
+    from_element.from_xml(element=et.parse(mt_xml_fn).getroot())
+
+    assert_experiments_equal(from_file, from_element)
+
+
+def test_from_xml_lazy(mt_xml_fn, subtests):
+    """Stations are created the first time they are accessed."""
+    eager = Experiment()
+    eager.from_xml(fn=mt_xml_fn)
+    lazy = Experiment()
+    lazy.from_xml(fn=mt_xml_fn, lazy=True)
+
+    survey = lazy.surveys[0]
+    station_id = survey.station_names[0]
+    with subtests.test("not loaded"):
+        assert survey.n_stations == eager.surveys[0].n_stations
+        assert survey.stations.is_loaded(station_id) is False
+
+    with subtests.test("loaded on access"):
+        station = survey.stations[station_id]
+        assert survey.stations.is_loaded(station_id) is True
+        assert station == eager.surveys[0].stations[station_id]
+
+    with subtests.test("same stations"):
+        for station_id in eager.surveys[0].station_names:
+            assert survey.stations[station_id] == eager.surveys[0].stations[station_id]
+
+
+def test_iterparse_xml(mt_xml_fn, subtests):
+    """The survey is yielded first, then each of its stations."""
+    eager = Experiment()
+    eager.from_xml(fn=mt_xml_fn, sort=False)
+
+    items = list(Experiment().iterparse_xml(mt_xml_fn))
+    with subtests.test("order"):
+        assert isinstance(items[0], Survey)
+        assert all(isinstance(item, Station) for item in items[1:])
+
+    with subtests.test("stations"):
+        assert [item.id for item in items[1:]] == eager.surveys[0].station_names
+        for item in items[1:]:
+            assert item == eager.surveys[0].stations[item.id]
+
+    with subtests.test("survey has no stations"):
+        assert items[0].n_stations == 0
+        assert items[0].id == eager.surveys[0].id
+        assert items[0].filters == eager.surveys[0].filters
+
+
+def test_pickle_round_trip(mt_xml_fn, tmp_path, subtests):
+    """A snapshot restores the same experiment, filters included."""
+    experiment = Experiment()
+    experiment.from_xml(fn=mt_xml_fn)
+    fn = tmp_path.joinpath("experiment.pkl")
+    experiment.to_pickle(fn)
+
+    restored = Experiment()
+    restored.from_pickle(fn)
+    with subtests.test("experiment"):
+        assert restored == experiment
+
+    with subtests.test("surveys, stations, runs, channels and filters"):
+        assert_experiments_equal(restored, experiment)
+
+
+def test_pickle_lazy(mt_xml_fn, tmp_path):
+    """Lazy stations are created before writing a snapshot."""
+    eager = Experiment()
+    eager.from_xml(fn=mt_xml_fn)
+    lazy = Experiment()
+    lazy.from_xml(fn=mt_xml_fn, lazy=True)
+    fn = tmp_path.joinpath("experiment.pkl")
+    lazy.to_pickle(fn)
+
+    restored = Experiment()
+    restored.from_pickle(fn)
+    assert_experiments_equal(restored, eager)
+
+
+def test_pickle_rejected(complex_experiment, tmp_path, subtests):
+    experiment = complex_experiment["experiment"]
+    fn = tmp_path.joinpath("experiment.pkl")
+    experiment.to_pickle(fn)
+
+    with subtests.test("stale version"):
+        from mt_metadata import __version__
+
+        stale_fn = tmp_path.joinpath("stale.pkl")
+        stale_version = "0" * len(__version__)
+        stale_fn.write_bytes(
+            fn.read_bytes().replace(__version__.encode(), stale_version.encode(), 1)
+        )
+        with pytest.raises(ValueError, match="Write the snapshot again"):
+            Experiment().from_pickle(stale_fn)
+
+    with subtests.test("not a snapshot"):
+        other_fn = tmp_path.joinpath("other.pkl")
+        other_fn.write_bytes(b"not a snapshot")
+        with pytest.raises(ValueError, match="not an mt_metadata"):
+            Experiment().from_pickle(other_fn)
+
+
+def test_run_interval_index(experiment, subtests):
+    """Test pairing simultaneous runs of stations in different surveys."""
+    for survey_id, station_id, start, end in [
+        ("one", "mt01", "2020-01-01T00:00:00", "2020-01-02T00:00:00"),
+        ("two", "mt01", "2020-01-01T12:00:00", "2020-01-03T00:00:00"),
+    ]:
+        run = Run(id="a", sample_rate=1)
+        run.time_period.start = start
+        run.time_period.end = end
+        station = Station(id=station_id)
+        station.add_run(run)
+        survey = Survey(id=survey_id)
+        survey.add_station(station)
+        experiment.add_survey(survey)
+
+    pairs = experiment.run_interval_index().find_simultaneous_runs()
+
+    with subtests.test("stations of different surveys pair"):
+        assert list(zip(pairs.survey_01, pairs.survey_02)) == [("one", "two")]
+
+    with subtests.test("duration"):
+        assert pairs.duration.tolist() == [12 * 3600]
+
+
+def test_to_dataframes(complex_experiment, subtests):
+    """Test flattening an experiment into one table per level."""
+    experiment = complex_experiment["experiment"]
+    dfs = experiment.to_dataframes()
+
+    with subtests.test("tables"):
+        assert list(dfs.keys()) == [
+            "surveys",
+            "stations",
+            "runs",
+            "channels",
+            "filters",
+        ]
+
+    with subtests.test("rows"):
+        assert len(dfs["surveys"]) == 2
+        assert len(dfs["stations"]) == 4
+        assert len(dfs["runs"]) == 8
+        assert len(dfs["channels"]) == 56
+
+    with subtests.test("columns"):
+        station = experiment.surveys[0].stations[0]
+        assert dfs["stations"].columns[0] == "survey_id"
+        attributes = set(station.get_attribute_list()) - {"runs"}
+        assert attributes <= set(dfs["stations"].columns)
+        assert "runs" not in dfs["stations"].columns
+        assert "location.latitude" in dfs["stations"].columns
+
+    with subtests.test("vectorized query"):
+        channels = dfs["channels"]
+        electric = channels[channels.type == "electric"]
+        assert sorted(electric.component.unique()) == ["ex", "ey"]
+        assert (electric.survey_id == "One").sum() == 8
+
+
+def test_from_dataframes(complex_experiment, subtests):
+    """Test rebuilding an experiment from its tables."""
+    experiment = complex_experiment["experiment"]
+    restored = Experiment()
+    restored.from_dataframes(experiment.to_dataframes())
+
+    with subtests.test("dict"):
+        assert restored.to_dict() == experiment.to_dict()
+
+    with subtests.test("missing parent"):
+        dfs = experiment.to_dataframes()
+        dfs["runs"].loc[0, "station_id"] = "not_a_station"
+        with pytest.raises(ValueError, match="Could not find station"):
+            Experiment().from_dataframes(dfs)
+
+
+def test_dataframes_filters(mt_xml_fn, subtests):
+    """Filters are kept when going through tables."""
+    experiment = Experiment()
+    experiment.from_xml(fn=mt_xml_fn)
+    restored = Experiment()
+    restored.from_dataframes(experiment.to_dataframes())
+
+    with subtests.test("experiment"):
+        assert_experiments_equal(restored, experiment)
+
+
+def test_parquet_round_trip(mt_xml_fn, tmp_path, subtests):
+    """Tables written to Parquet read back to the same experiment."""
+    pytest.importorskip("pyarrow")
+    experiment = Experiment()
+    experiment.from_xml(fn=mt_xml_fn)
+    experiment.to_parquet(tmp_path)
+
+    with subtests.test("files"):
+        assert sorted(fn.name for fn in tmp_path.glob("*.parquet")) == [
+            "channels.parquet",
+            "filters.parquet",
+            "runs.parquet",
+            "stations.parquet",
+            "surveys.parquet",
+        ]
+
+    restored = Experiment()
+    restored.from_parquet(tmp_path)
+    with subtests.test("experiment"):
+        assert_experiments_equal(restored, experiment)
@@ -256,6 +256,40 @@ def test_update_time_period(run_object, subtests):
         assert run_object.time_period.end == "2020-01-01T18:00:00+00:00"
 
 
+def test_add_channels_extends_time_period(run_object, subtests):
+    """Test that adding channels one at a time extends the time period."""
+    for component, start, end in [
+        ("ex", "2020-01-01T06:00:00", "2020-01-01T12:00:00"),
+        ("ey", "2020-01-01T00:00:00", "2020-01-01T10:00:00"),
+        ("hx", "2020-01-01T08:00:00", "2020-01-01T18:00:00"),
+    ]:
+        channel = run_object._get_correct_channel_type(component)
+        channel.time_period.start = start
+        channel.time_period.end = end
+        run_object.add_channel(channel)
+
+    with subtests.test("start"):
+        assert run_object.time_period.start == "2020-01-01T00:00:00+00:00"
+
+    with subtests.test("end"):
+        assert run_object.time_period.end == "2020-01-01T18:00:00+00:00"
+
+    with subtests.test("updated channel"):
+        channel = Electric(component="ex")
+        channel.time_period.start = "2019-12-31T00:00:00"
+        run_object.add_channel(channel)
+        assert run_object.time_period.start == "2019-12-31T00:00:00+00:00"
+
+
+def test_add_channel_after_channel_changed(run_object):
+    """Test that changes to a channel already added are not missed."""
+    ex = Electric(component="ex")
+    run_object.add_channel(ex)
+    ex.time_period.start = "2020-01-01T00:00:00"
+    run_object.add_channel(Electric(component="ey"))
+    assert run_object.time_period.start == "2020-01-01T00:00:00+00:00"
+
+
 def test_channels_recorded_all(populated_run):
     """Test the combined list of all recorded channels."""
     assert sorted(populated_run.channels_recorded_all) == sorted(
@@ -269,6 +269,45 @@ def test_update_time_period(station_object, subtests):
         assert station_object.time_period.end == "2020-12-01T12:12:12+00:00"
 
 
+def test_add_runs_extends_time_period(station_object, subtests):
+    """Test that adding runs one at a time extends the time period."""
+    for run_id, start, end in [
+        ("001", "2020-01-02T00:00:00", "2020-01-03T00:00:00"),
+        ("002", "2020-01-01T00:00:00", "2020-01-02T00:00:00"),
+        ("003", "2020-01-03T00:00:00", "2020-01-05T00:00:00"),
+    ]:
+        run = Run(id=run_id)
+        run.time_period.start = start
+        run.time_period.end = end
+        station_object.add_run(run)
+
+    with subtests.test("run list"):
+        assert station_object.run_list == ["001", "002", "003"]
+
+    with subtests.test("start"):
+        assert station_object.time_period.start == "2020-01-01T00:00:00+00:00"
+
+    with subtests.test("end"):
+        assert station_object.time_period.end == "2020-01-05T00:00:00+00:00"
+
+    with subtests.test("run added without update"):
+        run = Run(id="004")
+        run.time_period.end = "2020-01-10T00:00:00"
+        station_object.add_run(run, update=False)
+        station_object.add_run(Run(id="005"))
+        assert station_object.time_period.end == "2020-01-10T00:00:00+00:00"
+        assert station_object.run_list == ["001", "002", "003", "004", "005"]
+
+
+def test_add_run_after_run_changed(station_object):
+    """Test that changes to a run already added are not missed."""
+    run = Run(id="001")
+    station_object.add_run(run)
+    run.time_period.start = "2020-01-01T00:00:00"
+    station_object.add_run(Run(id="002"))
+    assert station_object.time_period.start == "2020-01-01T00:00:00+00:00"
+
+
 def test_set_runs_fail(station_object, subtests):
     """Test invalid run assignments."""
     with subtests.test("Invalid input type (int)"):
@@ -12,11 +12,16 @@ import json
 from collections import OrderedDict
 from operator import itemgetter
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from mt_metadata.common import StationLocation
 from mt_metadata.common.mttime import MDate
-from mt_metadata.timeseries import Station, Survey
+from mt_metadata.processing.aurora import Stations
+from mt_metadata.timeseries import Run, Station, Survey
+from mt_metadata.timeseries.filters import CoefficientFilter, PoleZeroFilter
+from mt_metadata.utils.interval_index import PAIR_COLUMNS
 
 
 @pytest.fixture(scope="module")
@@ -344,6 +349,355 @@ def test_remove_station_with_stations(survey_with_stations, station_01, subtests
         assert survey_with_stations.station_names == [station_01.id]
 
 
+def test_add_station_extends_aggregates(subtests):
+    """Test that adding stations one at a time matches a full update."""
+
+    def make_station(station_id, lat, lon, start=None, end=None):
+        station = Station(id=station_id)
+        station.location.latitude = lat
+        station.location.longitude = lon
+        if start:
+            station.time_period.start = start
+            station.time_period.end = end
+        return station
+
+    survey = Survey(id="test")
+    survey.add_station(
+        make_station("mt01", 40.0, -120.0, "2023-01-02T00:00:00", "2023-01-04")
+    )
+    survey.add_station(
+        make_station("mt02", 35.0, -115.0, "2023-01-01T00:00:00", "2023-01-03")
+    )
+    survey.add_station(
+        make_station("mt03", 45.0, -118.0, "2023-01-03T00:00:00", "2023-01-06")
+    )
+
+    with subtests.test("bounding box"):
+        assert survey.survey_extent["latitude"] == {"min": 35.0, "max": 45.0}
+        assert survey.survey_extent["longitude"] == {"min": -120.0, "max": -115.0}
+
+    with subtests.test("time period"):
+        assert survey.time_period.start_date == "2023-01-01"
+        assert survey.time_period.end_date == "2023-01-06"
+
+    with subtests.test("station added without update"):
+        survey.add_station(make_station("mt04", 50.0, -117.0), update=False)
+        survey.add_station(make_station("mt05", 41.0, -117.0))
+        assert survey.northwest_corner.latitude == 50.0
+
+    with subtests.test("remove station shrinks bounding box"):
+        survey.remove_station("mt04")
+        assert survey.northwest_corner.latitude == 45.0
+        survey.add_station(make_station("mt06", 36.0, -116.0))
+        assert survey.survey_extent["latitude"] == {"min": 35.0, "max": 45.0}
+
+    with subtests.test("station replaced"):
+        survey.add_station(make_station("mt06", 30.0, -116.0))
+        assert survey.southeast_corner.latitude == 30.0
+
+
+def test_add_station_after_station_changed(subtests):
+    """Test that changes to a station already added are not missed."""
+    survey = Survey(id="test")
+    station_a = Station(id="a")
+    station_a.location.latitude = 10.0
+    survey.add_station(station_a)
+
+    station_a.location.latitude = 40.0
+    station_a.time_period.start = "2020-01-01"
+    station_b = Station(id="b")
+    station_b.location.latitude = 30.0
+    survey.add_station(station_b)
+
+    with subtests.test("bounding box"):
+        assert survey.survey_extent["latitude"] == {"min": 30.0, "max": 40.0}
+
+    with subtests.test("time period"):
+        assert survey.time_period.start_date == "2020-01-01"
+
+    with subtests.test("location replaced"):
+        station_a.location = StationLocation(latitude=50.0)
+        survey.add_station(Station(id="c"))
+        assert survey.northwest_corner.latitude == 50.0
+
+
+def test_add_station_after_run_added(monkeypatch, subtests):
+    """Test that adding a run to a station keeps adding stations incremental."""
+    full_updates = []
+    update_bounding_box = Survey.update_bounding_box
+
+    def count_full_updates(self):
+        full_updates.append(self.id)
+        update_bounding_box(self)
+
+    monkeypatch.setattr(Survey, "update_bounding_box", count_full_updates)
+    survey = Survey(id="test")
+    other_survey = Survey(id="other")
+    station_a = Station(id="a")
+    survey.add_station(station_a)
+    other_survey.add_station(Station(id="a"))
+    full_updates.clear()
+
+    run = Run(id="001")
+    run.time_period.start = "2020-01-01T00:00:00"
+    run.time_period.end = "2020-02-01T00:00:00"
+    station_a.add_run(run)
+    survey.add_station(Station(id="b"))
+    other_survey.add_station(Station(id="b"))
+
+    with subtests.test("no full update"):
+        assert full_updates == []
+
+    with subtests.test("time period"):
+        assert survey.time_period.start_date == "2020-01-01"
+        assert survey.time_period.end_date == "2020-02-01"
+
+    with subtests.test("other survey unchanged"):
+        assert other_survey.time_period.start_is_default()
+
+    with subtests.test("removed station ignored"):
+        survey.remove_station("a")
+        survey.time_period.start_date = "2021-01-01"
+        survey.time_period.end_date = "2021-01-02"
+        station_a.time_period.end = "2022-01-01T00:00:00"
+        survey.add_station(Station(id="c"))
+        assert survey.time_period.end_date == "2021-01-02"
+
+
+@pytest.fixture
+def survey_grid():
+    """Create a survey with a 5 x 5 grid of stations 0.1 degrees apart."""
+    survey = Survey(id="grid")
+    for ii in range(5):
+        for jj in range(5):
+            station = Station(id=f"mt{ii}{jj}")
+            station.location.latitude = 40.0 + ii * 0.1
+            station.location.longitude = -120.0 + jj * 0.1
+            survey.add_station(station)
+    return survey
+
+
+def test_stations_within(survey_grid, subtests):
+    """Test finding stations inside a bounding box."""
+    with subtests.test("tuple"):
+        stations = survey_grid.stations_within((40.05, 40.25, -120.0, -119.85))
+        assert [s.id for s in stations] == ["mt10", "mt11", "mt20", "mt21"]
+
+    with subtests.test("survey extent"):
+        stations = survey_grid.stations_within(survey_grid.survey_extent)
+        assert len(stations) == 25
+
+    with subtests.test("crosses antimeridian"):
+        assert survey_grid.stations_within((39, 41, 170, -119.95)) == [
+            survey_grid.stations[f"mt{ii}0"] for ii in range(5)
+        ]
+
+    with subtests.test("bad bbox"):
+        with pytest.raises(ValueError):
+            survey_grid.stations_within((40, 41, -120))
+
+
+def test_nearest_stations(survey_grid, subtests):
+    """Test finding the stations nearest to a point."""
+    stations, distances = survey_grid.nearest_stations(
+        40.21, -119.79, k=3, return_distance=True
+    )
+
+    with subtests.test("closest first"):
+        ids = [s.id for s in survey_grid.stations]
+        order = np.argsort(survey_grid.spatial_index.distances(40.21, -119.79))
+        assert [s.id for s in stations] == [ids[ii] for ii in order[:3]]
+        assert [s.id for s in stations] == ["mt22", "mt23", "mt21"]
+
+    with subtests.test("distances"):
+        brute = sorted(survey_grid.spatial_index.distances(40.21, -119.79).tolist())[:3]
+        assert distances.tolist() == pytest.approx(brute)
+        assert distances[0] == pytest.approx(1399.2, abs=0.1)
+
+    with subtests.test("k larger than stations"):
+        assert len(survey_grid.nearest_stations(40.0, -120.0, k=100)) == 25
+
+
+def test_stations_within_radius(survey_grid, subtests):
+    """Test finding stations within a great circle distance."""
+    with subtests.test("radius"):
+        stations = survey_grid.stations_within_radius(40.2, -119.8, 12000)
+        assert [s.id for s in stations][0] == "mt22"
+        assert sorted(s.id for s in stations[1:]) == [
+            "mt12",
+            "mt21",
+            "mt23",
+            "mt32",
+        ]
+
+    with subtests.test("station on the radius"):
+        distance = survey_grid.spatial_index.distances(40.2, -119.8)[
+            survey_grid.spatial_index.keys.index("mt12")
+        ]
+        stations = survey_grid.stations_within_radius(40.2, -119.8, distance)
+        assert "mt12" in [s.id for s in stations]
+
+    with subtests.test("index rebuilt after adding a station"):
+        station = Station(id="new")
+        station.location.latitude = 40.2
+        station.location.longitude = -119.8
+        survey_grid.add_station(station)
+        stations = survey_grid.stations_within_radius(40.2, -119.8, 1)
+        assert sorted(s.id for s in stations) == ["mt22", "new"]
+
+    with subtests.test("index rebuilt after removing a station"):
+        survey_grid.remove_station("new")
+        stations = survey_grid.stations_within_radius(40.2, -119.8, 1)
+        assert [s.id for s in stations] == ["mt22"]
+
+
+@pytest.fixture
+def survey_runs():
+    """Create a survey with runs that overlap in time."""
+    survey = Survey(id="runs")
+    for station_id, runs in {
+        "mt01": [("a", 1, "01T00", "01T12"), ("b", 1, "02T00", "02T12")],
+        "mt02": [("a", 1, "01T06", "02T06"), ("b", 256, "01T06", "01T08")],
+        "mt03": [("a", 256, "01T07", "01T10"), ("b", 1, "03T00", "03T12")],
+        "mt04": [("a", 1, "04T00", "04T12")],
+    }.items():
+        station = Station(id=station_id)
+        for run_id, sample_rate, start, end in runs:
+            run = Run(id=f"{station_id}{run_id}", sample_rate=sample_rate)
+            for component in ["ex", "ey", "hx", "hy", "hz"]:
+                run.add_channel(component)
+            run.time_period.start = f"2020-01-{start}:00:00"
+            run.time_period.end = f"2020-01-{end}:00:00"
+            station.add_run(run)
+        survey.add_station(station)
+    survey.add_station(Station(id="empty"))
+    return survey
+
+
+def test_overlapping_runs(survey_runs, subtests):
+    """Test finding runs that overlap a time period."""
+    index = survey_runs.run_interval_index()
+
+    with subtests.test("all runs"):
+        assert len(index) == 7
+
+    with subtests.test("overlap"):
+        runs = index.overlapping_runs(("2020-01-01T11:00:00", "2020-01-02T01:00:00"))
+        assert runs.run.tolist() == ["mt01a", "mt02a", "mt01b"]
+
+    with subtests.test("sample rate"):
+        runs = index.overlapping_runs(
+            ("2020-01-01T00:00:00", "2020-01-05T00:00:00"), sample_rate=256
+        )
+        assert runs.run.tolist() == ["mt02b", "mt03a"]
+
+    with subtests.test("touching runs do not overlap"):
+        runs = index.overlapping_runs(("2020-01-03T12:00:00", "2020-01-04T00:00:00"))
+        assert runs.empty
+
+
+def test_find_simultaneous_runs(survey_runs, subtests):
+    """Test pairing runs of different stations that overlap in time."""
+    index = survey_runs.run_interval_index()
+
+    with subtests.test("all pairs"):
+        pairs = index.find_simultaneous_runs()
+        assert list(zip(pairs.run_01, pairs.run_02)) == [
+            ("mt01a", "mt02a"),
+            ("mt02b", "mt03a"),
+            ("mt02a", "mt01b"),
+        ]
+        assert pairs.duration.tolist() == [6 * 3600, 3600, 6 * 3600]
+        assert str(pairs.start[0]) == "2020-01-01 06:00:00+00:00"
+
+    with subtests.test("brute force"):
+        runs = index.runs
+        expected = set()
+        for first in runs.itertuples():
+            for second in runs.itertuples():
+                if (
+                    first.station < second.station
+                    and first.sample_rate == second.sample_rate
+                    and first.start < second.end
+                    and second.start < first.end
+                ):
+                    expected.add(tuple(sorted([first.run, second.run])))
+        pairs = index.find_simultaneous_runs()
+        assert {
+            tuple(sorted(pair)) for pair in zip(pairs.run_01, pairs.run_02)
+        } == expected
+
+    with subtests.test("sample rate"):
+        pairs = index.find_simultaneous_runs(sample_rate=256)
+        assert pairs.run_01.tolist() == ["mt02b"]
+
+    with subtests.test("min overlap"):
+        pairs = index.find_simultaneous_runs(min_overlap=2 * 3600)
+        assert pairs.run_01.tolist() == ["mt01a", "mt02a"]
+
+    with subtests.test("no pairs"):
+        pairs = index.find_simultaneous_runs(sample_rate=3)
+        assert pairs.empty
+        assert pairs.columns.tolist() == PAIR_COLUMNS
+
+
+def test_run_index_dataset_dataframe(survey_runs, subtests):
+    """Test that simultaneous runs make an aurora dataset dataframe."""
+    df = survey_runs.run_interval_index().to_dataset_dataframe("mt01", "mt02")
+
+    with subtests.test("rows"):
+        assert df.run.tolist() == ["mt01a", "mt02a", "mt01b", "mt02a"]
+        assert df.remote.tolist() == [False, True, False, True]
+
+    with subtests.test("channels"):
+        assert df.input_channels[0] == ["hx", "hy"]
+        assert df.output_channels[0] == ["ex", "ey", "hz"]
+
+    with subtests.test("aurora stations"):
+        stations = Stations()
+        stations.from_dataset_dataframe(df)
+        assert stations.local.id == "mt01"
+        assert [rr.id for rr in stations.remote] == ["mt02"]
+        assert len(stations.remote[0].runs[0].time_periods) == 2
+
+
+def test_add_filter(subtests):
+    """Test that filters with the same content are only added once."""
+    survey = Survey(id="filters")
+    sensor = PoleZeroFilter(
+        name="sensor_a",
+        units_in="nT",
+        units_out="V",
+        poles=[-1.0 + 2.0j, -1.0 - 2.0j],
+        normalization_factor=5.0,
+    )
+    survey.add_filter(sensor)
+
+    repeat = PoleZeroFilter(
+        name="sensor_a_epoch_2",
+        comments="second epoch",
+        units_in="nT",
+        units_out="V",
+        poles=[-1.0 - 2.0j, -1.0 + 2.0000000001j],
+        normalization_factor=5.0000000001,
+    )
+    with subtests.test("duplicate found"):
+        assert survey.find_filter(repeat) is sensor
+        assert survey.add_filter(repeat) is sensor
+        assert survey.filter_names == ["sensor_a"]
+
+    gain = CoefficientFilter(name="gain", units_in="V", units_out="count", gain=10)
+    with subtests.test("new filter added"):
+        assert survey.find_filter(gain) is None
+        assert survey.add_filter(gain) is gain
+        assert survey.filter_names == ["sensor_a", "gain"]
+
+    with subtests.test("registry follows filters"):
+        survey.filters.remove("gain")
+        assert survey.find_filter(gain) is None
+        assert len(survey.filter_registry) == 1
+
+
 def test_in_out_dict(survey_object, survey_dict, subtests):
     """Test conversion from dict to Survey object and back to dict."""
     with subtests.test("dict round trip"):
@@ -12,6 +12,7 @@ import numpy as np
 # =============================================================================
 import pytest
 
+from mt_metadata import TF_EDI_METRONIX
 from mt_metadata.transfer_functions.io.edi import EDI
 from mt_metadata.transfer_functions.io.edi.metadata import EMeasurement, HMeasurement
 
@@ -164,6 +165,96 @@ class TestAssertDescendingFrequency:
         ), f"{array_type} array not properly reversed"
 
 
+# =============================================================================
+# Data Block Tests
+# =============================================================================
+class TestReadDataBlocks:
+    """Test parsing of the impedance and tipper data blocks."""
+
+    @pytest.fixture(scope="class")
+    def edi_lines(self):
+        with open(TF_EDI_METRONIX, "r") as fid:
+            return fid.read().split("\n")
+
+    def test_parse_data_block(self):
+        """Values span lines, empty and non-numeric values are set to 0."""
+        edi = EDI()
+        values = edi._parse_data_block(["1.0 2.5e+00 ******", "1.0E+32 abc", "-3"])
+        assert np.array_equal(values, np.array([1.0, 2.5, 0.0, 0.0, 0.0, -3.0]))
+
+    def test_parse_data_block_empty(self):
+        edi = EDI()
+        assert edi._parse_data_block([]).size == 0
+
+    def test_metadata_lines_stop_at_data(self, edi_lines):
+        """Only lines up to the first data block are read from the file."""
+        with open(TF_EDI_METRONIX, "r") as fid:
+            metadata_lines = EDI._read_metadata_lines(fid)
+            remaining = fid.readlines()
+
+        assert metadata_lines[-1].strip().startswith(">FREQ")
+        assert len(metadata_lines) + len(remaining) == len(edi_lines) - 1
+
+    def test_read_sentinel_values(self, tmp_path, edi_lines):
+        """Null values in the file are read as 0."""
+        lines = list(edi_lines)
+        index = [ii for ii, line in enumerate(lines) if line.startswith(">ZXXR")][0]
+        values = lines[index + 1].split()
+        values[0] = "******"
+        lines[index + 1] = " ".join(values)
+        fn = tmp_path.joinpath("sentinel.edi")
+        fn.write_text("\n".join(lines))
+
+        edi = EDI(fn=fn)
+        original = EDI(fn=TF_EDI_METRONIX)
+        assert edi.z[0, 0, 0].real == 0
+        assert np.array_equal(edi.z[1:], original.z[1:])
+        assert np.array_equal(edi.t, original.t)
+        assert np.array_equal(edi.rotation_angle, original.rotation_angle)
+
+
+
+# =============================================================================
+# Write Data Block Tests
+# =============================================================================
+class TestWriteDataBlock:
+    """Test writing data blocks against formatting one value at a time."""
+
+    @staticmethod
+    def value_lines(edi, values, data_key):
+        """Format one value at a time like the original writer."""
+        lines = []
+        for d_index, d_comp in enumerate(values, 1):
+            if d_comp == 0.0 and data_key.lower() not in ["zrot", "trot"]:
+                d_comp = edi.Header.empty
+            num_str = "{0:{1}}".format(d_comp, edi._num_format)
+            if d_index % edi._block_len == 0:
+                num_str += "\n"
+            if d_index == values.size:
+                num_str += "\n"
+            lines.append(num_str)
+        return "".join(lines)
+
+    @pytest.mark.parametrize("size", [0, 1, 5, 6, 7, 12, 31])
+    @pytest.mark.parametrize("data_key", ["freq", "zrot", "zxyr", "tximag"])
+    def test_matches_values(self, size, data_key):
+        edi = EDI()
+        values = np.linspace(-2.5e3, 1.2e-4, size)
+        if size > 2:
+            values[2] = 0.0
+        block_lines = edi._write_data_block(values, data_key)
+        assert block_lines[0].startswith(f">{data_key.upper()}")
+        assert "".join(block_lines[1:]) == self.value_lines(edi, values, data_key)
+
+    def test_custom_format(self):
+        """Formats without a printf equivalent are written value by value."""
+        edi = EDI()
+        edi._num_format = ">+15,.2f"
+        values = np.array([1234567.891, -0.5, 0.0, 12.0])
+        block_lines = edi._write_data_block(values, "freq")
+        assert "".join(block_lines[1:]) == self.value_lines(edi, values, "freq")
+
+
 # =============================================================================
 # run
 # =============================================================================
@@ -336,6 +336,70 @@ class TestFromTF:
         assert result == expected, f"{method} returned {result}, expected {expected}"
 
 
+# =============================================================================
+# Batched spectra conversion
+# =============================================================================
+class TestSpectraConversion:
+    """Test the batched conversion of spectra to transfer functions."""
+
+    @staticmethod
+    def make_spectra_lines(comp_list, n_frequencies=10, seed=0):
+        rng = np.random.default_rng(seed)
+        n_channels = len(comp_list)
+        lines = []
+        for frequency in np.logspace(-2, 2, n_frequencies):
+            lines.append(
+                f">SPECTRA  FREQ={frequency:.6e} ROTSPEC=0 AVGT=100 "
+                f"// {n_channels ** 2}\n"
+            )
+            spectra = rng.normal(size=(n_channels, n_channels))
+            spectra[np.diag_indices(n_channels)] = np.abs(spectra.diagonal()) + 1
+            lines.append(" ".join(f"{v:.6e}" for v in spectra.ravel()) + "\n")
+        return lines
+
+    def test_cross_powers_hermitian(self, edi_spectra):
+        """Cross powers are Hermitian with the real part in the lower triangle."""
+        spectra = np.arange(1, 17, dtype=float).reshape((1, 4, 4))
+        s_arr = edi_spectra._spectra_to_cross_powers(spectra)
+        assert np.allclose(s_arr[0], s_arr[0].conj().T)
+        assert s_arr[0, 1, 0] == complex(spectra[0, 1, 0], spectra[0, 0, 1])
+        assert s_arr[0, 0, 1] == complex(spectra[0, 1, 0], -spectra[0, 0, 1])
+        assert np.array_equal(s_arr[0].diagonal(), spectra[0].diagonal())
+
+    def test_cross_powers_empty(self, edi_spectra):
+        """Zeros and empty values are set to NaN."""
+        spectra = np.ones((1, 2, 2))
+        spectra[0, 0, 0] = 0
+        spectra[0, 1, 1] = edi_spectra.Header.empty
+        s_arr = edi_spectra._spectra_to_cross_powers(spectra)
+        assert np.isnan(s_arr[0, 0, 0])
+        assert np.isnan(s_arr[0, 1, 1])
+        assert not np.isnan(s_arr[0, 0, 1])
+
+    def test_matches_per_frequency(self):
+        """Batched results match solving each frequency on its own."""
+        comp_list = ["hx", "hy", "hz", "ex", "ey", "rhx", "rhy"]
+        lines = self.make_spectra_lines(comp_list)
+        edi = EDI()
+        edi._read_spectra(lines, comp_list=comp_list)
+
+        for kk in range(edi.frequency.size):
+            single = EDI()
+            single._read_spectra(lines[2 * kk : 2 * kk + 2], comp_list=comp_list)
+            index = edi.frequency.size - 1 - kk
+            assert np.array_equal(single.tf[0], edi.tf[index])
+            assert np.array_equal(single.tf_err[0], edi.tf_err[index])
+
+    def test_tipper_only(self):
+        """Only the tipper is filled without electric channels."""
+        lines = self.make_spectra_lines(["hx", "hy", "hz"])
+        edi = EDI()
+        edi._read_spectra(lines, comp_list=["hx", "hy", "hz"])
+        assert edi.tf.shape == (10, 1, 2)
+        assert (edi.z == 0).all()
+        assert np.array_equal(edi.t, edi.tf)
+
+
 # =============================================================================
 # run
 # =============================================================================
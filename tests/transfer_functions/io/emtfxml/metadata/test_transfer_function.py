@@ -751,5 +751,104 @@ class TestTransferFunctionIntegration:
         assert root.tag == "Data"
 
 
+
+class TestTransferFunctionReadElement:
+    """Test reading <Data> elements directly against the dictionary path."""
+
+    @staticmethod
+    def read_from_dict(fn):
+        from mt_metadata.base import helpers
+        from mt_metadata.transfer_functions.io.emtfxml.metadata import (
+            helpers as emtf_helpers,
+        )
+
+        root = et.fromstring(fn.read_text().replace("&", "and"))
+        root_dict = helpers.element_to_dict(root)
+        root_dict = root_dict[list(root_dict.keys())[0]]
+        root_dict = emtf_helpers._convert_keys_to_lower_case(root_dict)
+        tf = TransferFunction()
+        tf.read_dict(root_dict)
+        return tf
+
+    @pytest.fixture(
+        scope="class",
+        params=["TF_XML", "TF_POOR_XML", "TF_XML_WITH_DERIVED_QUANTITIES"],
+    )
+    def xml_fn(self, request):
+        import mt_metadata
+
+        return getattr(mt_metadata, request.param)
+
+    def test_read_element_matches_dict(self, xml_fn, subtests):
+        root = et.fromstring(xml_fn.read_text().replace("&", "and"))
+        tf = TransferFunction()
+        tf.read_element(root.find("Data"))
+        expected = self.read_from_dict(xml_fn)
+
+        with subtests.test(key="period"):
+            assert np.array_equal(tf.period, expected.period)
+        for key, value in expected.array_dict.items():
+            with subtests.test(key=key):
+                assert np.array_equal(tf.array_dict[key], value)
+
+    def test_read_periods_generator(self, xml_fn):
+        """Periods can be streamed and cleared as they are read."""
+        root = et.fromstring(xml_fn.read_text().replace("&", "and"))
+        data_element = root.find("Data")
+        n_periods = len(data_element)
+
+        def iter_periods():
+            for period_element in list(data_element):
+                yield period_element
+                period_element.clear()
+
+        tf = TransferFunction()
+        tf.read_periods(iter_periods())
+        expected = self.read_from_dict(xml_fn)
+        assert tf.n_periods == n_periods
+        assert np.array_equal(tf.z, expected.z)
+        assert np.array_equal(tf.t_var, expected.t_var)
+
+    def test_parse_values_mixed(self):
+        values = TransferFunction._parse_values(["1.0 0.5", "2.0"], "unknown")
+        assert np.array_equal(values, np.array([1.0 + 0.5j, 2.0]))
+
+
+class TestTransferFunctionFormatArrays:
+    """Test formatting all periods at once against one period at a time."""
+
+    @pytest.fixture(scope="class")
+    def tf_with_data(self):
+        tf = TransferFunction()
+        tf.initialize_arrays(3)
+        tf.period[:] = [0.01, 0.1, 1.0]
+        rng = np.random.default_rng(0)
+        tf.z[:] = rng.normal(size=(3, 2, 2)) + 1j * rng.normal(size=(3, 2, 2))
+        tf.z_var[:] = rng.normal(size=(3, 2, 2)) ** 2
+        tf.z[1, 0, 1] = np.nan
+        tf.t[0, 0, 0] = -1.5e-7 + 2.0e3j
+        return tf
+
+    def test_to_xml_matches_write_block(self, tf_with_data):
+        root = tf_with_data.to_xml()
+        expected = et.Element("Data", {"count": "3"})
+        for index in range(3):
+            tf_with_data.write_block(expected, index)
+        assert et.tostring(root) == et.tostring(expected)
+
+        z = np.nan_to_num(tf_with_data.z)
+        z[z == 0] = 1e32 + 1e32j
+        for index, period_element in enumerate(root.findall("Period")):
+            texts = [value.text for value in period_element.find("Z")]
+            assert texts == [f"{v.real:.6e} {v.imag:.6e}" for v in z[index].ravel()]
+
+    def test_empty_value(self, tf_with_data):
+        root = tf_with_data.to_xml()
+        values = root.findall("Period")[1].find("Z").findall("value")
+        assert values[1].text == "1.000000e+32 1.000000e+32"
+        t_value = root.findall("Period")[0].find("T").findall("value")[0]
+        assert t_value.text == "-1.500000e-07 2.000000e+03"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -972,3 +972,116 @@ class TestZMMTransferFunctionValues:
                 if zmm_obj.sigma_s is not None:
                     assert np.iscomplexobj(zmm_obj.sigma_s)
                     assert np.all(np.isfinite(zmm_obj.sigma_s))
+
+
+class TestZMMReadDataBlocks:
+    """Test reading all period blocks in bulk against one block at a time."""
+
+    @staticmethod
+    def read_blocks(fn, bulk=True):
+        zmm_obj = zmm.ZMM()
+        zmm_obj.fn = fn
+        zmm_obj.read_header()
+        zmm_obj.initialize_arrays()
+        if bulk:
+            zmm_obj._read_data_blocks()
+        else:
+            zmm_obj._read_period_blocks()
+        return zmm_obj
+
+    @pytest.fixture(scope="class", params=["TF_ZMM", "TF_ZSS_TIPPER"])
+    def tf_fn(self, request):
+        import mt_metadata
+
+        return getattr(mt_metadata, request.param)
+
+    def test_bulk_matches_blocks(self, tf_fn, subtests):
+        """Bulk reading is bit identical to reading one block at a time."""
+        bulk = self.read_blocks(tf_fn)
+        blocks = self.read_blocks(tf_fn, bulk=False)
+        for attr in ["periods", "transfer_functions", "sigma_s", "sigma_e"]:
+            with subtests.test(attr=attr):
+                assert np.array_equal(getattr(bulk, attr), getattr(blocks, attr))
+        with subtests.test(attr="decimation_dict"):
+            assert bulk.decimation_dict == blocks.decimation_dict
+
+    def test_unknown_label_falls_back(self, tmp_path):
+        """Files with unexpected section labels are read block by block."""
+        from mt_metadata import TF_ZMM
+
+        fn = tmp_path.joinpath("label.zmm")
+        fn.write_text(
+            pathlib.Path(TF_ZMM)
+            .read_text()
+            .replace("Residual Covariance", "Residual Covaraince")
+        )
+        bulk = self.read_blocks(fn)
+        blocks = self.read_blocks(TF_ZMM, bulk=False)
+        assert np.array_equal(bulk.sigma_e, blocks.sigma_e)
+        assert np.array_equal(bulk.transfer_functions, blocks.transfer_functions)
+
+
+class TestZMMWriteDataBlocks:
+    """Test writing all period blocks at once against one element at a time."""
+
+    @staticmethod
+    def element_rows(zmm_obj, period, name, rows, columns, lower=False):
+        """Format rows one element at a time like the original writer."""
+        a = zmm_obj.dataset.sel(period=period)
+        lines = []
+        for ii, c_out in enumerate(rows):
+            line = ""
+            for c_in in columns[: ii + 1] if lower else columns:
+                element = getattr(a, name).loc[
+                    dict(
+                        output=zmm_obj.channel_nomenclature[c_out],
+                        input=zmm_obj.channel_nomenclature[c_in],
+                    )
+                ].data
+                line += f"{element.real:>12.4E}{element.imag:>12.4E}"
+            lines.append(line)
+        return lines
+
+    @pytest.fixture(scope="class", params=["TF_ZMM", "TF_ZSS_TIPPER"])
+    def zmm_obj(self, request):
+        import mt_metadata
+
+        return zmm.ZMM(getattr(mt_metadata, request.param))
+
+    def test_write_matches_elements(self, zmm_obj, tmp_path):
+        """Each period block is identical to writing one element at a time."""
+        fn = zmm_obj.fn
+        zmm_obj.write(tmp_path.joinpath("write.zmm"))
+        zmm_obj.fn = fn
+        lines = tmp_path.joinpath("write.zmm").read_text().split("\n")
+        index = lines.index(" Transfer Functions")
+        for period in zmm_obj.dataset.period.data:
+            expected = [" Transfer Functions"]
+            expected += self.element_rows(
+                zmm_obj,
+                period,
+                "transfer_function",
+                zmm_obj.output_channels,
+                zmm_obj.input_channels,
+            )
+            expected += [" Inverse Coherent Signal Power Matrix"]
+            expected += self.element_rows(
+                zmm_obj,
+                period,
+                "inverse_signal_power",
+                zmm_obj.input_channels,
+                zmm_obj.input_channels,
+                lower=True,
+            )
+            expected += [" Residual Covariance"]
+            expected += self.element_rows(
+                zmm_obj,
+                period,
+                "residual_covariance",
+                zmm_obj.output_channels,
+                zmm_obj.output_channels,
+                lower=True,
+            )
+            assert lines[index : index + len(expected)] == expected
+            index += len(expected) + 2
+        assert index - 2 == len(lines)
@@ -8,10 +8,24 @@ Created on Thu Sep 28 17:11:57 2023
 # =============================================================================
 # Imports
 # =============================================================================
+import io
+from xml.dom import minidom
+from xml.etree import cElementTree as et
+
 import pytest
 from pydantic import Field
 
+from mt_metadata import (
+    MT_EXPERIMENT_MULTIPLE_RUNS,
+    MT_EXPERIMENT_SINGLE_STATION,
+    TF_XML,
+    TF_XML_COMPLETE_REMOTE_INFO,
+    TF_XML_WITH_DERIVED_QUANTITIES,
+)
 from mt_metadata.base import helpers
+from mt_metadata.common.enumerations import ChannelOrientationEnum
+from mt_metadata.transfer_functions.io.emtfxml import EMTFXML
+
 
 # =============================================================================
 
@@ -294,6 +308,91 @@ class TestWriteBlock:
                     assert width_line in result
 
 
+class TestElementToString:
+    """Test the indented xml writer against a minidom round trip."""
+
+    @staticmethod
+    def minidom_string(element):
+        return (
+            minidom.parseString(et.tostring(element).decode())
+            .toprettyxml(indent="    ", encoding="UTF-8")
+            .decode()
+        )
+
+    @pytest.fixture
+    def element(self):
+        root = et.Element("Root", {"name": 'a "b" <c> & d', "units": "m"})
+        child = et.SubElement(root, "Child")
+        child.text = "1 < 2 & 3"
+        et.SubElement(child, "Empty")
+        et.SubElement(root, "Blank").text = ""
+        et.SubElement(root, "Space").text = "   "
+        mixed = et.SubElement(root, "Mixed")
+        mixed.text = "lead\r\n"
+        inner = et.SubElement(mixed, "Inner", {"author": "ü"})
+        inner.text = "value"
+        inner.tail = " tail "
+        root.append(et.Comment(" note "))
+        return root
+
+    def test_matches_minidom(self, element):
+        assert helpers.element_to_string(element) == self.minidom_string(element)
+
+    def test_namespace_matches_minidom(self):
+        root = et.Element("{http://example.com}Root")
+        et.SubElement(root, "{http://example.com}Child").text = "x"
+        assert helpers.element_to_string(root) == self.minidom_string(root)
+
+    def test_write_element(self, element):
+        fid = io.StringIO()
+        helpers.write_element(element, fid)
+        assert fid.getvalue() == self.minidom_string(element)
+
+    def test_enumeration_matches_minidom(self, subtests):
+        root = et.Element("Root")
+        root.text = ChannelOrientationEnum.station
+        child = et.SubElement(root, "Child")
+        child.tail = ChannelOrientationEnum.site_layout
+        with subtests.test("text matches minidom"):
+            assert helpers.element_to_string(root) == self.minidom_string(root)
+
+        # ElementTree formats attributes, which gives the enumeration name
+        root.set("layout", ChannelOrientationEnum.orthogonal)
+        with subtests.test("attribute value"):
+            result = helpers.element_to_string(root)
+            assert '<Root layout="orthogonal">' in result
+            assert "ChannelOrientationEnum" not in result
+
+    def test_attribute_white_space_matches_minidom(self):
+        root = et.Element("Root", {"name": "a\nb\tc\rd\r\ne 'f'"})
+        root.text = "a\rb ]]> 'c'"
+        assert helpers.element_to_string(root) == self.minidom_string(root)
+
+    @pytest.mark.parametrize(
+        "fn", [MT_EXPERIMENT_SINGLE_STATION, MT_EXPERIMENT_MULTIPLE_RUNS]
+    )
+    def test_mt_xml_matches_minidom(self, fn):
+        element = et.parse(fn).getroot()
+        assert helpers.element_to_string(element) == self.minidom_string(element)
+
+    @pytest.mark.parametrize(
+        "fn", [TF_XML, TF_XML_COMPLETE_REMOTE_INFO, TF_XML_WITH_DERIVED_QUANTITIES]
+    )
+    def test_emtf_xml_matches_minidom(self, fn, tmp_path, monkeypatch):
+        elements = []
+        write_element = helpers.write_element
+
+        def record_element(element, fid):
+            elements.append(element)
+            write_element(element, fid)
+
+        monkeypatch.setattr(helpers, "write_element", record_element)
+        out_fn = tmp_path.joinpath(fn.name)
+        EMTFXML(fn).write(out_fn)
+        assert len(elements) == 1
+        assert out_fn.read_bytes() == self.minidom_string(elements[0]).encode()
+
+
 # =============================================================================
 #
 # =============================================================================
@@ -295,6 +295,82 @@ class TestListDictSlice(unittest.TestCase):
         self.assertRaises(TypeError, self.ld.update, ("x"))
 
 
+class TestListDictLazy(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.ld = ListDict()
+        self.ld["a"] = 1
+        self.ld.set_lazy("b", self.load_b)
+
+    def load_b(self):
+        self.calls.append("b")
+        return 2
+
+    def test_keys_do_not_load(self):
+        self.assertEqual(self.ld.keys(), ["a", "b"])
+        self.assertEqual(len(self.ld), 2)
+        self.assertFalse(self.ld.is_loaded("b"))
+        self.assertEqual(self.calls, [])
+
+    def test_load_once(self):
+        self.assertEqual(self.ld["b"], 2)
+        self.assertEqual(self.ld[1], 2)
+        self.assertTrue(self.ld.is_loaded("b"))
+        self.assertEqual(self.calls, ["b"])
+
+    def test_values_load(self):
+        self.assertEqual(self.ld.values(), [1, 2])
+        self.assertEqual(list(self.ld), [1, 2])
+        self.assertEqual(self.calls, ["b"])
+
+
+class TestListDictPositions(unittest.TestCase):
+    def setUp(self):
+        self.ld = ListDict([(key, ii) for ii, key in enumerate("dbca")])
+
+    def assert_positions(self, keys):
+        with self.subTest("keys"):
+            self.assertEqual(self.ld.keys(), keys)
+        for ii, key in enumerate(keys):
+            with self.subTest(key=key):
+                self.assertEqual(self.ld.index(key), ii)
+                self.assertEqual(self.ld._get_key_from_index(ii), key)
+
+    def test_index(self):
+        self.assert_positions(["d", "b", "c", "a"])
+
+    def test_index_fail(self):
+        self.assertRaises(KeyError, self.ld.index, "z")
+
+    def test_append(self):
+        self.ld.index("d")
+        self.ld["e"] = 4
+        self.ld["b"] = 5
+        self.assert_positions(["d", "b", "c", "a", "e"])
+
+    def test_remove(self):
+        self.ld.index("d")
+        self.ld.remove("b")
+        self.assert_positions(["d", "c", "a"])
+
+    def test_pop(self):
+        self.ld.index("d")
+        self.assertEqual(self.ld.pop("b"), {"b": 1})
+        self.assert_positions(["d", "c", "a"])
+
+    def test_sort(self):
+        self.ld.index("d")
+        self.ld.sort()
+        self.assert_positions(["a", "b", "c", "d"])
+
+    def test_slice(self):
+        self.assertEqual(self.ld[1:3].keys(), ["b", "c"])
+        self.assertEqual(self.ld["b":"a"].keys(), ["b", "c"])
+
+    def test_negative_index_fail(self):
+        self.assertRaises(KeyError, self.ld.__getitem__, -1)
+
+
 # =============================================================================
 # Run test
 # =============================================================================
@@ -381,3 +381,58 @@ class TestCaseInsensitiveMatching:
                 assert (
                     unit1.name != unit2.name
                 ), f"Prefixes {prefix1} and {prefix2} should not match the same unit"
+
+
+class TestUnitIndex:
+    """Test the hash index and memo cache used for unit lookups."""
+
+    @pytest.fixture
+    def lookup_values(self):
+        """Every name and symbol in UNITS_DF in several cases."""
+        values = set()
+        for column in ["name", "symbol"]:
+            for value in UNITS_DF[column]:
+                values.update([value, value.lower(), value.upper()])
+        return sorted(values)
+
+    @staticmethod
+    def scan_units_df(value):
+        """Reference lookup scanning the DataFrame."""
+        unit_row = UNITS_DF[
+            (UNITS_DF["name"].str.lower() == value.lower())
+            | (UNITS_DF["symbol"] == value)
+        ]
+        if unit_row.empty and len(value) == 1:
+            unit_row = UNITS_DF[UNITS_DF["symbol"].str.lower() == value.lower()]
+        if unit_row.empty:
+            return None
+        return unit_row.iloc[0].to_dict()
+
+    def test_index_matches_dataframe_scan(self, subtests, lookup_values):
+        """Indexed lookup returns the same row as scanning UNITS_DF."""
+        for value in lookup_values:
+            with subtests.test(value=value):
+                expected = self.scan_units_df(value)
+                if expected is None:
+                    with pytest.raises(KeyError):
+                        get_unit_from_df(value, allow_none=False)
+                else:
+                    assert get_unit_from_df(value).to_dict() == expected
+
+    def test_compound_unit_not_shared(self):
+        """Memoized compound units return independent Unit objects."""
+        unit_01 = get_unit_object("mV/km")
+        unit_01.name = "changed"
+        unit_02 = get_unit_object("mV/km")
+        assert unit_02.name == "milliVolt per kilometer"
+        assert unit_01 is not unit_02
+
+    def test_compound_unit_unknown_component(self, subtests):
+        """Unknown components are not cached and still raise."""
+        with subtests.test("allow_none=False raises"):
+            with pytest.raises(KeyError):
+                get_unit_object("mV/furlong", allow_none=False)
+
+        with subtests.test("allow_none=True unknown"):
+            unit = get_unit_object("mV/furlong")
+            assert unit.name == "milliVolt per unknown"